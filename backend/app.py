@@ -4,58 +4,107 @@ Uses AssemblyAI for transcription and Anthropic Claude for AI features
 Python-based audio capture with chunked processing
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, Response, stream_with_context
 from flask_cors import CORS
 import os
 import json
+import time
+import queue
 from datetime import datetime
-import anthropic
 import assemblyai as aai
 from dotenv import load_dotenv
 import threading
-from audio_capture import get_audio_service
+from typing import Optional, Callable, List
+from audio_capture import get_capture_manager, AudioCaptureService
+from meeting_store import get_meeting_store
+from transcription_scheduler import TranscriptionScheduler
+from audio_dsp import remap_time, timeline_time
+from audio_encoders import recover_partial
+from meeting_events import get_meeting_events
+from streaming_transcription import create_streaming_transcriber
+from meeting_analyzer import MeetingAnalyzer
+from result_cache import ResultCache, content_key, file_digest
+from providers import create_transcription_provider, create_llm_provider, fault_injection_from_env
+from metrics import get_metrics, get_chunk_tracer
+from github_client import GitHubClient
+from background_jobs import JobRunner, JOB_STATES
 
 load_dotenv()
 
 app = Flask(__name__)
-CORS(app)
+CORS(app, expose_headers=['ETag', 'Location'])
 
-# Storage (using JSON files as simple database)
+# Storage (SQLite database in data/, legacy JSON files are migrated on startup)
 DATA_DIR = 'data'
 os.makedirs(DATA_DIR, exist_ok=True)
 
 # Global clients (will be initialized with API keys from frontend)
-anthropic_client = None
 aai_client = None
 
-# Audio capture service
-audio_service = get_audio_service()
+# Transcription and analysis backends ('fake' runs offline, see providers.py)
+transcription_provider = create_transcription_provider(
+    os.getenv('TRANSCRIPTION_PROVIDER', 'assemblyai'), **fault_injection_from_env()
+)
+llm_provider = create_llm_provider(
+    os.getenv('LLM_PROVIDER', 'anthropic'), **fault_injection_from_env()
+)
+
+# Audio capture sessions, one per recording meeting
+capture_manager = get_capture_manager()
+capture_manager.max_sessions = int(os.getenv('CAPTURE_MAX_SESSIONS', 8))
+capture_manager.session_options['flush_seconds'] = float(os.getenv('CHUNK_FLUSH_SECONDS', 10))
+
+# Meeting storage
+meeting_store = get_meeting_store()
+meeting_store.migrate_json_files(DATA_DIR)
+
+# GitHub issue creation; the issue mapping in the store makes retries safe
+github_client = GitHubClient(
+    os.getenv('GITHUB_API_URL', 'https://api.github.com'),
+    mapping=meeting_store,
+    max_connections=int(os.getenv('GITHUB_MAX_CONNECTIONS', 4))
+)
+
+# Incremental meeting updates for push clients
+meeting_events = get_meeting_events()
+
+# Transcription and analysis results, keyed by their inputs
+result_cache = ResultCache(
+    os.path.join(DATA_DIR, 'cache.db'),
+    max_bytes=int(os.getenv('RESULT_CACHE_MAX_MB', 256)) * 1024 * 1024,
+    max_entries=int(os.getenv('RESULT_CACHE_MAX_ENTRIES', 10000)),
+    touch_seconds=float(os.getenv('RESULT_CACHE_TOUCH_SECONDS', 60))
+)
+
+# Pipeline metrics (served at /metrics) and optional per-chunk traces in data/traces
+metrics = get_metrics()
+chunk_tracer = get_chunk_tracer()
+chunk_tracer.trace_dir = os.path.join(DATA_DIR, 'traces')
+chunk_tracer.enabled = os.getenv('CHUNK_TRACE') == '1'
+
+PROVIDER_SECONDS = metrics.histogram(
+    'fomo_provider_seconds', 'Time spent in provider calls (cache misses only), by provider and operation')
+CACHE_LOOKUPS = metrics.counter(
+    'fomo_result_cache_lookups_total', 'Result cache lookups by namespace and result')
+
+# Transcription options; part of the cache keys, so changing them invalidates results
+TRANSCRIPTION_OPTIONS = {
+    'speaker_labels': True,
+    'language_detection': True
+}
+# Chunks with microphone and system audio on separate channels: speakers by channel
+MULTICHANNEL_TRANSCRIPTION_OPTIONS = {
+    'multichannel': True,
+    'language_detection': True
+}
 
 def save_meeting(meeting_data):
-    """Save meeting to JSON file"""
-    meeting_id = meeting_data['id']
-    filepath = os.path.join(DATA_DIR, f'meeting_{meeting_id}.json')
-    with open(filepath, 'w') as f:
-        json.dump(meeting_data, f, indent=2)
-    return meeting_data
+    """Save meeting to the database"""
+    return meeting_store.save_meeting(meeting_data)
 
 def load_meeting(meeting_id):
-    """Load meeting from JSON file"""
-    filepath = os.path.join(DATA_DIR, f'meeting_{meeting_id}.json')
-    if os.path.exists(filepath):
-        with open(filepath, 'r') as f:
-            return json.load(f)
-    return None
-
-def list_meetings():
-    """List all meetings"""
-    meetings = []
-    for filename in os.listdir(DATA_DIR):
-        if filename.startswith('meeting_') and filename.endswith('.json'):
-            filepath = os.path.join(DATA_DIR, filename)
-            with open(filepath, 'r') as f:
-                meetings.append(json.load(f))
-    return sorted(meetings, key=lambda x: x['startTime'], reverse=True)
+    """Load meeting from the database"""
+    return meeting_store.load_meeting(meeting_id)
 
 
 # ============ API Routes ============
@@ -67,16 +116,30 @@ def health_check():
         'status': 'healthy',
         'version': '1.0.0',
         'services': {
-            'assemblyai': aai_client is not None,
-            'anthropic': anthropic_client is not None
-        }
+            'assemblyai': transcription_provider.configured,
+            'anthropic': llm_provider.configured
+        },
+        'providers': {
+            'transcription': transcription_provider.name,
+            'llm': llm_provider.name
+        },
+        'cache': result_cache.get_status(),
+        'chunks': meeting_store.get_chunk_journal_status(),
+        'github': github_client.get_status(),
+        'jobs': job_runner.get_status()
     })
 
 
+@app.route('/metrics', methods=['GET'])
+def get_pipeline_metrics():
+    """Pipeline metrics in the Prometheus text format"""
+    return Response(metrics.render(), mimetype='text/plain; version=0.0.4')
+
+
 @app.route('/api/config', methods=['POST'])
 def set_config():
     """Set API keys from frontend"""
-    global anthropic_client, aai_client
+    global aai_client
 
     data = request.json
     assemblyai_key = data.get('assemblyai_key')
@@ -85,35 +148,173 @@ def set_config():
     if assemblyai_key:
         aai.settings.api_key = assemblyai_key
         aai_client = aai
+        transcription_provider.configure(assemblyai_key)
+        start_chunk_recovery()
 
     if anthropic_key:
-        anthropic_client = anthropic.Anthropic(api_key=anthropic_key)
+        llm_provider.configure(anthropic_key)
 
     return jsonify({'success': True, 'message': 'API keys configured'})
 
 
 @app.route('/api/meetings', methods=['GET'])
 def get_meetings():
-    """Get all meetings"""
+    """
+    List meeting summaries (no transcripts), newest first
+
+    Query params:
+        limit: Page size (default 50, max 200)
+        after: Cursor returned as nextCursor by the previous page
+        fields: Comma-separated subset of summary fields
+    """
     try:
-        meetings = list_meetings()
-        return jsonify({'success': True, 'data': meetings})
+        limit = min(max(request.args.get('limit', 50, type=int), 1), 200)
+        after = request.args.get('after')
+        fields = request.args.get('fields')
+        fields = [f.strip() for f in fields.split(',') if f.strip()] if fields else None
+
+        summaries, next_cursor = meeting_store.list_meeting_summaries(
+            limit=limit, after=after, fields=fields
+        )
+        return jsonify({'success': True, 'data': summaries, 'nextCursor': next_cursor})
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
 @app.route('/api/meetings/<meeting_id>', methods=['GET'])
 def get_meeting(meeting_id):
-    """Get a specific meeting"""
+    """
+    Get a specific meeting
+
+    Supports conditional requests: the ETag is the meeting version, and a
+    matching If-None-Match returns 304 without loading the meeting.
+
+    Query params:
+        sinceSegment: Only return transcript segments with index >= N
+            (segmentCount in the response gives the total)
+    """
     try:
-        meeting = load_meeting(meeting_id)
+        version = meeting_store.get_meeting_version(meeting_id)
+        if version is None:
+            return jsonify({'success': False, 'error': 'Meeting not found'}), 404
+
+        if request.if_none_match.contains_weak(str(version)):
+            return Response(status=304, headers={'ETag': f'"{version}"'})
+
+        since_segment = max(request.args.get('sinceSegment', 0, type=int), 0)
+        meeting = meeting_store.load_meeting(meeting_id, since_segment=since_segment)
         if not meeting:
             return jsonify({'success': False, 'error': 'Meeting not found'}), 404
-        return jsonify({'success': True, 'data': meeting})
+
+        response = jsonify({'success': True, 'data': meeting})
+        response.headers['ETag'] = f'"{meeting["version"]}"'
+        return response
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
+@app.route('/api/search', methods=['GET'])
+def search_transcripts():
+    """
+    Full-text search across all meeting transcripts
+
+    Query params:
+        q: Words to search for
+        meetingId: Only search one meeting
+        limit: Page size (default 20, max 100)
+        offset: Results to skip
+    """
+    try:
+        query = request.args.get('q', '').strip()
+        if not query:
+            return jsonify({'success': False, 'error': 'Query parameter q required'}), 400
+        limit = min(max(request.args.get('limit', 20, type=int), 1), 100)
+        offset = max(request.args.get('offset', 0, type=int), 0)
+
+        results = meeting_store.search_segments(
+            query, limit=limit, offset=offset, meeting_id=request.args.get('meetingId')
+        )
+        return jsonify({
+            'success': True,
+            'data': results,
+            'nextOffset': offset + limit if len(results) == limit else None
+        })
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
+@app.route('/api/meetings/<meeting_id>/transcript', methods=['GET'])
+def get_transcript_range(meeting_id):
+    """
+    Get the transcript segments overlapping a span of the meeting timeline
+
+    Query params:
+        from: Seconds from the meeting start (default: beginning)
+        to: Seconds from the meeting start (default: end)
+    """
+    try:
+        start = request.args.get('from', type=float)
+        end = request.args.get('to', type=float)
+        if start is not None and end is not None and end < start:
+            return jsonify({'success': False, 'error': "'to' must not be before 'from'"}), 400
+
+        segments = meeting_store.load_segments_in_range(meeting_id, start, end)
+        if segments is None:
+            return jsonify({'success': False, 'error': 'Meeting not found'}), 404
+
+        return jsonify({'success': True, 'data': {'from': start, 'to': end, 'segments': segments}})
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+def format_sse(seq: int, event_type: str, data) -> str:
+    """Format one Server-Sent Events message"""
+    return f"id: {meeting_events.event_id(seq)}\nevent: {event_type}\ndata: {json.dumps(data)}\n\n"
+
+
+@app.route('/api/meetings/<meeting_id>/events', methods=['GET'])
+def stream_meeting_events(meeting_id):
+    """
+    Stream incremental meeting updates as Server-Sent Events
+
+    Events:
+        snapshot: Full meeting (sent first, or when resume is not possible)
+        segments: Newly committed transcript segments
+        update: Changed meeting fields (status, summary, actionItems, ...)
+
+    Resume with the Last-Event-ID header (sent automatically by EventSource)
+    or the ?after=<event id> query parameter. IDs from before a restart, or
+    older than the kept history, get a new snapshot
+    """
+    after = meeting_events.parse_event_id(request.headers.get('Last-Event-ID') or request.args.get('after'))
+
+    snapshot = None
+    if after is None or not meeting_events.can_resume(meeting_id, after):
+        with meeting_store.meeting_lock(meeting_id):
+            after = meeting_events.last_seq(meeting_id)
+            snapshot = load_meeting(meeting_id)
+        if not snapshot:
+            return jsonify({'success': False, 'error': 'Meeting not found'}), 404
+
+    def generate():
+        yield 'retry: 3000\n\n'
+        if snapshot is not None:
+            yield format_sse(after, 'snapshot', snapshot)
+        for event in meeting_events.subscribe(meeting_id, after):
+            if event is None:
+                yield ': keepalive\n\n'
+            else:
+                yield format_sse(event['seq'], event['type'], event['data'])
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+
 @app.route('/api/meetings', methods=['POST'])
 def create_meeting():
     """Create a new meeting"""
@@ -139,59 +340,291 @@ def create_meeting():
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
-def process_audio_chunk(chunk_path: str, chunk_index: int, meeting_id: str):
+def meeting_origin(meeting_id: str) -> Optional[float]:
+    """Wall-clock time (epoch seconds) of the meeting start, zero on its transcript timeline"""
+    meeting = meeting_store.load_meeting(meeting_id, include_transcript=False)
+    try:
+        return datetime.fromisoformat(meeting['startTime']).timestamp()
+    except (TypeError, KeyError, ValueError):
+        return None
+
+
+def recording_offset(meeting_id: str, recording_started_at: Optional[float]) -> Optional[float]:
+    """Seconds from the meeting start to the start of one of its recordings"""
+    origin = meeting_origin(meeting_id)
+    if origin is None or recording_started_at is None:
+        return None
+    return recording_started_at - origin
+
+
+def chunk_timeline(meeting_id: str, chunk_info: Optional[dict]) -> Callable[[float], float]:
+    """
+    Map times in an (untrimmed) chunk to the meeting timeline, i.e. seconds from
+    the meeting start, with pauses and the gaps between recordings included
+    Chunks without capture timing (submitted directly) keep chunk-relative times
+    """
+    info = chunk_info or {}
+    offset = recording_offset(meeting_id, info.get('recording_started_at'))
+    if offset is None:
+        return lambda t: t
+
+    chunk_start = info['sample_offset'] / info['sample_rate']
+    return lambda t: offset + timeline_time(info['timeline'], chunk_start + t)
+
+
+def transcribe_chunk(chunk_path: str, chunk_index: int, meeting_id: str, chunk_info: dict = None):
+    """
+    Transcribe an audio chunk with the configured transcription provider
+    Runs on a transcription scheduler worker; exceptions trigger a retry
+    Silence trimmed by capture is mapped back using chunk_info['time_map'],
+    and segment times are placed on the meeting timeline (see chunk_timeline)
+    Utterances before chunk_info['live_until'] (recorded-audio seconds the
+    live stream already transcribed) are dropped
+
+    Returns:
+        List of segments, or None if transcription is not configured
+    """
+    if not transcription_provider.configured:
+        print(f"[Backend] Transcription not configured, skipping chunk {chunk_index}")
+        return None
+
+    print(f"[Backend] Processing chunk {chunk_index} for meeting {meeting_id}...")
+
+    channel_labels = (chunk_info or {}).get('channel_labels')
+    options = MULTICHANNEL_TRANSCRIPTION_OPTIONS if channel_labels else TRANSCRIPTION_OPTIONS
+
+    # Identical audio with identical options was already transcribed (retry or replay)
+    cache_key = content_key(
+        'transcription', transcription_provider.name, file_digest(chunk_path), options
+    )
+    utterances = result_cache.get(cache_key)
+    CACHE_LOOKUPS.inc(namespace='transcription', result='miss' if utterances is None else 'hit')
+
+    if utterances is None:
+        meeting_store.set_chunk_state(chunk_path, 'uploaded')
+        with PROVIDER_SECONDS.time(provider=transcription_provider.name, operation='transcribe'):
+            utterances = transcription_provider.transcribe(chunk_path, options)
+        result_cache.put(cache_key, utterances, namespace='transcription')
+    meeting_store.set_chunk_state(chunk_path, 'transcribed')
+
+    # Convert to our format
+    time_map = (chunk_info or {}).get('time_map')
+    to_meeting_time = chunk_timeline(meeting_id, chunk_info)
+
+    # The live stream already stored the audio before live_until (it failed mid-chunk)
+    live_until = (chunk_info or {}).get('live_until')
+    if live_until is not None:
+        live_until = to_meeting_time(live_until - chunk_info['sample_offset'] / chunk_info['sample_rate'])
+
+    segments = []
+    for i, utterance in enumerate(utterances):
+        start = to_meeting_time(remap_time(time_map, utterance['start'] / 1000))  # Convert to seconds
+        end = to_meeting_time(remap_time(time_map, utterance['end'] / 1000))
+        if live_until is not None and (start + end) / 2 < live_until:
+            continue
+        speaker = f"Speaker {utterance['speaker']}"
+        channel = utterance.get('channel')
+        if channel_labels and channel and 0 < int(channel) <= len(channel_labels):
+            speaker = channel_labels[int(channel) - 1]
+        segments.append({
+            'id': f'seg_{meeting_id}_{chunk_index}_{i}',
+            'speaker': speaker,
+            'text': utterance['text'],
+            'startTime': start,
+            'endTime': end,
+            'confidence': utterance['confidence'],
+            'timestamp': start
+        })
+
+    return segments
+
+
+def append_and_publish_segments(meeting_id: str, segments: list, recording_id: str = None,
+                                chunk_index: int = None, chunk_path: str = None):
     """
-    Process audio chunk: transcribe and analyze
-    Called automatically when a chunk is ready
+    Append segments without rewriting the rest of the meeting, and push them
+    to subscribers and the rolling analysis under the meeting lock, so
+    snapshots and deltas line up and a recording starting meanwhile sees
+    each segment exactly once (stored, or added to its analysis)
     """
-    if not aai_client:
-        print(f"[Backend] AssemblyAI not configured, skipping chunk {chunk_index}")
+    with meeting_store.meeting_lock(meeting_id):
+        segment_count = meeting_store.append_segments(
+            meeting_id, segments, count_chunk=chunk_index is not None, chunk_path=chunk_path
+        )
+        if segment_count is not None:
+            event = {'segments': segments, 'segmentCount': segment_count}
+            if chunk_index is not None:
+                event['chunkIndex'] = chunk_index
+            meeting_events.publish(meeting_id, 'segments', event)
+
+        meeting_analyzer.add_segments(meeting_id, recording_id, segments)
+
+
+def commit_chunk(meeting_id: str, chunk_index: int, chunk_path: str, segments,
+                 recording_id: Optional[str]):
+    """
+    Persist a transcribed chunk
+    Called by the transcription scheduler in chunk_index order per recording
+    """
+    if segments is None:
+        # Skipped or failed; keep the audio file for the next recovery pass
+        if chunk_path is not None:
+            meeting_store.set_chunk_state(chunk_path, 'failed')
         return
 
+    append_and_publish_segments(meeting_id, segments, recording_id, chunk_index=chunk_index,
+                                chunk_path=chunk_path)
+
+    print(f"[Backend] Chunk {chunk_index} transcribed: {len(segments)} segments")
+
+    # Clean up chunk file after processing
     try:
-        print(f"[Backend] Processing chunk {chunk_index} for meeting {meeting_id}...")
+        os.remove(chunk_path)
+    except:
+        pass
 
-        # Transcribe with AssemblyAI
-        config = aai.TranscriptionConfig(
-            speaker_labels=True,
-            language_detection=True
-        )
 
-        transcriber = aai.Transcriber()
-        transcript = transcriber.transcribe(chunk_path, config=config)
-
-        # Convert to our format
-        segments = []
-        if transcript.utterances:
-            for i, utterance in enumerate(transcript.utterances):
-                segments.append({
-                    'id': f'seg_{meeting_id}_{chunk_index}_{i}',
-                    'speaker': f'Speaker {utterance.speaker}',
-                    'text': utterance.text,
-                    'startTime': utterance.start / 1000,  # Convert to seconds
-                    'endTime': utterance.end / 1000,
-                    'confidence': utterance.confidence,
-                    'timestamp': utterance.start / 1000
-                })
-
-        # Load meeting and append segments
-        meeting = load_meeting(meeting_id)
-        if meeting:
-            if 'transcript' not in meeting:
-                meeting['transcript'] = []
-            meeting['transcript'].extend(segments)
-            save_meeting(meeting)
+# Chunks of streaming recordings wait here until the live stream has
+# committed finals for all of their audio; only then is the audio dropped
+live_chunks = {}  # meeting_id -> {'stream': StreamingTranscriber, 'chunks': [(path, index, info)]}
+live_chunks_lock = threading.Lock()
 
-        print(f"[Backend] Chunk {chunk_index} transcribed: {len(segments)} segments")
 
-        # Clean up chunk file after processing
-        try:
-            os.remove(chunk_path)
-        except:
-            pass
+def on_chunk_ready(chunk_path: str, chunk_index: int, meeting_id: str, chunk_info: dict = None):
+    """
+    Chunk callback from audio capture
+    With a live stream the chunk is held until the stream has finalized its
+    audio (see release_live_chunks); otherwise it goes to the batch
+    transcription pool
+    """
+    with live_chunks_lock:
+        live = live_chunks.get(meeting_id)
+        if live is not None:
+            live['chunks'].append((chunk_path, chunk_index, chunk_info or {}))
+    if live is not None:
+        release_live_chunks(meeting_id)
+        return
 
-    except Exception as e:
-        print(f"[Backend] Error processing chunk {chunk_index}: {e}")
+    # Runs on the recorder thread, so it must not wait for queue space; a chunk
+    # parked in the backlog stays 'captured' in the journal until it is sent,
+    # and one rejected with the backlog full is kept as 'failed' for recovery
+    transcription_scheduler.submit(chunk_path, chunk_index, meeting_id, chunk_info, block=False)
+
+
+def release_live_chunks(meeting_id: str, stopped: bool = False):
+    """
+    Settle the held chunks of a streaming recording, in order
+    - Chunks whose audio the stream has finalized are skipped and deleted
+    - Once the stream has failed (or stopped short of a chunk) the rest go
+      to batch transcription, marked with how far the stream got so the
+      audio it already transcribed is not transcribed again
+
+    Args:
+        meeting_id: Meeting being recorded
+        stopped: The recording stopped; nothing may be held any longer
+    """
+    with live_chunks_lock:
+        live = live_chunks.get(meeting_id)
+        if live is None:
+            return
+        stream, chunks = live['stream'], live['chunks']
+        finalized = stream.finalized_seconds
+        settled = []
+        while chunks:
+            chunk_info = chunks[0][2]
+            chunk_end = chunk_info.get('sample_offset', 0) / chunk_info.get('sample_rate', 1) + \
+                chunk_info.get('duration_seconds', 0)
+            if finalized >= chunk_end:
+                settled.append((chunks.pop(0), None))
+            elif stopped or not stream.healthy:
+                settled.append((chunks.pop(0), finalized))
+            else:
+                break
+        if stopped:
+            del live_chunks[meeting_id]
+
+    for (chunk_path, chunk_index, chunk_info), live_until in settled:
+        if live_until is None:
+            transcription_scheduler.skip(chunk_index, meeting_id, chunk_info.get('recording_id'))
+            meeting_store.set_chunk_state(chunk_path, 'skipped')
+            try:
+                os.remove(chunk_path)
+            except OSError:
+                pass
+        else:
+            transcription_scheduler.submit(
+                chunk_path, chunk_index, meeting_id, {**chunk_info, 'live_until': live_until}, block=False
+            )
+
+
+def journal_chunk(chunk_path: str, chunk_index: int, meeting_id: str, state: str, chunk_info: dict):
+    """Chunk journal callback from audio capture"""
+    meeting_store.journal_chunk(
+        chunk_path, meeting_id, chunk_info['recording_id'], chunk_index, state, chunk_info
+    )
+
+
+def on_live_transcript(kind: str, result: dict, meeting_id: str):
+    """
+    Live transcription callback
+    Partials are pushed to subscribers only; finals are stored as segments
+    """
+    if kind == 'partial':
+        meeting_events.publish(meeting_id, 'partial', result)
+        return
+
+    # Stream times count recorded audio; place them on the meeting timeline
+    start, end = result['start'], result['end']
+    session = capture_manager.get(meeting_id)
+    offset = recording_offset(meeting_id, session.started_at) if session is not None else None
+    if offset is not None:
+        start = offset + session.timeline_time(start)
+        end = offset + session.timeline_time(end)
+
+    append_and_publish_segments(meeting_id, [{
+        'id': f"seg_{meeting_id}_live_{datetime.now().strftime('%Y%m%d%H%M%S%f')}",
+        'speaker': 'Speaker',
+        'text': result['text'],
+        'startTime': start,
+        'endTime': end,
+        'confidence': result['confidence'],
+        'timestamp': start,
+        'live': True
+    }], session.recording_id if session is not None else None)
+    release_live_chunks(meeting_id)
+
+
+# Transcription worker pool
+transcription_scheduler = TranscriptionScheduler(
+    transcribe=transcribe_chunk,
+    commit=commit_chunk,
+    workers=int(os.getenv('TRANSCRIPTION_WORKERS', 2)),
+    max_queue=int(os.getenv('TRANSCRIPTION_QUEUE_SIZE', 8)),
+    max_backlog=int(os.getenv('TRANSCRIPTION_BACKLOG_SIZE', 64)),
+    max_retries=int(os.getenv('TRANSCRIPTION_MAX_RETRIES', 3))
+)
+
+# Slow request work (analysis, audio tests) runs here; clients poll /api/jobs/<id>
+job_runner = JobRunner(
+    workers=int(os.getenv('JOB_WORKERS', 4)),
+    max_queue=int(os.getenv('JOB_QUEUE_SIZE', 64))
+)
+
+# Point-in-time gauges, read when /metrics is scraped
+metrics.gauge('fomo_transcription_queue_depth', 'Chunks waiting for a transcription worker',
+              lambda: transcription_scheduler.get_status()['queue_depth'])
+metrics.gauge('fomo_transcription_backlog', 'Chunks parked until the queue has room',
+              lambda: transcription_scheduler.get_status()['backlog'])
+metrics.gauge('fomo_transcription_in_flight', 'Chunks being transcribed',
+              lambda: transcription_scheduler.get_status()['in_flight'])
+metrics.gauge('fomo_transcription_awaiting_commit', 'Transcribed chunks waiting for an earlier chunk',
+              lambda: transcription_scheduler.get_status()['awaiting_commit'])
+metrics.gauge('fomo_capture_sessions', 'Active capture sessions',
+              lambda: len(capture_manager.meeting_ids()))
+metrics.gauge('fomo_result_cache_bytes', 'Size of the cached results',
+              lambda: result_cache.get_status()['bytes'])
+metrics.gauge('fomo_jobs', 'Background jobs by status',
+              lambda: {(('status', state),): job_runner.get_status()[state] for state in JOB_STATES})
 
 
 @app.route('/api/audio/start', methods=['POST'])
@@ -201,20 +634,60 @@ def start_audio_capture():
         data = request.json
         meeting_id = data.get('meetingId')
         device_id = data.get('deviceId')  # Optional device ID
+        output_format = data.get('outputFormat')  # Optional: 'speech' (default) or 'original'
+        encoding = data.get('encoding')  # Optional: 'flac' (default), 'opus' or 'wav'
+        vad = data.get('vad')  # Optional: skip silence (default: on)
+        mode = data.get('mode', 'batch')  # 'batch' or 'streaming' (live, batch as fallback)
+        microphone = bool(data.get('microphone', False))  # Also record the microphone
+        mic_device_id = data.get('micDeviceId')  # Optional microphone ID from /api/audio/devices
+        source_mix = data.get('sourceMix')  # Optional: 'mix' (default) or 'separate' channels
 
         if not meeting_id:
             return jsonify({'success': False, 'error': 'Meeting ID required'}), 400
-
-        # Start audio capture with callback
-        audio_service.start_recording(
-            meeting_id=meeting_id,
+        existing = capture_manager.get(meeting_id)
+        if existing is not None and existing.is_recording:
+            return jsonify({'success': False, 'error': 'Meeting is already recording'}), 409
+
+        streaming_transcriber = None
+        if mode == 'streaming':
+            engine = data.get('streamingEngine', os.getenv('STREAMING_ENGINE', 'assemblyai'))
+            # The stub engine only emits placeholder text; keep it to offline runs
+            if engine == 'stub' and transcription_provider.name != 'fake':
+                return jsonify({
+                    'success': False,
+                    'error': 'The stub streaming engine requires TRANSCRIPTION_PROVIDER=fake'
+                }), 400
+            if engine == 'assemblyai' and not aai_client:
+                return jsonify({'success': False, 'error': 'AssemblyAI not configured'}), 400
+            streaming_transcriber = create_streaming_transcriber(engine)
+
+        # Start audio capture; finished chunks go to the transcription pool
+        session = capture_manager.start(
+            meeting_id,
             device_id=device_id,
-            chunk_callback=lambda path, idx, mid: threading.Thread(
-                target=process_audio_chunk,
-                args=(path, idx, mid),
-                daemon=True
-            ).start()
+            chunk_callback=on_chunk_ready,
+            chunk_journal=journal_chunk,
+            output_format=output_format,
+            encoding=encoding,
+            vad=vad,
+            streaming_transcriber=streaming_transcriber,
+            transcript_callback=on_live_transcript,
+            microphone=microphone,
+            mic_device_id=mic_device_id,
+            source_mix=source_mix
         )
+        transcription_scheduler.begin_meeting(meeting_id, session.recording_id)
+
+        # The rolling analysis starts from what earlier recordings stored
+        # (read under the meeting lock, see append_and_publish_segments)
+        with meeting_store.meeting_lock(meeting_id):
+            meeting = load_meeting(meeting_id)
+            meeting_analyzer.begin_meeting(
+                meeting_id, session.recording_id, meeting['transcript'] if meeting else None
+            )
+        if session.streaming_transcriber is not None:
+            with live_chunks_lock:
+                live_chunks[meeting_id] = {'stream': session.streaming_transcriber, 'chunks': []}
 
         return jsonify({
             'success': True,
@@ -223,48 +696,91 @@ def start_audio_capture():
             'device_id': device_id
         })
 
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+def capture_session_id():
+    """
+    Meeting ID of the capture session a request refers to
+    Taken from meetingId in the JSON body or query string; may be omitted
+    while only one meeting is recording
+
+    Returns:
+        Tuple[Optional[str], Optional[tuple]]: (meeting_id, error response);
+            404 if the meeting is not recording, 400 if meetingId is ambiguous
+    """
+    data = request.get_json(silent=True) or {}
+    meeting_id = data.get('meetingId') or request.args.get('meetingId')
+    if meeting_id:
+        if capture_manager.get(meeting_id) is None:
+            return None, (jsonify({'success': False, 'error': 'No recording for this meeting'}), 404)
+        return meeting_id, None
+
+    active = capture_manager.meeting_ids()
+    if len(active) == 1:
+        return active[0], None
+    if not active:
+        return None, (jsonify({'success': False, 'error': 'No recording in progress'}), 404)
+    return None, (jsonify({
+        'success': False, 'error': 'meetingId required while several meetings are recording'
+    }), 400)
+
+
+def capture_result(result: dict):
+    """Response for a capture session operation; 409 if the session was not in a state that allows it"""
+    return jsonify(result), 200 if result.get('success') else 409
+
+
 @app.route('/api/audio/pause', methods=['POST'])
 def pause_audio_capture():
-    """Pause Python-based audio capture"""
+    """Pause Python-based audio capture of a meeting"""
     try:
-        result = audio_service.pause_recording()
-        return jsonify(result)
+        meeting_id, error = capture_session_id()
+        if error:
+            return error
+        return capture_result(capture_manager.pause(meeting_id))
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
 @app.route('/api/audio/resume', methods=['POST'])
 def resume_audio_capture():
-    """Resume Python-based audio capture"""
+    """Resume Python-based audio capture of a meeting"""
     try:
-        result = audio_service.resume_recording()
-        return jsonify(result)
+        meeting_id, error = capture_session_id()
+        if error:
+            return error
+        return capture_result(capture_manager.resume(meeting_id))
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
 @app.route('/api/audio/stop', methods=['POST'])
 def stop_audio_capture():
-    """Stop Python-based audio capture"""
+    """Stop Python-based audio capture of a meeting"""
     try:
-        summary = audio_service.stop_recording()
-
-        # Trigger final analysis if meeting exists
+        meeting_id, error = capture_session_id()
+        if error:
+            return error
+        summary = capture_manager.stop(meeting_id)
+        release_live_chunks(meeting_id, stopped=True)
+        if summary.get('recording_id'):
+            transcription_scheduler.end_meeting(
+                summary['meeting_id'], summary['recording_id'], summary['total_chunks']
+            )
+
+        # Merge the rolling analysis in background once the last chunks are in
         if summary.get('meeting_id'):
-            meeting = load_meeting(summary['meeting_id'])
-            if meeting and len(meeting.get('transcript', [])) > 0:
-                # Analyze meeting in background
-                threading.Thread(
-                    target=analyze_meeting_background,
-                    args=(summary['meeting_id'],),
-                    daemon=True
-                ).start()
+            threading.Thread(
+                target=analyze_meeting_background,
+                args=(summary['meeting_id'], [summary.get('recording_id')]),
+                daemon=True
+            ).start()
 
-        return jsonify(summary)
+        return capture_result(summary)
 
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
@@ -272,9 +788,13 @@ def stop_audio_capture():
 
 @app.route('/api/audio/status', methods=['GET'])
 def get_audio_status():
-    """Get current audio capture status"""
+    """Get audio capture status of one meeting (?meetingId=) or of all sessions"""
     try:
-        status = audio_service.get_status()
+        meeting_id = request.args.get('meetingId')
+        status = capture_manager.get_status(meeting_id)
+        if status is None:
+            return jsonify({'success': False, 'error': 'No recording for this meeting'}), 404
+        status['transcription'] = transcription_scheduler.get_status()
         return jsonify({'success': True, 'data': status})
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
@@ -284,7 +804,6 @@ def get_audio_status():
 def list_audio_devices():
     """List available audio devices"""
     try:
-        from audio_capture import AudioCaptureService
         devices = AudioCaptureService.list_audio_devices()
         return jsonify({'success': True, 'data': devices})
     except Exception as e:
@@ -293,92 +812,141 @@ def list_audio_devices():
 
 @app.route('/api/audio/test', methods=['POST'])
 def test_audio_capture():
-    """Test audio capture for a few seconds"""
+    """
+    Test audio capture for a few seconds
+    Runs as a background job (202 Accepted); concurrent requests share one test
+    """
     try:
         data = request.json or {}
-        duration = data.get('duration', 5)
-
-        from audio_capture import AudioCaptureService
-        result = AudioCaptureService.test_audio_capture(duration)
+        duration = min(max(int(data.get('duration', 5)), 1), 30)
 
-        return jsonify(result)
+        job = job_runner.submit(
+            'audio_test', lambda: AudioCaptureService.test_audio_capture(duration), key='audio_test'
+        )
+        return job_accepted(job)
+    except queue.Full:
+        return jsonify({'success': False, 'error': 'Too many pending jobs'}), 503
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
-def analyze_meeting_background(meeting_id: str):
-    """Analyze meeting in background thread"""
-    try:
-        if not anthropic_client:
-            print(f"[Backend] Anthropic not configured, skipping analysis")
-            return
+# ============ Background Jobs ============
 
-        meeting = load_meeting(meeting_id)
-        if not meeting or len(meeting.get('transcript', [])) == 0:
-            return
+def job_accepted(job: dict):
+    """202 response for a submitted job, pointing at its status endpoint"""
+    return jsonify({'success': True, 'data': job}), 202, {'Location': f"/api/jobs/{job['id']}"}
 
-        # Build transcript text
-        transcript_text = "\n\n".join([
-            f"{seg['speaker']} ({seg['startTime']}s): {seg['text']}"
-            for seg in meeting['transcript']
-        ])
 
-        # Analyze with Claude
-        message = anthropic_client.messages.create(
-            model="claude-sonnet-4-5-20250929",
-            max_tokens=4096,
-            messages=[{
-                "role": "user",
-                "content": f"""Analyze this meeting transcript and extract:
-
-1. **Action Items**: Tasks that need to be done
-2. **Summary**: Key points and decisions
-3. **Next Steps**: What should happen next
-
-Format as JSON with this structure:
-{{
-  "actionItems": [
-    {{
-      "text": "Task description",
-      "assignee": "Person name or null",
-      "priority": "high" | "medium" | "low",
-      "context": "Relevant conversation context"
-    }}
-  ],
-  "summary": {{
-    "overview": "Brief summary",
-    "keyDecisions": ["Decision 1", "Decision 2"],
-    "nextSteps": ["Step 1", "Step 2"],
-    "blockers": ["Blocker 1"],
-    "topics": ["Topic 1", "Topic 2"]
-  }}
-}}
-
-TRANSCRIPT:
-{transcript_text}
-"""
-            }]
-        )
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+def get_job(job_id):
+    """
+    Get the status of a background job
+    status is queued, running, succeeded (with result) or failed (with error)
+    """
+    job = job_runner.get(job_id)
+    if not job:
+        return jsonify({'success': False, 'error': 'Job not found'}), 404
+    return jsonify({'success': True, 'data': job})
 
-        # Parse Claude's response
-        response_text = message.content[0].text
 
-        # Extract JSON from response
-        json_start = response_text.find('{')
-        json_end = response_text.rfind('}') + 1
-        analysis = json.loads(response_text[json_start:json_end])
+def complete_analysis_prompt(prompt: str, max_tokens: int) -> str:
+    """
+    Run a single prompt through the LLM provider and return the response text
+    Responses are cached by model, token limit and prompt (template + transcript)
+    """
+    cache_key = content_key('analysis', llm_provider.name, llm_provider.model, max_tokens, prompt)
+    cached = result_cache.get(cache_key)
+    CACHE_LOOKUPS.inc(namespace='analysis', result='miss' if cached is None else 'hit')
+    if cached is not None:
+        return cached
+
+    if not llm_provider.configured:
+        raise Exception('Anthropic not configured')
+    with PROVIDER_SECONDS.time(provider=llm_provider.name, operation='complete'):
+        response_text = llm_provider.complete(prompt, max_tokens)
+    result_cache.put(cache_key, response_text, namespace='analysis')
+    return response_text
+
+
+def on_analysis_notes(meeting_id: str, notes: list):
+    """Store and push the running notes summarized so far during recording"""
+    def set_notes(meeting):
+        meeting['runningNotes'] = notes
+
+    meeting_store.update_meeting(meeting_id, set_notes)
+    meeting_events.publish(meeting_id, 'update', {'runningNotes': notes})
+
+
+# Rolling map-reduce analysis (windows are summarized while recording)
+meeting_analyzer = MeetingAnalyzer(
+    complete=complete_analysis_prompt,
+    on_notes=on_analysis_notes,
+    window_chars=int(os.getenv('ANALYSIS_WINDOW_CHARS', 6000)),
+    max_retries=int(os.getenv('ANALYSIS_MAX_RETRIES', 3))
+)
+
+
+def apply_analysis(meeting_id: str, analysis: dict, status: str):
+    """Store an analysis result on the meeting and push it to subscribers"""
+    # Add IDs and timestamps to action items
+    for i, item in enumerate(analysis['actionItems']):
+        item['id'] = f'action_{meeting_id}_{i}'
+        item['meetingId'] = meeting_id
+        item['status'] = 'pending'
+        item['timestamp'] = datetime.now().isoformat()
+
+    changes = {
+        'actionItems': analysis['actionItems'],
+        'summary': analysis['summary'],
+        'nextSteps': analysis['summary'].get('nextSteps', []),
+        'status': status
+    }
+
+    def update(meeting):
+        meeting.update(changes)
+
+    meeting_store.update_meeting(meeting_id, update)
+    meeting_events.publish(meeting_id, 'update', changes)
+
+
+def analyze_meeting_background(meeting_id: str, recording_ids: Optional[List[str]] = None):
+    """
+    Finish the rolling analysis of a meeting in a background thread
 
-        # Add IDs and timestamps to action items
-        for i, item in enumerate(analysis['actionItems']):
-            item['id'] = f'action_{meeting_id}_{i}'
-            item['meetingId'] = meeting_id
-            item['status'] = 'pending'
-            item['timestamp'] = datetime.now().isoformat()
+    Args:
+        meeting_id: Meeting identifier
+        recording_ids: Recordings whose chunks must be committed first
+            (default: chunks submitted without a recording); the rolling
+            analysis of the last one is merged
+    """
+    recording_ids = recording_ids or [None]
+    try:
+        if not llm_provider.configured:
+            print(f"[Backend] Anthropic not configured, skipping analysis")
+            meeting_analyzer.discard(meeting_id, recording_ids[-1])
+            return
 
-        meeting['actionItems'] = analysis['actionItems']
-        meeting['summary'] = analysis['summary']
-        meeting['status'] = 'completed'
-        save_meeting(meeting)
+        # Let this meeting's chunks still in the transcription pool commit first
+        for recording_id in recording_ids:
+            if not transcription_scheduler.wait_recording(meeting_id, recording_id, timeout=600):
+                print(f"[Backend] Chunks of {meeting_id} still pending, analyzing what is committed")
+
+        if meeting_analyzer.is_tracking(meeting_id, recording_ids[-1]):
+            analysis = meeting_analyzer.finish(meeting_id, recording_ids[-1], timeout=600)
+            if analysis is None:
+                # Nothing transcribed, or the meeting is recording again and the
+                # new recording's analysis will cover this one
+                return
+        else:
+            # Not recorded in this process (e.g. after a restart): analyze from storage
+            meeting = load_meeting(meeting_id)
+            if not meeting or len(meeting.get('transcript', [])) == 0:
+                return
+            analysis = meeting_analyzer.analyze(meeting['transcript'])
+            if analysis is None:
+                return
+
+        apply_analysis(meeting_id, analysis, 'completed')
 
         print(f"[Backend] Meeting {meeting_id} analyzed successfully")
 
@@ -388,146 +956,336 @@ TRANSCRIPT:
 
 @app.route('/api/meetings/<meeting_id>/analyze', methods=['POST'])
 def analyze_meeting(meeting_id):
-    """Analyze meeting with Anthropic Claude to extract action items and summary"""
-    if not anthropic_client:
+    """
+    Analyze meeting with Anthropic Claude to extract action items and summary
+    Runs as a background job (202 Accepted); the job result is the analyzed meeting
+    """
+    if not llm_provider.configured:
         return jsonify({'success': False, 'error': 'Anthropic not configured'}), 400
 
     try:
         meeting = load_meeting(meeting_id)
         if not meeting:
             return jsonify({'success': False, 'error': 'Meeting not found'}), 404
+        if not meeting['transcript']:
+            return jsonify({'success': False, 'error': 'Meeting has no transcript'}), 400
+
+        def analyze():
+            # Map-reduce over transcript windows, so long meetings fit the token limits
+            analysis = meeting_analyzer.analyze(load_meeting(meeting_id)['transcript'])
+            if analysis is None:
+                raise Exception('Meeting has no transcript')
+            apply_analysis(meeting_id, analysis, 'analyzed')
+            return load_meeting(meeting_id)
+
+        job = job_runner.submit('analyze', analyze, key=f'analyze:{meeting_id}', meetingId=meeting_id)
+        return job_accepted(job)
+    except queue.Full:
+        return jsonify({'success': False, 'error': 'Too many pending jobs'}), 503
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
 
-        # Build transcript text
-        transcript_text = "\n\n".join([
-            f"{seg['speaker']} ({seg['startTime']}s): {seg['text']}"
-            for seg in meeting['transcript']
-        ])
 
-        # Analyze with Claude
-        message = anthropic_client.messages.create(
-            model="claude-sonnet-4-5-20250929",
-            max_tokens=4096,
-            messages=[{
-                "role": "user",
-                "content": f"""Analyze this meeting transcript and extract:
-
-1. **Action Items**: Tasks that need to be done
-2. **Summary**: Key points and decisions
-3. **Next Steps**: What should happen next
-
-Format as JSON with this structure:
-{{
-  "actionItems": [
-    {{
-      "text": "Task description",
-      "assignee": "Person name or null",
-      "priority": "high" | "medium" | "low",
-      "context": "Relevant conversation context"
-    }}
-  ],
-  "summary": {{
-    "overview": "Brief summary",
-    "keyPoints": ["Point 1", "Point 2"],
-    "decisions": ["Decision 1", "Decision 2"],
-    "blockers": ["Blocker 1"]
-  }},
-  "nextSteps": ["Step 1", "Step 2"]
-}}
-
-TRANSCRIPT:
-{transcript_text}
-"""
-            }]
-        )
+# ============ Action Items ============
 
-        # Parse Claude's response
-        response_text = message.content[0].text
+@app.route('/api/meetings/<meeting_id>/action-items/<item_id>/approve', methods=['POST'])
+def approve_action_item(meeting_id, item_id):
+    """Approve an action item (user reviewed)"""
+    try:
+        update_action_items([approval(meeting_id, item_id)])
+
+        meeting = load_meeting(meeting_id)
+        return jsonify({'success': True, 'data': meeting})
+    except KeyError:
+        return jsonify({'success': False, 'error': 'Action item not found'}), 404
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
 
-        # Extract JSON from response (Claude might wrap it in markdown)
-        json_start = response_text.find('{')
-        json_end = response_text.rfind('}') + 1
-        analysis = json.loads(response_text[json_start:json_end])
 
-        # Add IDs and timestamps to action items
-        for i, item in enumerate(analysis['actionItems']):
-            item['id'] = f'action_{meeting_id}_{i}'
-            item['meetingId'] = meeting_id
-            item['status'] = 'pending'
-            item['timestamp'] = datetime.now().isoformat()
+def approval(meeting_id: str, item_id: str) -> dict:
+    """Update that marks an action item as approved"""
+    return {'meetingId': meeting_id, 'id': item_id, 'status': 'approved',
+            'approvedAt': datetime.now().isoformat()}
 
-        meeting['actionItems'] = analysis['actionItems']
-        meeting['summary'] = analysis['summary']
-        meeting['nextSteps'] = analysis.get('nextSteps', [])
-        meeting['status'] = 'analyzed'
-        save_meeting(meeting)
 
-        return jsonify({'success': True, 'data': meeting})
+def update_action_items(updates: list) -> dict:
+    """
+    Apply action item updates in one transaction and publish the changed
+    action items of every affected meeting
+
+    Returns:
+        dict: {meeting_id: action items after the update}
+    """
+    updated = meeting_store.update_action_items(updates)
+    for meeting_id, action_items in updated.items():
+        meeting_events.publish(meeting_id, 'update', {'actionItems': action_items})
+    return updated
+
+
+@app.route('/api/action-items', methods=['GET'])
+def list_action_items():
+    """
+    List action items across all meetings, newest first
+
+    Query params:
+        status: Comma-separated statuses (e.g. pending,approved)
+        assignee: Assigned person
+        priority: Comma-separated priorities
+        meetingId: Only items of one meeting
+        limit: Page size (default 50, max 200)
+        after: Cursor returned as nextCursor by the previous page
+    """
+    try:
+        def csv_arg(name):
+            value = request.args.get(name)
+            return [v.strip() for v in value.split(',') if v.strip()] if value else None
+
+        limit = min(max(request.args.get('limit', 50, type=int), 1), 200)
+        items, next_cursor = meeting_store.list_action_items(
+            status=csv_arg('status'),
+            assignee=request.args.get('assignee'),
+            priority=csv_arg('priority'),
+            meeting_id=request.args.get('meetingId'),
+            limit=limit,
+            after=request.args.get('after')
+        )
+        return jsonify({'success': True, 'data': items, 'nextCursor': next_cursor})
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
-@app.route('/api/meetings/<meeting_id>/action-items/<item_id>/approve', methods=['POST'])
-def approve_action_item(meeting_id, item_id):
-    """Approve an action item (user reviewed)"""
+@app.route('/api/action-items', methods=['PATCH'])
+def bulk_update_action_items():
+    """
+    Update several action items in one transaction (all or nothing)
+
+    Body:
+        updates: [{meetingId, id, <fields to change>}, ...]
+    """
     try:
-        meeting = load_meeting(meeting_id)
-        if not meeting:
-            return jsonify({'success': False, 'error': 'Meeting not found'}), 404
+        updates = (request.json or {}).get('updates')
+        if not isinstance(updates, list) or not updates:
+            return jsonify({'success': False, 'error': 'updates list required'}), 400
+
+        updated = update_action_items(updates)
+        return jsonify({'success': True, 'data': updated})
+    except KeyError as e:
+        return jsonify({'success': False, 'error': str(e.args[0]) if e.args else 'Action item not found'}), 404
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
 
-        # Find and update action item
-        for item in meeting['actionItems']:
-            if item['id'] == item_id:
-                item['status'] = 'approved'
-                item['approvedAt'] = datetime.now().isoformat()
-                break
 
-        save_meeting(meeting)
-        return jsonify({'success': True, 'data': meeting})
+@app.route('/api/action-items/approve', methods=['POST'])
+def bulk_approve_action_items():
+    """
+    Approve several action items in one transaction (all or nothing)
+
+    Body:
+        items: [{meetingId, id}, ...]
+    """
+    try:
+        items = (request.json or {}).get('items')
+        if not isinstance(items, list) or not items:
+            return jsonify({'success': False, 'error': 'items list required'}), 400
+
+        updated = update_action_items([approval(item.get('meetingId'), item.get('id')) for item in items])
+        return jsonify({'success': True, 'data': updated})
+    except KeyError as e:
+        return jsonify({'success': False, 'error': str(e.args[0]) if e.args else 'Action item not found'}), 404
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
 @app.route('/api/meetings/<meeting_id>/github-issues', methods=['POST'])
 def create_github_issues(meeting_id):
-    """Create GitHub issues from approved action items"""
+    """
+    Create GitHub issues from approved action items
+    Issues are created concurrently; retrying never duplicates an issue
+
+    Body:
+        repo: owner/name
+        github_token: Token with issue write access (default: GITHUB_TOKEN)
+        labels: Labels for every issue (optional)
+    """
     try:
-        meeting = load_meeting(meeting_id)
+        data = request.json or {}
+        github_token = data.get('github_token') or os.getenv('GITHUB_TOKEN')
+        repo = data.get('repo')
+        if not github_token or not repo or repo.count('/') != 1:
+            return jsonify({'success': False, 'error': 'github_token and repo (owner/name) required'}), 400
+
+        meeting = meeting_store.load_meeting(meeting_id, include_transcript=False)
         if not meeting:
             return jsonify({'success': False, 'error': 'Meeting not found'}), 404
 
-        data = request.json
-        github_token = data.get('github_token')
-        repo = data.get('repo')
+        approved = [item for item in meeting['actionItems'] if item.get('status') == 'approved']
+        results = github_client.create_issues(github_token, repo, [
+            github_issue_request(meeting, item, data.get('labels')) for item in approved
+        ])
+
+        updates, errors = [], []
+        for item, result in zip(approved, results):
+            if 'issue' in result:
+                updates.append({'meetingId': meeting_id, 'id': item['id'],
+                                'status': 'created', 'githubIssue': result['issue']})
+            else:
+                errors.append({'id': item['id'], 'error': result['error']})
 
-        # This would integrate with GitHub API
-        # For now, just mark items as created
         created_issues = []
-        for item in meeting['actionItems']:
-            if item['status'] == 'approved':
-                item['status'] = 'created'
-                item['githubIssue'] = {
-                    'number': len(created_issues) + 1,
-                    'url': f'https://github.com/{repo}/issues/{len(created_issues) + 1}',
-                    'repository': repo
-                }
-                created_issues.append(item)
-
-        save_meeting(meeting)
-        return jsonify({'success': True, 'data': created_issues})
+        if updates:
+            created_ids = {update['id'] for update in updates}
+            action_items = update_action_items(updates)[meeting_id]
+            created_issues = [item for item in action_items if item['id'] in created_ids]
+
+        if errors and not created_issues:
+            return jsonify({'success': False, 'error': errors[0]['error'], 'errors': errors}), 502
+        return jsonify({'success': True, 'data': created_issues, 'errors': errors})
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
-# ============ WebSocket Removed ============
-# Real-time transcription removed in favor of chunked batch processing
-# Audio is recorded in 2-minute chunks and transcribed via REST API
+def github_issue_request(meeting: dict, item: dict, labels: Optional[list] = None) -> dict:
+    """Build the issue for an action item; the key changes when the meeting is re-analyzed"""
+    details = [item.get('context') or '']
+    if item.get('assignee'):
+        details.append(f"**Assignee:** {item['assignee']}")
+    if item.get('priority'):
+        details.append(f"**Priority:** {item['priority']}")
+    details.append(f"_From meeting: {meeting.get('title') or meeting['id']}_")
+    return {
+        'key': f"{meeting['id']}/{item['id']}@{item.get('timestamp', '')}",
+        'title': (item.get('text') or item['id'])[:256],
+        'body': '\n\n'.join(d for d in details if d),
+        'labels': labels,
+    }
 
 
-if __name__ == '__main__':
+# ============ Chunk Recovery ============
+
+# Journal entries older than this were left behind by an earlier run
+BACKEND_STARTED_AT = time.time()
+chunk_recovery_started = False
+chunk_recovery_lock = threading.Lock()
+
+
+def recover_unfinished_chunks():
+    """
+    Re-enqueue the chunks an earlier run captured but never committed
+    Partial chunks are finished from their last flush, each recording's
+    chunks are resubmitted in order, and meetings whose recording never
+    stopped are analyzed once their chunks are in
+    """
+    try:
+        entries = meeting_store.unfinished_chunks(
+            BACKEND_STARTED_AT, int(os.getenv('CHUNK_RECOVERY_MAX_ATTEMPTS', 3))
+        )
+        if not entries:
+            return
+        print(f"[Recovery] {len(entries)} unfinished chunks from an earlier run")
+
+        recordings = {}
+        for entry in entries:
+            path = entry['path']
+            if entry['state'] == 'recording':
+                frames = recover_partial(path)
+                if frames == 0:
+                    meeting_store.set_chunk_state(path, 'lost')
+                    continue
+                print(f"[Recovery] Finished partial chunk {path} ({frames} frames)")
+            if not os.path.exists(path):
+                meeting_store.set_chunk_state(path, 'lost')
+                continue
+            meeting_store.count_chunk_recovery(path)
+            recordings.setdefault((entry['meeting_id'], entry['recording_id']), []).append(entry)
+
+        for (meeting_id, recording_id), chunks in recordings.items():
+            indices = {entry['chunk_index'] for entry in chunks}
+            first = min(indices)
+            transcription_scheduler.begin_meeting(meeting_id, recording_id, first_index=first)
+
+            # Chunks in between that already finished must not hold up the rest
+            for index in sorted(set(range(first, max(indices) + 1)) - indices):
+                transcription_scheduler.skip(index, meeting_id, recording_id)
+            for entry in chunks:
+                chunk_info = {**(entry['info'] or {}), 'recording_id': recording_id}
+                transcription_scheduler.submit(entry['path'], entry['chunk_index'], meeting_id, chunk_info)
+
+        for meeting_id in {meeting_id for meeting_id, _ in recordings}:
+            meeting = meeting_store.load_meeting(meeting_id, include_transcript=False)
+            if meeting and meeting.get('status') == 'recording' and capture_manager.get(meeting_id) is None:
+                analyze_meeting_background(
+                    meeting_id, [recording_id for m, recording_id in recordings if m == meeting_id]
+                )
+
+    except Exception as e:
+        print(f"[Recovery] Error recovering chunks: {e}")
+
+
+def start_chunk_recovery():
+    """Start the recovery pass in background, once per run and only when transcription is configured"""
+    global chunk_recovery_started
+
+    with chunk_recovery_lock:
+        if chunk_recovery_started or not transcription_provider.configured:
+            return
+        chunk_recovery_started = True
+    threading.Thread(target=recover_unfinished_chunks, daemon=True).start()
+
+
+start_chunk_recovery()
+
+
+# ============ Transcription Modes ============
+# Batch (default): audio is recorded in chunks that close at speech pauses
+# (2 minutes at most) and transcribed via REST API
+# Streaming: audio is also fed live to a streaming transcriber
+# (mode='streaming' on /api/audio/start); chunks are only transcribed in
+# batch if the live stream fails
+
+
+def serve():
+    """
+    Run the API server
+    By default it runs waitress with SERVER_THREADS request threads in this one
+    process. Capture sessions, the transcription pool, jobs and the event bus
+    live in this process's memory, so the backend must not run as several
+    worker processes. FLASK_DEBUG=True uses Flask's development server with
+    the debugger and reloader instead
+    """
+    host = os.getenv('HOST', '0.0.0.0')
+    port = int(os.getenv('PORT', 5000))
+    debug = os.getenv('FLASK_DEBUG', '').lower() in ('1', 'true', 'yes')
+
     print("=" * 60)
     print("FOMO Backend Starting...")
     print("=" * 60)
-    print("API: http://localhost:5000")
-    print("Mode: Chunked audio processing (2-minute segments)")
+    print(f"API: http://localhost:{port}")
+    print("Mode: Chunked audio processing (live streaming optional)")
+
+    if debug:
+        print("Server: Flask development server (debug)")
+        print("=" * 60)
+        app.run(host=host, port=port, debug=True)
+        return
+
+    try:
+        from waitress import serve as waitress_serve
+    except ImportError:
+        print("Server: Flask threaded server (install waitress for production serving)")
+        print("=" * 60)
+        app.run(host=host, port=port, threaded=True)
+        return
+
+    threads = int(os.getenv('SERVER_THREADS', 32))
+    print(f"Server: waitress, {threads} threads")
     print("=" * 60)
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    # Each open event stream holds a thread, so allow for them in SERVER_THREADS
+    waitress_serve(app, host=host, port=port, threads=threads, channel_timeout=300)
+
+
+if __name__ == '__main__':
+    serve()
@@ -4,16 +4,286 @@ Captures system audio directly using soundcard library (Windows)
 Implements chunked recording with automatic transcription
 """
 
-import soundcard as sc
 import numpy as np
 import threading
 import time
 import os
 from datetime import datetime
-import wave
 import io
-from typing import Optional, Callable, List
+from typing import Optional, Callable, List, Dict
 import queue
+from audio_dsp import (downmix, PolyphaseResampler, VoiceActivityDetector, AdaptiveChunker, mask_runs,
+                       DriftCompensator, mix_sources, timeline_time)
+from audio_encoders import ChunkEncoder, create_encoder, available_encodings, check_encoding
+from streaming_transcription import StreamingTranscriber
+from metrics import get_metrics, get_chunk_tracer
+
+try:
+    import soundcard as sc
+except (ImportError, OSError):  # No audio backend (e.g. libpulse missing); capture is unavailable
+    sc = None
+
+SOUNDCARD_MISSING = "Audio capture requires the soundcard package and a working audio backend"
+
+
+# Chunk output formats
+# 'speech' is what the transcription service needs (16 kHz mono), about
+# 5.5x smaller than the capture format
+OUTPUT_FORMATS = {
+    'speech': {'sample_rate': 16000, 'channels': 1},
+    'original': {'sample_rate': 44100, 'channels': 2},
+}
+
+
+class AudioRingBuffer:
+    """
+    Preallocated circular buffer of audio frames
+    Frames are copied in with write() and read back as views, so the
+    capture loop allocates nothing per segment
+    """
+
+    def __init__(self, capacity: int, channels: int, dtype=np.float32):
+        """
+        Initialize ring buffer
+
+        Args:
+            capacity: Buffer size in frames
+            channels: Number of audio channels
+            dtype: Sample type
+        """
+        self.capacity = capacity
+        self.channels = channels
+        self._data = np.zeros((capacity, channels), dtype=dtype)
+        self._read_pos = 0
+        self._size = 0
+        self.overruns = 0  # Frames dropped because the buffer was full
+
+    @property
+    def size(self) -> int:
+        """Number of buffered frames"""
+        return self._size
+
+    def write(self, frames: np.ndarray) -> int:
+        """
+        Copy frames into the buffer, overwriting the oldest frames when full
+
+        Args:
+            frames: Array of shape (n, channels)
+
+        Returns:
+            int: Number of frames written
+        """
+        n = len(frames)
+        if n > self.capacity:
+            self.overruns += n - self.capacity
+            frames = frames[-self.capacity:]
+            n = self.capacity
+
+        free = self.capacity - self._size
+        if n > free:
+            dropped = n - free
+            self.overruns += dropped
+            self._read_pos = (self._read_pos + dropped) % self.capacity
+            self._size -= dropped
+
+        write_pos = (self._read_pos + self._size) % self.capacity
+        first = min(n, self.capacity - write_pos)
+        self._data[write_pos:write_pos + first] = frames[:first]
+        if first < n:
+            self._data[:n - first] = frames[first:]
+        self._size += n
+        return n
+
+    def views(self, frames: Optional[int] = None) -> List[np.ndarray]:
+        """
+        Get views of the oldest buffered frames without copying
+
+        Args:
+            frames: Number of frames (default: all buffered frames)
+
+        Returns:
+            List[np.ndarray]: One or two views covering the frames in order
+        """
+        frames = self._size if frames is None else min(frames, self._size)
+        first = min(frames, self.capacity - self._read_pos)
+        parts = [self._data[self._read_pos:self._read_pos + first]]
+        if first < frames:
+            parts.append(self._data[:frames - first])
+        return parts
+
+    def consume(self, frames: int):
+        """Discard the oldest frames"""
+        frames = min(frames, self._size)
+        self._read_pos = (self._read_pos + frames) % self.capacity
+        self._size -= frames
+
+    def clear(self):
+        """Discard all buffered frames"""
+        self._read_pos = 0
+        self._size = 0
+
+
+def float_to_int16(parts: List[np.ndarray], out: np.ndarray, scratch: np.ndarray) -> np.ndarray:
+    """
+    Convert float32 audio to int16 PCM into a reusable output buffer
+    Conversion runs block by block through a small scratch buffer, so no
+    chunk-sized temporaries are allocated
+
+    Args:
+        parts: Float arrays in [-1, 1] to convert, in order (e.g. ring buffer views)
+        out: Preallocated int16 output buffer
+        scratch: Preallocated float32 work buffer (any number of frames)
+
+    Returns:
+        np.ndarray: View of out holding the converted frames
+    """
+    pos = 0
+    block = len(scratch)
+    for part in parts:
+        for start in range(0, len(part), block):
+            src = part[start:start + block]
+            n = len(src)
+            work = scratch[:n]
+            np.multiply(src, 32767, out=work)
+            np.clip(work, -32768, 32767, out=work)
+            np.copyto(out[pos:pos + n], work, casting='unsafe')
+            pos += n
+    return out[:pos]
+
+
+metrics = get_metrics()
+chunk_tracer = get_chunk_tracer()
+
+SEGMENT_RECORD_SECONDS = metrics.histogram(
+    'fomo_capture_segment_record_seconds', 'Time blocked in the device read per 1 s capture segment')
+SEGMENT_PROCESS_SECONDS = metrics.histogram(
+    'fomo_capture_segment_process_seconds', 'Conversion, VAD, chunking and encoding time per capture segment')
+CHUNK_FINALIZE_SECONDS = metrics.histogram(
+    'fomo_capture_chunk_finalize_seconds', 'Time to finish and move a chunk file into place')
+CHUNK_FLUSH_SECONDS = metrics.histogram(
+    'fomo_capture_chunk_flush_seconds', 'Time to flush a partial chunk to disk and journal it')
+BUFFER_OVERRUNS = metrics.counter(
+    'fomo_capture_buffer_overruns_total', 'Audio frames dropped because a capture buffer was full')
+SECONDARY_UNDERRUNS = metrics.counter(
+    'fomo_capture_secondary_underruns_total', 'Segments padded with silence because the microphone fell behind')
+CHUNKS_TOTAL = metrics.counter(
+    'fomo_capture_chunks_total', 'Chunks closed by capture, by outcome')
+
+
+# How a second source (microphone) is combined with the loopback audio
+SOURCE_MIX_MODES = ('mix', 'separate')
+
+# Channel labels of 'separate' chunks, in channel order
+SEPARATE_CHANNEL_LABELS = ['System', 'Microphone']
+
+
+class SecondarySourceReader:
+    """
+    Records a second audio source (e.g. the microphone) on its own thread
+    Frames are converted to the output rate as mono and buffered with their
+    capture timestamps. The main capture loop pulls exactly as many frames
+    as it captured from the primary source; a DriftCompensator absorbs the
+    clock difference between the two devices
+    """
+
+    def __init__(self, device, capture_rate: int, output_rate: int,
+                 block_seconds: float = 0.1, buffer_seconds: float = 5.0):
+        """
+        Initialize reader
+
+        Args:
+            device: soundcard device to record from
+            capture_rate: Device sample rate in Hz
+            output_rate: Sample rate of the buffered frames
+            block_seconds: Duration of each device read
+            buffer_seconds: Maximum buffered audio
+        """
+        self.device = device
+        self.capture_rate = capture_rate
+        self.output_rate = output_rate
+        self.block_frames = int(capture_rate * block_seconds)
+        self._resampler = PolyphaseResampler(capture_rate, output_rate, 1)
+        self._ring = AudioRingBuffer(int(output_rate * buffer_seconds), 1)
+        self._lock = threading.Lock()
+        self._last_timestamp = 0.0  # time.monotonic() at the end of the newest buffered frame
+        self.compensator = DriftCompensator(target_frames=int(output_rate * block_seconds * 2))
+        self.error: Optional[str] = None
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Start recording on a background thread"""
+        self._running = True
+        self._thread = threading.Thread(target=self._read_loop, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop recording"""
+        self._running = False
+        if self._thread:
+            self._thread.join(timeout=2)
+            self._thread = None
+
+    def _read_loop(self):
+        try:
+            with self.device.recorder(samplerate=self.capture_rate, channels=1) as recorder:
+                while self._running:
+                    frames = self._resampler.process(downmix(recorder.record(numframes=self.block_frames)))
+                    captured_at = time.monotonic()
+                    with self._lock:
+                        overruns = self._ring.overruns
+                        self._ring.write(frames)
+                        self._last_timestamp = captured_at
+                        if self._ring.overruns > overruns:
+                            BUFFER_OVERRUNS.inc(self._ring.overruns - overruns, source='secondary')
+        except Exception as e:
+            self.error = str(e)
+            print(f"[AudioCapture] Secondary source error: {e}")
+
+    def align(self, start_time: float):
+        """
+        Drop buffered audio captured before start_time, so both sources
+        start at the same instant
+
+        Args:
+            start_time: time.monotonic() when the primary source started
+        """
+        with self._lock:
+            newer = int((self._last_timestamp - start_time) * self.output_rate)
+            self._ring.consume(self._ring.size - max(0, min(newer, self._ring.size)))
+        self.compensator.reset()
+
+    def read(self, frames: int) -> np.ndarray:
+        """
+        Pull frames aligned to the primary stream
+
+        Args:
+            frames: Number of frames captured from the primary source
+
+        Returns:
+            np.ndarray: Array of shape (frames, 1); silence where the source fell behind
+        """
+        with self._lock:
+            underruns = self.compensator.underruns
+            dropped, take = self.compensator.plan(frames, self._ring.size)
+            if self.compensator.underruns > underruns:
+                SECONDARY_UNDERRUNS.inc()
+            self._ring.consume(dropped)
+            parts = self._ring.views(take)
+            block = np.concatenate(parts) if len(parts) > 1 else parts[0].copy()
+            self._ring.consume(take)
+        return DriftCompensator.stretch(block, frames)
+
+    def get_status(self) -> dict:
+        """Alignment counters of the secondary source"""
+        return {
+            'device': self.device.name,
+            'drift_ppm': round(self.compensator.drift_ppm, 1),
+            'underruns': self.compensator.underruns,
+            'resyncs': self.compensator.resyncs,
+            'overruns': self._ring.overruns,
+            'error': self.error
+        }
 
 
 class AudioCaptureService:
@@ -21,24 +291,57 @@ class AudioCaptureService:
     System audio capture service with chunked recording
     Records in 2-minute intervals and processes each chunk
     Supports pause/resume and device selection
+    One instance records one meeting; see CaptureSessionManager for several
     """
 
-    def __init__(self, chunk_duration: int = 120):
+    def __init__(self, chunk_duration: int = 120, output_format: str = 'speech', encoding: str = 'flac',
+                 vad: bool = True, vad_threshold: float = 0.005, min_speech_seconds: float = 0.5,
+                 min_chunk_seconds: float = 15, pause_seconds: float = 0.6, flush_seconds: float = 10):
         """
         Initialize audio capture service
 
         Args:
-            chunk_duration: Duration of each chunk in seconds (default: 120 = 2 minutes)
+            chunk_duration: Maximum duration of each chunk in seconds (default: 120 = 2 minutes)
+            output_format: Chunk sample format, a key of OUTPUT_FORMATS (default: 'speech')
+            encoding: Chunk file encoding: 'wav', 'flac' or 'opus' (default: 'flac',
+                falls back to 'wav' if soundfile is not installed)
+            vad: Drop silent spans and skip chunks without speech (default: True)
+            vad_threshold: RMS level (0-1) treated as speech
+            min_speech_seconds: Chunks with less speech than this are not transcribed
+            min_chunk_seconds: Chunks close at the first pause after this many seconds
+            pause_seconds: Silence needed to count as a pause
+            flush_seconds: How often the chunk being recorded is flushed to disk
+                and journaled, bounding the audio lost if the process dies
         """
         self.chunk_duration = chunk_duration
         self.sample_rate = 44100
         self.channels = 2
         self.is_recording = False
         self.is_paused = False
+        self.set_output_format(output_format)
+        self.set_encoding(encoding)
+        self.vad_enabled = vad
+        self.vad_threshold = vad_threshold
+        self.min_speech_seconds = min_speech_seconds
+        self.min_chunk_seconds = min_chunk_seconds
+        self.pause_seconds = pause_seconds
+        self.flush_seconds = flush_seconds
+        self.chunks_skipped = 0
+        self.recorded_samples = 0
+        self.streaming_transcriber: Optional[StreamingTranscriber] = None
+        self.use_microphone = False
+        self.mic_device_id: Optional[int] = None
+        self.source_mix = 'mix'
+        self.secondary_reader: Optional[SecondarySourceReader] = None
         self.recording_thread: Optional[threading.Thread] = None
         self.current_meeting_id: Optional[str] = None
+        self.recording_id: Optional[str] = None
+        self.started_at: Optional[float] = None  # Wall-clock time of the first captured sample
+        self.paused_seconds = 0.0
+        self.timeline: List[List[float]] = []  # [audio_start, time_start] per stretch between pauses
         self.chunk_index = 0
         self.chunk_callback: Optional[Callable] = None
+        self.chunk_journal: Optional[Callable] = None
         self.audio_queue = queue.Queue()
         self.data_dir = 'data'
         self.selected_device_id: Optional[int] = None
@@ -46,26 +349,132 @@ class AudioCaptureService:
         self.pause_event.set()  # Not paused by default
         os.makedirs(self.data_dir, exist_ok=True)
         
-    def start_recording(self, meeting_id: str, chunk_callback: Optional[Callable] = None, device_id: Optional[int] = None):
+    def set_output_format(self, output_format: str):
+        """
+        Select the chunk output format
+
+        Args:
+            output_format: A key of OUTPUT_FORMATS
+        """
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"Unknown output format: {output_format}")
+        if self.is_recording:
+            raise Exception("Cannot change output format while recording")
+
+        self.output_format = output_format
+        self.output_sample_rate = OUTPUT_FORMATS[output_format]['sample_rate']
+        self.output_channels = OUTPUT_FORMATS[output_format]['channels']
+
+    def set_encoding(self, encoding: str):
+        """
+        Select the chunk file encoding
+
+        Args:
+            encoding: 'wav', 'flac' or 'opus'
+        """
+        if self.is_recording:
+            raise Exception("Cannot change encoding while recording")
+
+        create_encoder(encoding)  # Validates the name
+        if encoding not in available_encodings():
+            print(f"[AudioCapture] {encoding} encoding unavailable (soundfile not installed), using wav")
+            encoding = 'wav'
+        self.encoding = encoding
+
+    def start_recording(self, meeting_id: str, chunk_callback: Optional[Callable] = None, device_id: Optional[int] = None,
+                        output_format: Optional[str] = None, encoding: Optional[str] = None,
+                        vad: Optional[bool] = None, streaming_transcriber: Optional[StreamingTranscriber] = None,
+                        transcript_callback: Optional[Callable] = None, microphone: bool = False,
+                        mic_device_id: Optional[int] = None, source_mix: Optional[str] = None,
+                        chunk_journal: Optional[Callable] = None):
         """
         Start recording system audio
 
         Args:
             meeting_id: Unique identifier for the meeting
-            chunk_callback: Function to call when a chunk is ready (receives chunk_path, chunk_index)
+            chunk_callback: Function to call when a chunk is ready
+                (receives chunk_path, chunk_index, meeting_id, chunk_info)
             device_id: Optional device ID to record from (None = default device)
+            output_format: Optional chunk output format (None = keep current)
+            encoding: Optional chunk encoding (None = keep current)
+            vad: Optional override for voice activity detection (None = keep current)
+            streaming_transcriber: Optional live transcriber fed while recording.
+                Chunks are still produced so batch transcription can take over
+                if the stream fails
+            transcript_callback: Receives live results (kind, result, meeting_id),
+                kind being 'partial' or 'final'
+            microphone: Also record a microphone alongside the loopback device
+            mic_device_id: Microphone ID from list_audio_devices() (None = default microphone)
+            source_mix: 'mix' (default) sums microphone and system audio;
+                'separate' writes them as two channels (see SEPARATE_CHANNEL_LABELS)
+            chunk_journal: Function recording chunk states (receives chunk_path,
+                chunk_index, meeting_id, state, chunk_info); state is 'recording'
+                (partial chunk flushed), 'captured' or 'discarded'
+
+        Raises:
+            ValueError: If an option is invalid (e.g. an encoding that cannot
+                store the output format)
         """
         if self.is_recording:
             raise Exception("Recording already in progress")
+        if sc is None:
+            raise Exception(SOUNDCARD_MISSING)
+        if source_mix is not None and source_mix not in SOURCE_MIX_MODES:
+            raise ValueError(f"Unknown source mix mode: {source_mix}")
+        if output_format is not None and output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"Unknown output format: {output_format}")
+
+        # Checked here: the recorder thread would only fail once it opens the first chunk
+        requested_encoding = encoding or self.encoding
+        if requested_encoding in available_encodings():
+            check_encoding(requested_encoding,
+                           OUTPUT_FORMATS[output_format or self.output_format]['sample_rate'],
+                           OUTPUT_FORMATS[output_format or self.output_format]['channels'])
+
+        if output_format is not None:
+            self.set_output_format(output_format)
+        if encoding is not None:
+            self.set_encoding(encoding)
+        if vad is not None:
+            self.vad_enabled = vad
+
+        self.use_microphone = microphone
+        self.mic_device_id = mic_device_id
+        self.source_mix = source_mix or 'mix'
+        self.output_channels = OUTPUT_FORMATS[self.output_format]['channels']
+        if microphone and self.source_mix == 'separate':
+            self.output_channels = len(SEPARATE_CHANNEL_LABELS)
 
         self.current_meeting_id = meeting_id
+        self.recording_id = datetime.now().strftime('%Y%m%d%H%M%S%f')  # Keeps chunk files of each recording apart
         self.chunk_index = 0
+        self.chunks_skipped = 0
+        self.recorded_samples = 0
+        self.started_at = None
+        self.paused_seconds = 0.0
+        self.timeline = [[0.0, 0.0]]
         self.chunk_callback = chunk_callback
+        self.chunk_journal = chunk_journal
         self.selected_device_id = device_id
         self.is_recording = True
         self.is_paused = False
         self.pause_event.set()  # Not paused
 
+        self.secondary_reader = None
+
+        # Open the live transcription stream; on failure only batch mode is used
+        self.streaming_transcriber = None
+        if streaming_transcriber is not None:
+            try:
+                streaming_transcriber.start(
+                    self.output_sample_rate, self.output_channels,
+                    on_partial=lambda result: transcript_callback and transcript_callback('partial', result, meeting_id),
+                    on_final=lambda result: transcript_callback and transcript_callback('final', result, meeting_id)
+                )
+                self.streaming_transcriber = streaming_transcriber
+            except Exception as e:
+                print(f"[AudioCapture] Streaming transcription unavailable, using batch only: {e}")
+
         # Start recording in a separate thread
         self.recording_thread = threading.Thread(target=self._record_loop, daemon=True)
         self.recording_thread.start()
@@ -141,19 +550,29 @@ class AudioCaptureService:
         if self.recording_thread:
             self.recording_thread.join(timeout=5)
 
+        # Flush the live transcription stream
+        if self.streaming_transcriber is not None:
+            self.streaming_transcriber.stop()
+
         summary = {
             'success': True,
             'meeting_id': self.current_meeting_id,
+            'recording_id': self.recording_id,
+            'started_at': self.started_at,
+            'paused_seconds': self.paused_seconds,
             'total_chunks': self.chunk_index,
-            'duration_seconds': self.chunk_index * self.chunk_duration
+            'duration_seconds': self.recorded_samples / self.output_sample_rate
         }
 
         print(f"[AudioCapture] Stopped recording. Total chunks: {self.chunk_index}")
 
         # Reset state
         self.current_meeting_id = None
+        self.recording_id = None
         self.chunk_index = 0
         self.selected_device_id = None
+        self.streaming_transcriber = None
+        self.chunk_journal = None
 
         return summary
     
@@ -161,6 +580,7 @@ class AudioCaptureService:
         """
         Main recording loop - captures audio in chunks
         Supports pause/resume and device selection
+        Chunks close at the first pause after min_chunk_seconds, or at chunk_duration
         """
         try:
             # Get audio device
@@ -178,92 +598,336 @@ class AudioCaptureService:
 
             print(f"[AudioCapture] Using audio device: {speakers.name}")
 
-            # Record in chunks
+            # Microphone recorded on its own thread, aligned to the loopback stream
+            separate = self.use_microphone and self.source_mix == 'separate'
+            if self.use_microphone:
+                microphone = self._get_microphone()
+                print(f"[AudioCapture] Using microphone: {microphone.name} ({self.source_mix})")
+                self.secondary_reader = SecondarySourceReader(microphone, self.sample_rate, self.output_sample_rate)
+                self.secondary_reader.start()
+
+            # Record audio data in smaller segments to allow pause responsiveness
+            segment_duration = 1  # 1 second segments
+            frames_per_segment = int(self.sample_rate * segment_duration)
+
+            # Downmix/resample each segment to the output format before buffering
+            convert = self._make_converter(1 if separate else self.output_channels)
+            out_frames_per_segment = -(-frames_per_segment * self.output_sample_rate // self.sample_rate) + 1
+
+            # Buffers are allocated once and reused for every chunk. Segments are
+            # staged in the ring buffer and drained into the chunk encoder as they
+            # arrive, so only a few seconds of audio are ever held in memory
+            ring = AudioRingBuffer(out_frames_per_segment * 4, self.output_channels)
+            pcm = np.empty((out_frames_per_segment, self.output_channels), dtype=np.int16)
+            scratch = np.empty((out_frames_per_segment, self.output_channels), dtype=np.float32)
+
+            # Frame energy drives both voice activity detection and chunk boundaries
+            detector = VoiceActivityDetector(self.output_sample_rate, energy_threshold=self.vad_threshold)
+            chunker = AdaptiveChunker(
+                self.output_sample_rate, detector.frame_len,
+                min_seconds=min(self.min_chunk_seconds, self.chunk_duration),
+                max_seconds=self.chunk_duration,
+                pause_seconds=self.pause_seconds,
+                energy_threshold=self.vad_threshold
+            )
+
             with speakers.recorder(samplerate=self.sample_rate, channels=self.channels) as mic:
+                if self.secondary_reader is not None:
+                    self.secondary_reader.align(time.monotonic())
+                self.started_at = time.time()
+
+                chunk = None
+                overruns_seen = 0
                 while self.is_recording:
-                    # Wait if paused
-                    self.pause_event.wait()
+                    if not self.pause_event.is_set():
+                        paused_at = time.monotonic()
+                        self.pause_event.wait()  # Wait if paused
+                        if self.secondary_reader is not None:
+                            self.secondary_reader.align(time.monotonic())
+
+                        # The pause is a gap on the timeline; the audio continues where it stopped
+                        self.paused_seconds += time.monotonic() - paused_at
+                        audio_seconds = self.recorded_samples / self.output_sample_rate
+                        self.timeline.append([audio_seconds, audio_seconds + self.paused_seconds])
 
                     if not self.is_recording:
                         break
 
-                    # Record one chunk (chunk_duration seconds)
-                    print(f"[AudioCapture] Recording chunk {self.chunk_index}...")
+                    # Record segment and convert it
+                    record_start = time.perf_counter()
+                    captured = mic.record(numframes=frames_per_segment)
+                    process_start = time.perf_counter()
+                    SEGMENT_RECORD_SECONDS.observe(process_start - record_start)
 
-                    # Calculate number of frames for chunk duration
-                    frames_per_chunk = int(self.sample_rate * self.chunk_duration)
+                    frames = convert(captured)
+                    if self.secondary_reader is not None:
+                        frames = mix_sources(frames, self.secondary_reader.read(len(frames)), self.source_mix)
 
-                    # Record audio data in smaller segments to allow pause responsiveness
-                    segment_duration = 1  # 1 second segments
-                    frames_per_segment = int(self.sample_rate * segment_duration)
-                    segments_per_chunk = self.chunk_duration // segment_duration
+                    # Live transcription gets the ungated audio (it needs the pauses)
+                    if self.streaming_transcriber is not None:
+                        self.streaming_transcriber.feed(frames)
+                    rms, zcr = detector.frame_features(frames)
+                    speech_mask = detector.classify(rms, zcr, len(frames)) if self.vad_enabled else None
 
-                    audio_segments = []
-                    for i in range(segments_per_chunk):
-                        # Check if paused or stopped
-                        if not self.is_recording:
-                            break
+                    # Split the segment where the chunker wants to close the chunk
+                    while len(frames):
+                        if chunk is None:
+                            chunk = self._begin_chunk()
 
-                        self.pause_event.wait()  # Wait if paused
+                        cut = chunker.find_cut(rms, len(frames))
+                        part = frames if cut is None else frames[:cut]
+                        part_mask = None if speech_mask is None else speech_mask[:len(part)]
+                        self._write_chunk_audio(chunk, part, part_mask, ring, pcm, scratch)
 
-                        if not self.is_recording:
+                        if cut is None:
                             break
 
-                        # Record segment
-                        segment_data = mic.record(numframes=frames_per_segment)
-                        audio_segments.append(segment_data)
-
-                    if not self.is_recording or len(audio_segments) == 0:
-                        break
+                        self._finish_chunk(chunk)
+                        chunk = None
+                        chunker.reset()
 
-                    # Combine segments into chunk
-                    import numpy as np
-                    audio_data = np.concatenate(audio_segments, axis=0)
+                        # Continue with the rest of the segment in a new chunk
+                        frames = frames[cut:]
+                        if speech_mask is not None:
+                            speech_mask = speech_mask[cut:]
+                        rms = rms[cut // detector.frame_len:]
 
-                    # Save chunk to file
-                    chunk_path = self._save_chunk(audio_data, self.chunk_index)
+                    # Bound what a crash can lose to the last flush interval
+                    if chunk is not None and time.monotonic() - chunk['flushed_at'] >= self.flush_seconds:
+                        self._flush_chunk(chunk)
 
-                    print(f"[AudioCapture] Chunk {self.chunk_index} saved: {chunk_path}")
+                    SEGMENT_PROCESS_SECONDS.observe(time.perf_counter() - process_start)
+                    if ring.overruns > overruns_seen:
+                        BUFFER_OVERRUNS.inc(ring.overruns - overruns_seen, source='primary')
+                        overruns_seen = ring.overruns
 
-                    # Call callback if provided
-                    if self.chunk_callback:
-                        try:
-                            self.chunk_callback(chunk_path, self.chunk_index, self.current_meeting_id)
-                        except Exception as e:
-                            print(f"[AudioCapture] Error in chunk callback: {e}")
-
-                    self.chunk_index += 1
+                # Stopped mid-chunk: discard the partial chunk
+                if chunk is not None:
+                    chunk['encoder'].abort()
+                    self._journal(chunk, 'discarded')
 
         except Exception as e:
             print(f"[AudioCapture] Recording error: {e}")
             self.is_recording = False
             self.is_paused = False
-    
-    def _save_chunk(self, audio_data: np.ndarray, chunk_index: int) -> str:
+        finally:
+            if self.secondary_reader is not None:
+                self.secondary_reader.stop()
+
+    def _get_microphone(self):
+        """Resolve mic_device_id (an ID from list_audio_devices) to a microphone"""
+        if self.mic_device_id is None:
+            return sc.default_microphone()
+        all_mics = sc.all_microphones()
+        index = self.mic_device_id - len(sc.all_speakers())  # Microphones are listed after speakers
+        if 0 <= index < len(all_mics):
+            return all_mics[index]
+        print(f"[AudioCapture] Invalid microphone ID {self.mic_device_id}, using default")
+        return sc.default_microphone()
+
+    def _begin_chunk(self) -> dict:
+        """
+        Start recording a new chunk
+
+        Returns:
+            dict: Chunk state (encoder, time map, source length)
+        """
+        print(f"[AudioCapture] Recording chunk {self.chunk_index}...")
+        chunk = {
+            'encoder': self._open_chunk(self.chunk_index),
+            'time_map': [],  # [output_start, source_start, length] in samples
+            'source_samples': 0,
+            'sample_offset': self.recorded_samples,  # Position in the recording, pauses excluded
+            'flushed_at': time.monotonic(),
+        }
+        self._journal(chunk, 'recording')
+        return chunk
+
+    def _chunk_info(self, chunk: dict) -> dict:
+        """Metadata of the audio written to a chunk so far, for transcription"""
+        rate = self.output_sample_rate
+        return {
+            'recording_id': self.recording_id,
+            'recording_started_at': self.started_at,
+            'start_wall': self.started_at + self.timeline_time(chunk['sample_offset'] / rate),
+            'sample_offset': chunk['sample_offset'],
+            'sample_rate': rate,
+            'timeline': [list(span) for span in self.timeline],
+            'duration_seconds': chunk['source_samples'] / rate,
+            'speech_seconds': chunk['encoder'].frames_written / rate,
+            'time_map': [[o / rate, s / rate, n / rate] for o, s, n in chunk['time_map']]
+            if self.vad_enabled else None,
+            'channel_labels': SEPARATE_CHANNEL_LABELS
+            if self.use_microphone and self.source_mix == 'separate' else None
+        }
+
+    def timeline_time(self, audio_seconds: float) -> float:
+        """
+        Seconds since the recording started for a position in the recorded
+        audio (as counted by chunks and the live stream), pauses included
+        """
+        return timeline_time(self.timeline, audio_seconds)
+
+    def _journal(self, chunk: dict, state: str, chunk_info: Optional[dict] = None):
+        """Record a chunk state in the chunk journal (if one was given)"""
+        if not self.chunk_journal:
+            return
+        try:
+            self.chunk_journal(chunk['encoder'].path, self.chunk_index, self.current_meeting_id,
+                               state, chunk_info or self._chunk_info(chunk))
+        except Exception as e:
+            print(f"[AudioCapture] Error journaling chunk {self.chunk_index}: {e}")
+
+    def _flush_chunk(self, chunk: dict):
+        """Flush the partial chunk to disk and journal how far it got"""
+        with CHUNK_FLUSH_SECONDS.time():
+            try:
+                chunk['encoder'].flush()
+            except Exception as e:
+                print(f"[AudioCapture] Error flushing chunk {self.chunk_index}: {e}")
+            self._journal(chunk, 'recording')
+        chunk['flushed_at'] = time.monotonic()
+
+    def _write_chunk_audio(self, chunk: dict, frames: np.ndarray, speech_mask: Optional[np.ndarray],
+                           ring: AudioRingBuffer, pcm: np.ndarray, scratch: np.ndarray):
+        """Gate (if VAD is on) and encode audio belonging to the current chunk"""
+        encoder = chunk['encoder']
+        source_samples = len(frames)
+
+        # Keep only speech (plus hangover) when VAD is enabled
+        if speech_mask is not None:
+            frames = self._gate_segment(frames, speech_mask, chunk['time_map'],
+                                        chunk['source_samples'], encoder.frames_written)
+        chunk['source_samples'] += source_samples
+        self.recorded_samples += source_samples
+
+        ring.write(frames)
+        self._drain_to_encoder(ring, encoder, pcm, scratch)
+
+    def _finish_chunk(self, chunk: dict):
+        """Close the current chunk and hand it to the chunk callback"""
+        encoder = chunk['encoder']
+        rate = self.output_sample_rate
+
+        # Chunks without enough speech are not transcribed
+        speech_seconds = encoder.frames_written / rate
+        if self.vad_enabled and speech_seconds < self.min_speech_seconds:
+            encoder.abort()
+            self._journal(chunk, 'discarded')
+            self.chunks_skipped += 1
+            CHUNKS_TOTAL.inc(outcome='no_speech')
+            print(f"[AudioCapture] No speech in chunk {self.chunk_index}, skipped")
+            return
+        if encoder.frames_written == 0:
+            encoder.abort()
+            self._journal(chunk, 'discarded')
+            return
+
+        # Finish the chunk file
+        with CHUNK_FINALIZE_SECONDS.time():
+            chunk_path = encoder.close()
+        CHUNKS_TOTAL.inc(outcome='saved')
+        chunk_info = self._chunk_info(chunk)
+        self._journal(chunk, 'captured', chunk_info)
+
+        print(f"[AudioCapture] Chunk {self.chunk_index} saved: {chunk_path} "
+              f"({chunk_info['duration_seconds']:.1f}s)")
+        chunk_tracer.event(self.current_meeting_id, self.chunk_index, 'captured',
+                           path=chunk_path, duration_seconds=chunk_info['duration_seconds'],
+                           speech_seconds=speech_seconds, bytes=os.path.getsize(chunk_path))
+
+        # Call callback if provided (on the recorder thread, so it must not block)
+        if self.chunk_callback:
+            try:
+                self.chunk_callback(chunk_path, self.chunk_index, self.current_meeting_id, chunk_info)
+            except Exception as e:
+                print(f"[AudioCapture] Error in chunk callback: {e}")
+
+        self.chunk_index += 1
+
+    def _make_converter(self, output_channels: int) -> Callable[[np.ndarray], np.ndarray]:
+        """
+        Build the per-segment conversion from capture format to output format
+
+        Args:
+            output_channels: Channels to produce (1 downmixes, otherwise capture channels are kept)
+
+        Returns:
+            Callable: Function mapping (n, channels) capture frames to output frames
+        """
+        steps = []
+        if output_channels == 1 and self.channels > 1:
+            steps.append(downmix)
+        if self.output_sample_rate != self.sample_rate:
+            resampler = PolyphaseResampler(self.sample_rate, self.output_sample_rate, output_channels)
+            steps.append(resampler.process)
+
+        def convert(frames: np.ndarray) -> np.ndarray:
+            for step in steps:
+                frames = step(frames)
+            return frames
+
+        return convert
+
+    def _open_chunk(self, chunk_index: int) -> ChunkEncoder:
         """
-        Save audio chunk to WAV file
+        Start a new chunk file
         
         Args:
-            audio_data: Audio data as numpy array
             chunk_index: Index of the chunk
             
         Returns:
-            str: Path to saved file
+            ChunkEncoder: Encoder writing the chunk
         """
-        filename = f"{self.current_meeting_id}_chunk_{chunk_index}.wav"
-        filepath = os.path.join(self.data_dir, filename)
-        
-        # Convert float32 to int16
-        audio_int16 = (audio_data * 32767).astype(np.int16)
-        
-        # Save as WAV file
-        with wave.open(filepath, 'wb') as wf:
-            wf.setnchannels(self.channels)
-            wf.setsampwidth(2)  # 16-bit
-            wf.setframerate(self.sample_rate)
-            wf.writeframes(audio_int16.tobytes())
-        
-        return filepath
+        filename = f"{self.current_meeting_id}_{self.recording_id}_chunk_{chunk_index}"
+        encoder = create_encoder(self.encoding)
+        encoder.open(os.path.join(self.data_dir, filename), self.output_sample_rate, self.output_channels)
+        return encoder
+
+    @staticmethod
+    def _gate_segment(frames: np.ndarray, speech_mask: np.ndarray, time_map: list,
+                      source_offset: int, output_offset: int) -> np.ndarray:
+        """
+        Drop non-speech samples from a segment and record where the kept
+        spans came from
+
+        Args:
+            frames: Converted segment
+            speech_mask: Boolean mask from the voice activity detector
+            time_map: Chunk time map to extend, [output_start, source_start, length] in samples
+            source_offset: Position of the segment in the untrimmed chunk
+            output_offset: Samples already written to the trimmed chunk
+
+        Returns:
+            np.ndarray: Speech frames only
+        """
+        if speech_mask.all():
+            runs = [(0, len(frames))]
+            kept = frames
+        else:
+            runs = mask_runs(speech_mask)
+            kept = frames[speech_mask]
+
+        for start, end in runs:
+            source_start = source_offset + int(start)
+            length = int(end - start)
+            last = time_map[-1] if time_map else None
+            if last and last[0] + last[2] == output_offset and last[1] + last[2] == source_start:
+                last[2] += length  # Contiguous with the previous span
+            else:
+                time_map.append([output_offset, source_start, length])
+            output_offset += length
+
+        return kept
+
+    @staticmethod
+    def _drain_to_encoder(ring: AudioRingBuffer, encoder: ChunkEncoder,
+                          pcm: np.ndarray, scratch: np.ndarray):
+        """Convert buffered frames to int16 and hand them to the encoder"""
+        while ring.size > 0:
+            frames = min(ring.size, len(pcm))
+            encoder.write(float_to_int16(ring.views(frames), pcm, scratch))
+            ring.consume(frames)
     
     def get_status(self) -> dict:
         """
@@ -276,8 +940,22 @@ class AudioCaptureService:
             'is_recording': self.is_recording,
             'is_paused': self.is_paused,
             'meeting_id': self.current_meeting_id,
+            'recording_id': self.recording_id,
             'current_chunk': self.chunk_index,
             'chunk_duration': self.chunk_duration,
+            'min_chunk_seconds': self.min_chunk_seconds,
+            'output_format': self.output_format,
+            'encoding': self.encoding,
+            'vad_enabled': self.vad_enabled,
+            'chunks_skipped': self.chunks_skipped,
+            'streaming': {
+                'engine': self.streaming_transcriber.name,
+                'healthy': self.streaming_transcriber.healthy,
+                'error': self.streaming_transcriber.error
+            } if self.streaming_transcriber is not None else None,
+            'microphone': self.secondary_reader.get_status()
+            if self.is_recording and self.secondary_reader is not None else None,
+            'source_mix': self.source_mix,
             'selected_device_id': self.selected_device_id
         }
     
@@ -290,7 +968,10 @@ class AudioCaptureService:
             List[dict]: List of audio devices
         """
         devices = []
-        
+        if sc is None:
+            print(f"[AudioCapture] {SOUNDCARD_MISSING}")
+            return devices
+
         try:
             # Get all speakers (output devices)
             all_speakers = sc.all_speakers()
@@ -329,6 +1010,8 @@ class AudioCaptureService:
             dict: Test results
         """
         try:
+            if sc is None:
+                raise Exception(SOUNDCARD_MISSING)
             speakers = sc.default_speaker()
             
             print(f"[AudioCapture] Testing audio capture for {duration} seconds...")
@@ -344,7 +1027,7 @@ class AudioCaptureService:
                 'device': speakers.name,
                 'duration': duration,
                 'audio_level': float(audio_level),
-                'has_audio': audio_level > 0.001
+                'has_audio': bool(audio_level > 0.001)
             }
             
         except Exception as e:
@@ -354,11 +1037,142 @@ class AudioCaptureService:
             }
 
 
+class CaptureSessionManager:
+    """
+    Concurrent capture sessions keyed by meeting ID
+    Each session is its own AudioCaptureService with a recorder thread and
+    fixed-size buffers, so CPU and memory grow linearly with active sessions
+    """
+
+    def __init__(self, max_sessions: int = 8, **session_options):
+        """
+        Initialize session manager
+
+        Args:
+            max_sessions: Maximum number of concurrent recordings
+            **session_options: AudioCaptureService arguments for new sessions
+        """
+        self.max_sessions = max_sessions
+        self.session_options = session_options
+        self._sessions: Dict[str, AudioCaptureService] = {}
+        self._lock = threading.Lock()
+
+    def start(self, meeting_id: str, **recording_options) -> AudioCaptureService:
+        """
+        Start recording a meeting in a new session
+
+        Args:
+            meeting_id: Meeting to record
+            **recording_options: AudioCaptureService.start_recording arguments
+
+        Returns:
+            AudioCaptureService: The session
+
+        Raises:
+            Exception: If the meeting is already recording or the session limit is reached
+        """
+        with self._lock:
+            existing = self._sessions.get(meeting_id)
+            if existing is not None and existing.is_recording:
+                raise Exception(f"Recording already in progress for meeting {meeting_id}")
+            self._sessions.pop(meeting_id, None)  # Session whose recorder died
+            if len(self._sessions) >= self.max_sessions:
+                raise Exception(f"Maximum of {self.max_sessions} concurrent recordings reached")
+
+            # Reserved before starting, so a concurrent start for the same meeting fails
+            session = AudioCaptureService(**self.session_options)
+            self._sessions[meeting_id] = session
+
+        try:
+            session.start_recording(meeting_id, **recording_options)
+        except Exception:
+            with self._lock:
+                self._sessions.pop(meeting_id, None)
+            raise
+        return session
+
+    def get(self, meeting_id: str) -> Optional[AudioCaptureService]:
+        """Get the session recording a meeting"""
+        with self._lock:
+            return self._sessions.get(meeting_id)
+
+    def meeting_ids(self) -> List[str]:
+        """Get the meetings with a capture session"""
+        with self._lock:
+            return list(self._sessions)
+
+    def pause(self, meeting_id: str) -> dict:
+        """Pause a meeting's recording"""
+        session = self.get(meeting_id)
+        if session is None:
+            return {'success': False, 'error': 'No recording in progress'}
+        return session.pause_recording()
+
+    def resume(self, meeting_id: str) -> dict:
+        """Resume a meeting's recording"""
+        session = self.get(meeting_id)
+        if session is None:
+            return {'success': False, 'error': 'No recording in progress'}
+        return session.resume_recording()
+
+    def stop(self, meeting_id: str) -> dict:
+        """
+        Stop a meeting's recording and close its session
+
+        Returns:
+            dict: Summary of the recording session
+        """
+        session = self.get(meeting_id)
+        if session is None:
+            return {'success': False, 'error': 'No recording in progress'}
+        try:
+            return session.stop_recording()
+        finally:
+            with self._lock:
+                if self._sessions.get(meeting_id) is session:
+                    del self._sessions[meeting_id]
+
+    def stop_all(self) -> List[dict]:
+        """Stop every session"""
+        return [self.stop(meeting_id) for meeting_id in self.meeting_ids()]
+
+    def get_status(self, meeting_id: Optional[str] = None) -> Optional[dict]:
+        """
+        Get recording status
+
+        Args:
+            meeting_id: Session to report on (None = all sessions)
+
+        Returns:
+            Optional[dict]: Status of one session (None if it does not exist), or
+                all sessions. With exactly one session its fields are included at
+                the top level too, for single-session clients
+        """
+        if meeting_id is not None:
+            session = self.get(meeting_id)
+            return session.get_status() if session is not None else None
+
+        with self._lock:
+            sessions = list(self._sessions.values())
+        statuses = [session.get_status() for session in sessions]
+        status = statuses[0].copy() if len(statuses) == 1 else {
+            'is_recording': any(s['is_recording'] for s in statuses),
+            'is_paused': False,
+            'meeting_id': None,
+            'current_chunk': 0,
+            'chunk_duration': self.session_options.get('chunk_duration', 120),
+            'selected_device_id': None
+        }
+        status['sessions'] = statuses
+        status['max_sessions'] = self.max_sessions
+        return status
+
+
 # Global instance
-audio_service = AudioCaptureService()
+capture_manager = CaptureSessionManager()
 
 
-def get_audio_service() -> AudioCaptureService:
-    """Get the global audio service instance"""
-    return audio_service
+def get_capture_manager() -> CaptureSessionManager:
+    """Get the global capture session manager"""
+    return capture_manager
 
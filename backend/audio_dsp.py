@@ -0,0 +1,446 @@
+"""
+Audio DSP Helpers
+Vectorized NumPy routines used by the capture pipeline
+"""
+
+import numpy as np
+from math import gcd
+from bisect import bisect_right
+from typing import Optional
+
+
+def downmix(frames: np.ndarray) -> np.ndarray:
+    """
+    Downmix multi-channel audio to mono
+
+    Args:
+        frames: Array of shape (n, channels)
+
+    Returns:
+        np.ndarray: Array of shape (n, 1)
+    """
+    if frames.ndim == 1:
+        return frames.reshape(-1, 1)
+    if frames.shape[1] == 1:
+        return frames
+    return frames.mean(axis=1, keepdims=True, dtype=np.float32)
+
+
+class PolyphaseResampler:
+    """
+    Streaming rational-ratio resampler (windowed-sinc polyphase FIR)
+    Keeps filter history between calls, so audio can be fed segment by
+    segment and the output is identical to resampling it in one piece
+    """
+
+    def __init__(self, in_rate: int, out_rate: int, channels: int = 1,
+                 taps_per_phase: int = 32, beta: float = 8.0):
+        """
+        Initialize resampler
+
+        Args:
+            in_rate: Input sample rate in Hz
+            out_rate: Output sample rate in Hz
+            channels: Number of channels
+            taps_per_phase: FIR taps per polyphase branch (quality vs. CPU)
+            beta: Kaiser window shape parameter
+        """
+        divisor = gcd(in_rate, out_rate)
+        self.in_rate = in_rate
+        self.out_rate = out_rate
+        self.channels = channels
+        self.up = out_rate // divisor
+        self.down = in_rate // divisor
+        self.taps = taps_per_phase
+
+        # Low-pass prototype at the upsampled rate, cutoff at the lower Nyquist
+        num_taps = taps_per_phase * self.up
+        cutoff = 1.0 / max(self.up, self.down)
+        t = np.arange(num_taps) - (num_taps - 1) / 2
+        h = cutoff * np.sinc(cutoff * t) * np.kaiser(num_taps, beta)
+        h *= self.up / h.sum()  # Unity DC gain per phase
+
+        # phases[p, k] = h[k * up + p]
+        self._phases = h.reshape(taps_per_phase, self.up).T.astype(np.float32)
+        self._tap_offsets = np.arange(taps_per_phase)
+        self.reset()
+
+    def reset(self):
+        """Clear filter history (start of a new stream)"""
+        self._history = np.zeros((self.taps - 1, self.channels), dtype=np.float32)
+        self._in_count = 0
+        self._out_count = 0
+
+    def process(self, frames: np.ndarray) -> np.ndarray:
+        """
+        Resample the next block of audio
+
+        Args:
+            frames: Array of shape (n, channels) at in_rate
+
+        Returns:
+            np.ndarray: Array of shape (m, channels) at out_rate
+        """
+        if self.up == self.down:
+            return frames
+
+        buf = np.concatenate([self._history, frames.astype(np.float32, copy=False)])
+        total_in = self._in_count + len(frames)
+
+        # Every output m whose newest input sample floor(m * down / up) has arrived
+        out_end = (total_in * self.up + self.down - 1) // self.down
+        positions = np.arange(self._out_count, out_end) * self.down
+        base = positions // self.up
+        phase = positions % self.up
+
+        # Gather the FIR window of each output sample and apply its phase filter
+        buf_index = base - (self._in_count - (self.taps - 1))
+        windows = buf[buf_index[:, None] - self._tap_offsets[None, :]]  # (m, taps, channels)
+        out = np.einsum('mkc,mk->mc', windows, self._phases[phase]).astype(np.float32)
+
+        self._history = buf[len(buf) - (self.taps - 1):]
+        self._in_count = total_in
+        self._out_count = out_end
+        return out
+
+
+class VoiceActivityDetector:
+    """
+    Energy / zero-crossing voice activity detector with hangover
+    Classifies fixed-length frames as speech or silence. Frames near speech
+    are kept too (pre-roll and hangover), so word edges are not clipped
+    """
+
+    def __init__(self, sample_rate: int, frame_ms: int = 30,
+                 energy_threshold: float = 0.005, zcr_threshold: float = 0.25,
+                 hangover_ms: int = 400, preroll_ms: int = 150):
+        """
+        Initialize detector
+
+        Args:
+            sample_rate: Sample rate of the audio passed to process()
+            frame_ms: Analysis frame length in milliseconds
+            energy_threshold: RMS level (0-1) above which a frame is speech
+            zcr_threshold: Zero-crossing rate above which a quieter frame
+                (at least half the energy threshold) counts as unvoiced speech
+            hangover_ms: How long to stay active after speech ends
+            preroll_ms: How much audio to keep before speech starts
+        """
+        self.sample_rate = sample_rate
+        self.frame_len = max(1, sample_rate * frame_ms // 1000)
+        self.energy_threshold = energy_threshold
+        self.zcr_threshold = zcr_threshold
+        self.hangover_frames = hangover_ms // frame_ms
+        self.preroll_frames = preroll_ms // frame_ms
+        self.reset()
+
+    def reset(self):
+        """Clear hangover state (start of a new stream)"""
+        self._hangover_left = 0
+
+    def frame_features(self, frames: np.ndarray):
+        """
+        Compute per-frame RMS energy and zero-crossing rate
+
+        Args:
+            frames: Array of shape (n, channels) or (n,)
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: RMS and ZCR per frame (last frame zero-padded)
+        """
+        mono = downmix(frames)[:, 0]
+        count = -(-len(mono) // self.frame_len)
+        padded = np.zeros(count * self.frame_len, dtype=np.float32)
+        padded[:len(mono)] = mono
+        blocks = padded.reshape(count, self.frame_len)
+
+        rms = np.sqrt(np.mean(blocks * blocks, axis=1))
+        signs = np.signbit(blocks)
+        zcr = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / self.frame_len
+        return rms, zcr
+
+    def process(self, frames: np.ndarray) -> np.ndarray:
+        """
+        Classify a block of audio
+
+        Args:
+            frames: Array of shape (n, channels)
+
+        Returns:
+            np.ndarray: Boolean speech mask of length n (one entry per sample)
+        """
+        if len(frames) == 0:
+            return np.zeros(0, dtype=bool)
+        rms, zcr = self.frame_features(frames)
+        return self.classify(rms, zcr, len(frames))
+
+    def classify(self, rms: np.ndarray, zcr: np.ndarray, num_samples: int) -> np.ndarray:
+        """
+        Classify a block from precomputed frame features
+
+        Args:
+            rms: Per-frame RMS from frame_features()
+            zcr: Per-frame zero-crossing rate from frame_features()
+            num_samples: Number of samples in the block
+
+        Returns:
+            np.ndarray: Boolean speech mask of length num_samples
+        """
+        speech = (rms >= self.energy_threshold) | (
+            (rms >= self.energy_threshold / 2) & (zcr >= self.zcr_threshold)
+        )
+
+        # Dilate speech frames: preroll before, hangover after
+        window = np.ones(self.preroll_frames + self.hangover_frames + 1)
+        dilated = np.convolve(speech.astype(np.float32), window)
+        active = dilated[self.preroll_frames:self.preroll_frames + len(speech)] > 0
+
+        # Hangover carried over from the previous block
+        if self._hangover_left:
+            active[:self._hangover_left] = True
+
+        speech_idx = np.flatnonzero(speech)
+        if len(speech_idx):
+            self._hangover_left = max(0, self.hangover_frames - (len(speech) - 1 - speech_idx[-1]))
+        else:
+            self._hangover_left = max(0, self._hangover_left - len(speech))
+
+        return np.repeat(active, self.frame_len)[:num_samples]
+
+
+class AdaptiveChunker:
+    """
+    Decides where to close chunks
+    A chunk closes at the first pause after min_seconds, or at max_seconds
+    if nobody pauses, so cuts land between words instead of mid-word
+    """
+
+    def __init__(self, sample_rate: int, frame_len: int, min_seconds: float = 15,
+                 max_seconds: float = 120, pause_seconds: float = 0.6,
+                 energy_threshold: float = 0.005):
+        """
+        Initialize chunker
+
+        Args:
+            sample_rate: Sample rate of the audio being chunked
+            frame_len: Samples per analysis frame (matches the RMS passed in)
+            min_seconds: Minimum chunk length
+            max_seconds: Maximum chunk length
+            pause_seconds: Silence needed to count as a pause
+            energy_threshold: RMS level (0-1) below which a frame is silent
+        """
+        self.frame_len = frame_len
+        self.min_samples = int(min_seconds * sample_rate)
+        self.max_samples = int(max_seconds * sample_rate)
+        self.pause_frames = max(1, int(pause_seconds * sample_rate) // frame_len)
+        self.energy_threshold = energy_threshold
+        self.reset()
+
+    def reset(self):
+        """Start a new chunk"""
+        self.chunk_samples = 0
+        self._silent_run = 0  # Silent frames at the end of the audio seen so far
+
+    def find_cut(self, rms: np.ndarray, num_samples: int) -> Optional[int]:
+        """
+        Feed the next block and find where the current chunk should end
+
+        Args:
+            rms: Per-frame RMS of the block
+            num_samples: Number of samples in the block
+
+        Returns:
+            Optional[int]: Sample offset in the block where the chunk closes,
+                or None if the whole block belongs to the current chunk.
+                After a cut, call reset() and feed the remainder of the block
+        """
+        silent = rms < self.energy_threshold
+        idx = np.arange(len(silent))
+
+        # Length of the silent run ending at each frame, including the carry-over
+        last_loud = np.maximum.accumulate(np.where(silent, -1, idx))
+        run = idx - last_loud
+        run[last_loud < 0] += self._silent_run
+
+        frame_end = np.minimum((idx + 1) * self.frame_len, num_samples)
+        position = self.chunk_samples + frame_end
+        candidates = np.flatnonzero((run >= self.pause_frames) & (position >= self.min_samples))
+
+        cut = None
+        if len(candidates):
+            cut = int(frame_end[candidates[0]])
+        if self.chunk_samples + num_samples >= self.max_samples:
+            # Rounded up to a frame boundary so the caller's RMS frames stay
+            # aligned with the samples after the cut
+            forced = self.max_samples - self.chunk_samples
+            forced = min(-(-forced // self.frame_len) * self.frame_len, num_samples)
+            cut = forced if cut is None else min(cut, forced)
+
+        if cut is None:
+            self.chunk_samples += num_samples
+            self._silent_run = int(run[-1]) if len(run) else self._silent_run
+        return cut
+
+
+class DriftCompensator:
+    """
+    Keeps a secondary audio stream in step with the primary stream's clock
+    Two devices never run at exactly the same rate, so the secondary buffer
+    slowly fills or drains. Each pull takes slightly more or fewer input
+    frames than requested (within max_correction) and stretches them to the
+    requested length, steering the buffer back to its target fill
+    """
+
+    def __init__(self, target_frames: int, max_correction: float = 0.005, gain: float = 0.1):
+        """
+        Initialize compensator
+
+        Args:
+            target_frames: Frames that should remain buffered after each pull
+                (absorbs scheduling jitter between the two recorder threads)
+            max_correction: Maximum rate adjustment (0.005 = 0.5%)
+            gain: Fraction of the fill error corrected per pull
+        """
+        self.target_frames = target_frames
+        self.max_correction = max_correction
+        self.gain = gain
+        self.reset()
+
+    def reset(self):
+        """Forget the drift estimate (start of a new stream)"""
+        self.ratio = 1.0  # Smoothed secondary/primary rate
+        self.underruns = 0  # Pulls with too few frames buffered
+        self.resyncs = 0  # Pulls that dropped a backlog outright
+
+    @property
+    def drift_ppm(self) -> float:
+        """Estimated clock drift of the secondary stream in parts per million"""
+        return (self.ratio - 1.0) * 1e6
+
+    def plan(self, frames: int, buffered: int):
+        """
+        Decide how many buffered frames to consume for one pull
+
+        Args:
+            frames: Output frames requested
+            buffered: Frames currently buffered
+
+        Returns:
+            Tuple[int, int]: (frames to drop unused, frames to consume and stretch)
+        """
+        if buffered < frames:
+            self.underruns += 1
+            return 0, buffered
+
+        excess = buffered - frames - self.target_frames
+        dropped = 0
+        if excess > frames:
+            # Far behind (e.g. the primary stream stalled): resync instead of stretching
+            dropped = excess
+            excess = 0
+            self.resyncs += 1
+
+        correction = float(np.clip(self.gain * excess / frames, -self.max_correction, self.max_correction))
+        take = min(buffered - dropped, int(round(frames * (1.0 + correction))))
+        self.ratio += 0.05 * (take / frames - self.ratio)
+        return dropped, take
+
+    @staticmethod
+    def stretch(frames: np.ndarray, length: int) -> np.ndarray:
+        """
+        Linearly resample a block to exactly length frames
+
+        Args:
+            frames: Array of shape (n, channels)
+            length: Output length
+
+        Returns:
+            np.ndarray: Array of shape (length, channels); zero-padded at the
+                start if frames is shorter than length by more than a resampling step
+        """
+        n = len(frames)
+        if n == length:
+            return frames
+        if n < length * (1 - 0.01):
+            out = np.zeros((length, frames.shape[1]), dtype=np.float32)
+            out[length - n:] = frames
+            return out
+
+        positions = np.linspace(0, n - 1, length)
+        index = np.minimum(positions.astype(np.int64), n - 2)
+        frac = (positions - index)[:, None].astype(np.float32)
+        return frames[index] * (1 - frac) + frames[index + 1] * frac
+
+
+def mix_sources(primary: np.ndarray, secondary: np.ndarray, mode: str = 'mix') -> np.ndarray:
+    """
+    Combine two aligned sources
+
+    Args:
+        primary: Array of shape (n, channels)
+        secondary: Array of shape (n, 1)
+        mode: 'mix' sums the sources into primary's channels (clipped to [-1, 1]);
+            'separate' stacks them as two channels (primary downmixed first)
+
+    Returns:
+        np.ndarray: Combined frames
+    """
+    if mode == 'separate':
+        return np.concatenate([downmix(primary), secondary], axis=1)
+    mixed = primary + secondary  # Broadcasts the mono secondary over all channels
+    np.clip(mixed, -1.0, 1.0, out=mixed)
+    return mixed
+
+
+def mask_runs(mask: np.ndarray) -> np.ndarray:
+    """
+    Find runs of True in a boolean mask
+
+    Args:
+        mask: Boolean array
+
+    Returns:
+        np.ndarray: Array of shape (runs, 2) with [start, end) sample indices
+    """
+    edges = np.diff(np.concatenate([[False], mask, [False]]).astype(np.int8))
+    return np.column_stack([np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)])
+
+
+def remap_time(time_map, t: float) -> float:
+    """
+    Map a time in a trimmed chunk back to the time in the original audio
+
+    Args:
+        time_map: List of [output_start, source_start, duration] spans in seconds,
+            sorted by output_start (None = no trimming)
+        t: Time in the trimmed chunk (seconds)
+
+    Returns:
+        float: Time in the untrimmed chunk (seconds)
+    """
+    if not time_map:
+        return t
+    starts = [span[0] for span in time_map]
+    i = max(0, bisect_right(starts, t) - 1)
+    output_start, source_start, duration = time_map[i]
+    return source_start + min(max(t - output_start, 0.0), duration)
+
+
+def timeline_time(timeline, t: float) -> float:
+    """
+    Map a position in recorded audio to the time since recording started,
+    adding the pauses before it
+
+    Args:
+        timeline: List of [audio_start, time_start] pairs in seconds, one per
+            stretch of uninterrupted recording, sorted by audio_start
+        t: Seconds of recorded audio (pauses excluded)
+
+    Returns:
+        float: Seconds since the recording started (pauses included)
+    """
+    if not timeline:
+        return t
+    i = max(0, bisect_right([span[0] for span in timeline], t) - 1)
+    audio_start, time_start = timeline[i]
+    return time_start + t - audio_start
@@ -0,0 +1,325 @@
+"""
+Chunk Encoders
+Streaming writers that encode audio chunks while they are being captured
+"""
+
+import os
+import wave
+import numpy as np
+from typing import Optional
+
+try:
+    import soundfile as sf
+except (ImportError, OSError):  # FLAC/Opus support is optional
+    sf = None
+
+
+class ChunkEncoder:
+    """
+    Base class for streaming chunk encoders
+    Audio is written in blocks to a temp file; close() finalizes it and
+    moves it into place, so readers never see a partial chunk
+    """
+
+    name = 'base'
+    extension = ''
+
+    def __init__(self):
+        self.path: Optional[str] = None
+        self._tmp_path: Optional[str] = None
+        self.frames_written = 0
+
+    @classmethod
+    def check_format(cls, sample_rate: int, channels: int):
+        """
+        Check that the encoding can store this audio format
+
+        Raises:
+            ValueError: If it cannot
+        """
+
+    def open(self, path_without_ext: str, sample_rate: int, channels: int):
+        """
+        Start a new chunk file
+
+        Args:
+            path_without_ext: Destination path; the encoder adds its extension
+            sample_rate: Sample rate in Hz
+            channels: Number of channels
+        """
+        self.path = path_without_ext + self.extension
+        self._tmp_path = self.path + '.tmp'
+        self.frames_written = 0
+        self._open(self._tmp_path, sample_rate, channels)
+
+    def write(self, pcm: np.ndarray):
+        """
+        Encode a block of 16-bit PCM frames
+
+        Args:
+            pcm: int16 array of shape (n, channels)
+        """
+        self._write(pcm)
+        self.frames_written += len(pcm)
+
+    def flush(self):
+        """
+        Make the audio written so far durable in the temp file, so a partial
+        chunk can be recovered with recover_partial() if the process dies
+        """
+        self._flush()
+
+    def close(self) -> str:
+        """
+        Finish the chunk file
+
+        Returns:
+            str: Path to the finished file
+        """
+        self._close()
+        os.replace(self._tmp_path, self.path)
+        return self.path
+
+    def abort(self):
+        """Discard the chunk being written"""
+        try:
+            self._close()
+        except Exception:
+            pass
+        if self._tmp_path and os.path.exists(self._tmp_path):
+            os.remove(self._tmp_path)
+
+    def _open(self, path: str, sample_rate: int, channels: int):
+        raise NotImplementedError
+
+    def _write(self, pcm: np.ndarray):
+        raise NotImplementedError
+
+    def _flush(self):
+        raise NotImplementedError
+
+    def _close(self):
+        raise NotImplementedError
+
+
+class WavEncoder(ChunkEncoder):
+    """Uncompressed 16-bit PCM WAV"""
+
+    name = 'wav'
+    extension = '.wav'
+
+    def _open(self, path: str, sample_rate: int, channels: int):
+        # Opened here so flush() can fsync it; wave leaves closing it to us
+        self._file = open(path, 'wb')
+        self._wf = wave.open(self._file, 'wb')
+        self._wf.setnchannels(channels)
+        self._wf.setsampwidth(2)  # 16-bit
+        self._wf.setframerate(sample_rate)
+
+    def _write(self, pcm: np.ndarray):
+        # Passed as a buffer, avoiding a tobytes() copy. wave patches the
+        # header after each write, so the temp file is always a valid WAV
+        self._wf.writeframes(pcm)
+
+    def _flush(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def _close(self):
+        try:
+            self._wf.close()
+        finally:
+            self._file.close()
+
+
+class SoundFileEncoder(ChunkEncoder):
+    """
+    Compressed formats written through libsndfile (requires soundfile)
+    libsndfile holds back encoded frames until its buffers fill (about a
+    second of audio, and whole short chunks), so flushing cannot make the
+    compressed file complete. The PCM is also journaled to a WAV file next
+    to it, which flush() makes durable and recover_partial() reads instead
+    """
+
+    sf_format = ''
+    sf_subtype = ''
+
+    def _open(self, path: str, sample_rate: int, channels: int):
+        if sf is None:
+            raise Exception(f"{self.name} encoding requires the soundfile package")
+        # Opened here so flush() can fsync it
+        self._file = open(path, 'wb')
+        try:
+            self._sf = sf.SoundFile(
+                self._file, 'w', samplerate=sample_rate, channels=channels,
+                format=self.sf_format, subtype=self.sf_subtype
+            )
+        except Exception:
+            self._file.close()
+            raise
+        self._pcm = WavEncoder()
+        self._pcm._open(_pcm_journal_path(path), sample_rate, channels)
+
+    def _write(self, pcm: np.ndarray):
+        self._sf.write(pcm)
+        self._pcm._write(pcm)
+
+    def _flush(self):
+        self._sf.flush()
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._pcm._flush()
+
+    def _close(self):
+        try:
+            self._sf.close()
+        finally:
+            self._file.close()
+            self._pcm._close()
+            os.remove(_pcm_journal_path(self._file.name))
+
+
+class FlacEncoder(SoundFileEncoder):
+    """Lossless FLAC"""
+
+    name = 'flac'
+    extension = '.flac'
+    sf_format = 'FLAC'
+    sf_subtype = 'PCM_16'
+
+
+class OpusEncoder(SoundFileEncoder):
+    """Opus in an Ogg container (lossy, smallest)"""
+
+    name = 'opus'
+    extension = '.ogg'
+    sf_format = 'OGG'
+    sf_subtype = 'OPUS'
+    sample_rates = (8000, 12000, 16000, 24000, 48000)
+
+    @classmethod
+    def check_format(cls, sample_rate: int, channels: int):
+        if sample_rate not in cls.sample_rates:
+            raise ValueError(f"Opus does not support {sample_rate} Hz; use the 'speech' output format")
+
+    def _open(self, path: str, sample_rate: int, channels: int):
+        self.check_format(sample_rate, channels)
+        super()._open(path, sample_rate, channels)
+
+
+ENCODERS = {
+    'wav': WavEncoder,
+    'flac': FlacEncoder,
+    'opus': OpusEncoder,
+}
+
+
+def available_encodings() -> list:
+    """List encodings usable in this environment"""
+    if sf is None:
+        return ['wav']
+    return list(ENCODERS)
+
+
+def _pcm_journal_path(tmp_path: str) -> str:
+    """Path of the PCM journal kept next to a compressed temp file"""
+    return tmp_path + '.wav'
+
+
+def _read_partial(path: str, extension: str):
+    """
+    Decode as much of an unfinished chunk file as is readable
+
+    Returns:
+        Tuple[int, int, np.ndarray]: Sample rate, channels and int16 frames
+    """
+    if extension != WavEncoder.extension and os.path.exists(_pcm_journal_path(path)):
+        return _read_partial(_pcm_journal_path(path), WavEncoder.extension)
+
+    if extension == WavEncoder.extension:
+        with wave.open(path, 'rb') as wf:
+            rate, channels = wf.getframerate(), wf.getnchannels()
+            data = wf.readframes(wf.getnframes())
+        frame_bytes = 2 * channels
+        pcm = np.frombuffer(data[:len(data) // frame_bytes * frame_bytes], dtype=np.int16)
+        return rate, channels, pcm.reshape(-1, channels)
+
+    if sf is None:
+        raise Exception("Reading compressed chunks requires the soundfile package")
+    blocks = []
+    with sf.SoundFile(path) as f:
+        rate, channels = f.samplerate, f.channels
+        try:
+            while True:
+                block = f.read(rate, dtype='int16', always_2d=True)
+                if not len(block):
+                    break
+                blocks.append(block)
+        except RuntimeError:
+            pass  # Truncated last frame; keep what decoded
+    pcm = np.concatenate(blocks) if blocks else np.empty((0, channels), dtype=np.int16)
+    return rate, channels, pcm
+
+
+def recover_partial(path: str) -> int:
+    """
+    Finish a chunk whose encoder never closed (the process stopped mid-chunk)
+    The readable audio of the temp file (path + '.tmp') is re-encoded to path
+    and the temp file is removed. Everything written before the last flush()
+    is recovered; compressed chunks are read from their PCM journal
+
+    Args:
+        path: Final chunk path, as ChunkEncoder.path
+
+    Returns:
+        int: Frames recovered (0 if the temp file is missing or unreadable)
+    """
+    tmp_path = path + '.tmp'
+    if not os.path.exists(tmp_path):
+        return 0
+
+    extension = os.path.splitext(path)[1]
+    encoders = {cls.extension: cls for cls in ENCODERS.values()}
+    try:
+        rate, channels, pcm = _read_partial(tmp_path, extension)
+        if len(pcm):
+            # Decoded into memory first; the encoder rewrites the same temp file
+            encoder = encoders[extension]()
+            encoder.open(path[:-len(extension)], rate, channels)
+            encoder.write(pcm)
+            encoder.close()
+    except Exception as e:
+        print(f"[Encoders] Could not recover {tmp_path}: {e}")
+        pcm = ()
+
+    for leftover in (tmp_path, _pcm_journal_path(tmp_path)):
+        if os.path.exists(leftover):
+            os.remove(leftover)
+    return len(pcm)
+
+
+def check_encoding(encoding: str, sample_rate: int, channels: int):
+    """
+    Check that an encoding exists and can store an audio format
+
+    Raises:
+        ValueError: If the encoding is unknown or cannot store the format
+    """
+    if encoding not in ENCODERS:
+        raise ValueError(f"Unknown encoding: {encoding}")
+    ENCODERS[encoding].check_format(sample_rate, channels)
+
+
+def create_encoder(encoding: str) -> ChunkEncoder:
+    """
+    Create an encoder by name
+
+    Args:
+        encoding: A key of ENCODERS
+
+    Returns:
+        ChunkEncoder: New encoder instance
+    """
+    if encoding not in ENCODERS:
+        raise ValueError(f"Unknown encoding: {encoding}")
+    return ENCODERS[encoding]()
@@ -0,0 +1,158 @@
+"""
+Background Jobs
+Runs slow request work (LLM analysis, audio tests) on a worker pool so
+request threads return immediately; clients poll /api/jobs/<id>
+"""
+
+import threading
+import queue
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from typing import Optional, Callable
+
+from metrics import get_metrics
+
+
+metrics = get_metrics()
+
+JOB_SECONDS = metrics.histogram(
+    'fomo_job_seconds', 'Time background jobs take to run, by type and outcome')
+
+JOB_STATES = ('queued', 'running', 'succeeded', 'failed')
+
+
+class JobRunner:
+    """
+    Fixed pool of worker threads running submitted jobs
+    - Bounded queue: submit() raises queue.Full instead of blocking a request
+    - Jobs with the same key share one run while it is queued or running
+    - Finished jobs are kept for result polling up to max_finished
+    """
+
+    def __init__(self, workers: int = 4, max_queue: int = 64, max_finished: int = 1000):
+        """
+        Initialize job runner
+
+        Args:
+            workers: Number of worker threads
+            max_queue: Maximum number of jobs waiting for a worker
+            max_finished: Finished jobs kept for polling (oldest are dropped)
+        """
+        self.workers = workers
+        self.max_queue = max_queue
+        self.max_finished = max_finished
+
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._lock = threading.Lock()
+        self._jobs: OrderedDict = OrderedDict()
+        self._active_keys = {}
+
+        self._threads = []
+        for i in range(workers):
+            thread = threading.Thread(target=self._worker_loop, name=f'job-worker-{i}', daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def submit(self, job_type: str, run: Callable[[], object], key: Optional[str] = None,
+               **meta) -> dict:
+        """
+        Queue a job
+
+        Args:
+            job_type: Job name (e.g. 'analyze')
+            run: Function returning the JSON-serializable result; raises on failure
+            key: Jobs with the same key are not run twice at the same time;
+                while one is queued or running, it is returned instead
+            **meta: Extra fields shown in the job status (e.g. meetingId)
+
+        Returns:
+            dict: Job status
+
+        Raises:
+            queue.Full: If too many jobs are waiting
+        """
+        with self._lock:
+            if key is not None and key in self._active_keys:
+                return self._public(self._jobs[self._active_keys[key]])
+
+            job = {
+                'id': uuid.uuid4().hex,
+                'type': job_type,
+                'status': 'queued',
+                'createdAt': datetime.now().isoformat(),
+                'startedAt': None,
+                'finishedAt': None,
+                'result': None,
+                'error': None,
+                **meta,
+                '_run': run,
+                '_key': key,
+            }
+            self._queue.put_nowait(job['id'])
+            self._jobs[job['id']] = job
+            if key is not None:
+                self._active_keys[key] = job['id']
+            return self._public(job)
+
+    def get(self, job_id: str) -> Optional[dict]:
+        """
+        Get the status of a job
+
+        Returns:
+            Optional[dict]: Job status (with result or error once finished), or None
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return self._public(job) if job else None
+
+    def _worker_loop(self):
+        """Take jobs from the queue and run them"""
+        while True:
+            job_id = self._queue.get()
+            with self._lock:
+                job = self._jobs[job_id]
+                job['status'] = 'running'
+                job['startedAt'] = datetime.now().isoformat()
+                run = job.pop('_run')
+
+            started = time.perf_counter()
+            try:
+                result, error, status = run(), None, 'succeeded'
+            except Exception as e:
+                print(f"[Jobs] {job['type']} job {job_id} failed: {e}")
+                result, error, status = None, str(e), 'failed'
+            JOB_SECONDS.observe(time.perf_counter() - started, type=job['type'], outcome=status)
+
+            with self._lock:
+                job.update(status=status, result=result, error=error,
+                           finishedAt=datetime.now().isoformat())
+                if job['_key'] is not None:
+                    self._active_keys.pop(job['_key'], None)
+                self._prune()
+            self._queue.task_done()
+
+    def _prune(self):
+        """Drop the oldest finished jobs beyond max_finished (lock held)"""
+        finished = [job_id for job_id, job in self._jobs.items()
+                    if job['status'] in ('succeeded', 'failed')]
+        for job_id in finished[:max(len(finished) - self.max_finished, 0)]:
+            del self._jobs[job_id]
+
+    @staticmethod
+    def _public(job: dict) -> dict:
+        return {k: v for k, v in job.items() if not k.startswith('_')}
+
+    def get_status(self) -> dict:
+        """
+        Get runner status
+
+        Returns:
+            dict: Worker count and number of jobs per state
+        """
+        with self._lock:
+            counts = {state: 0 for state in JOB_STATES}
+            for job in self._jobs.values():
+                counts[job['status']] += 1
+            return {'workers': self.workers, 'queue_capacity': self.max_queue, **counts}
@@ -0,0 +1,557 @@
+"""
+GitHub Client
+Issue creation over pooled keep-alive connections, with a concurrency limit,
+rate-limit handling and an idempotent issue mapping
+"""
+
+import http.client
+import json
+import queue
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, List
+from urllib.parse import urlsplit, parse_qs
+
+from metrics import get_metrics
+
+
+metrics = get_metrics()
+
+GITHUB_REQUEST_SECONDS = metrics.histogram(
+    'fomo_github_request_seconds', 'Time of GitHub API requests, including rate-limit waits, by outcome')
+GITHUB_RATE_LIMIT_WAITS = metrics.counter(
+    'fomo_github_rate_limit_waits_total', 'Times GitHub requests paused for a rate limit, by kind')
+
+
+class GitHubError(Exception):
+    """
+    Raised when a GitHub request fails
+
+    Attributes:
+        status: HTTP status (None for connection errors)
+        created: Whether the request may still have created something
+            (connection lost or server error after sending it)
+    """
+
+    def __init__(self, message: str, status: Optional[int] = None, created: bool = False):
+        super().__init__(message)
+        self.status = status
+        self.created = created
+
+
+# Methods safe to send again when the outcome of an attempt is unknown
+IDEMPOTENT_METHODS = ('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE')
+
+
+def issue_marker(key: str) -> str:
+    """Hidden marker added to an issue body to find the issue again after a crash"""
+    return f'<!-- fomo-action-item: {key} -->'
+
+
+class GitHubClient:
+    """
+    Minimal GitHub REST client for creating issues
+    - Up to max_connections keep-alive connections are reused across requests;
+      requests beyond that wait for a free connection (concurrency limit)
+    - Primary (X-RateLimit-*) and secondary (Retry-After, "secondary rate limit")
+      limits pause every request of the client until the limit resets
+    - Server and connection errors of idempotent requests are retried with
+      exponential backoff; a POST is never sent twice by request(), since the
+      first attempt may have created something (see create_issue)
+    - With a mapping store, each issue key is created at most once
+    """
+
+    def __init__(self, base_url: str = 'https://api.github.com',
+                 mapping=None,
+                 max_connections: int = 4,
+                 timeout: float = 30,
+                 max_retries: int = 3,
+                 backoff_base: float = 1.0,
+                 secondary_backoff: float = 60.0,
+                 max_wait: float = 120.0):
+        """
+        Initialize GitHub client
+
+        Args:
+            base_url: API root (a local stand-in server for testing)
+            mapping: Issue mapping store with claim_github_issue, record_github_issue
+                and release_github_issue (see MeetingStore); None disables idempotency
+            max_connections: Pooled connections, and so concurrent requests
+            timeout: Socket timeout per request in seconds
+            max_retries: Retries per request for rate limits, and for server and
+                connection errors of idempotent requests; create_issue also
+                retries creation up to this often, looking the issue up first
+            backoff_base: Initial retry delay in seconds (doubled per attempt)
+            secondary_backoff: Initial pause after a secondary rate limit without Retry-After
+            max_wait: Longest rate-limit pause; a longer reset fails the request instead
+        """
+        self.base_url = base_url.rstrip('/')
+        self.mapping = mapping
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.secondary_backoff = secondary_backoff
+        self.max_wait = max_wait
+
+        parts = urlsplit(self.base_url)
+        self._scheme = parts.scheme
+        self._host = parts.netloc
+        self._path_prefix = parts.path
+
+        # None placeholders are connected on first use
+        self._pool = queue.LifoQueue()
+        for _ in range(max_connections):
+            self._pool.put(None)
+
+        self._lock = threading.Lock()
+        self._blocked_until = 0.0
+        self._rate_limit = {}
+        self._in_flight = set()
+
+    # ============ Transport ============
+
+    def _new_connection(self) -> http.client.HTTPConnection:
+        if self._scheme == 'https':
+            return http.client.HTTPSConnection(self._host, timeout=self.timeout)
+        return http.client.HTTPConnection(self._host, timeout=self.timeout)
+
+    def _wait_for_rate_limit(self):
+        """Sleep while the client is paused by a rate limit"""
+        with self._lock:
+            wait = self._blocked_until - time.time()
+        if wait > self.max_wait:
+            raise GitHubError(f"GitHub rate limit resets in {wait:.0f}s", status=403)
+        if wait > 0:
+            time.sleep(wait)
+
+    def _block(self, seconds: float, kind: str):
+        """Pause all requests for seconds"""
+        GITHUB_RATE_LIMIT_WAITS.inc(kind=kind)
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.time() + seconds)
+
+    def _note_rate_limit(self, headers) -> Optional[float]:
+        """
+        Record X-RateLimit-* headers and pause when the quota is used up
+
+        Returns:
+            Optional[float]: Seconds until the quota resets, if it is exhausted
+        """
+        remaining = headers.get('X-RateLimit-Remaining')
+        reset = headers.get('X-RateLimit-Reset')
+        if remaining is None:
+            return None
+        with self._lock:
+            self._rate_limit = {
+                'limit': headers.get('X-RateLimit-Limit'),
+                'remaining': int(remaining),
+                'reset': int(reset) if reset else None,
+            }
+        if int(remaining) > 0 or not reset:
+            return None
+        wait = max(int(reset) - time.time(), 0) + 1
+        self._block(wait, 'primary')
+        return wait
+
+    def request(self, method: str, path: str, token: str, body: Optional[dict] = None):
+        """
+        Send an API request, waiting out rate limits and retrying transient errors
+        Rate-limited requests were rejected and are always retried. Connection
+        and server errors are only retried for idempotent methods; for others
+        the request may have taken effect, so GitHubError(created=True) is raised
+
+        Args:
+            method: HTTP method
+            path: Path below the API root, including any query string
+            token: GitHub token
+            body: JSON body
+
+        Returns:
+            Decoded JSON response
+
+        Raises:
+            GitHubError: If the request failed
+        """
+        headers = {
+            'Accept': 'application/vnd.github+json',
+            'Authorization': f'Bearer {token}',
+            'User-Agent': 'fomo-backend',
+            'X-GitHub-Api-Version': '2022-11-28',
+        }
+        payload = None
+        if body is not None:
+            payload = json.dumps(body).encode('utf-8')
+            headers['Content-Type'] = 'application/json'
+
+        idempotent = method in IDEMPOTENT_METHODS
+        started = time.perf_counter()
+        outcome = 'error'
+        try:
+            for attempt in range(self.max_retries + 1):
+                last_attempt = attempt == self.max_retries
+                self._wait_for_rate_limit()
+
+                conn = self._pool.get()
+                try:
+                    if conn is None:
+                        conn = self._new_connection()
+                    conn.request(method, self._path_prefix + path, body=payload, headers=headers)
+                    response = conn.getresponse()
+                    data = response.read()
+                except (http.client.HTTPException, OSError) as e:
+                    # Stale keep-alive connection or network error; the request may have arrived
+                    conn.close()
+                    conn = None
+                    if last_attempt or not idempotent:
+                        raise GitHubError(f"GitHub request failed: {e}", created=not idempotent)
+                    time.sleep(self._backoff(attempt))
+                    continue
+                finally:
+                    self._pool.put(conn)
+
+                status = response.status
+                reset_wait = self._note_rate_limit(response.headers)
+                if status < 300:
+                    outcome = 'ok'
+                    return json.loads(data) if data else None
+
+                message = self._error_message(data)
+                if status in (403, 429):
+                    retry_after = response.headers.get('Retry-After')
+                    if retry_after is not None:
+                        self._block(float(retry_after), 'secondary')
+                    elif reset_wait is None and 'rate limit' in message.lower():
+                        self._block(self.secondary_backoff * (2 ** attempt), 'secondary')
+                    elif reset_wait is None:
+                        raise GitHubError(f"GitHub error {status}: {message}", status=status)
+                    if last_attempt:
+                        raise GitHubError(f"GitHub rate limit: {message}", status=status)
+                    continue
+
+                if status >= 500 and idempotent and not last_attempt:
+                    time.sleep(self._backoff(attempt))
+                    continue
+                raise GitHubError(f"GitHub error {status}: {message}", status=status,
+                                  created=status >= 500 and not idempotent)
+        finally:
+            GITHUB_REQUEST_SECONDS.observe(time.perf_counter() - started, outcome=outcome)
+
+    def _backoff(self, attempt: int) -> float:
+        return self.backoff_base * (2 ** attempt) * random.uniform(0.8, 1.2)
+
+    @staticmethod
+    def _error_message(data: bytes) -> str:
+        try:
+            return json.loads(data).get('message', '')
+        except (ValueError, AttributeError):
+            return data.decode('utf-8', 'replace')[:200]
+
+    def close(self):
+        """Close the pooled connections"""
+        for _ in range(self.max_connections):
+            conn = self._pool.get()
+            if conn is not None:
+                conn.close()
+        for _ in range(self.max_connections):
+            self._pool.put(None)
+
+    # ============ Issues ============
+
+    def find_issue(self, token: str, repo: str, key: str, since: float) -> Optional[dict]:
+        """
+        Find the issue created for key (by its body marker) among the issues
+        updated since a time
+
+        Args:
+            token: GitHub token
+            repo: owner/name
+            key: Issue key
+            since: Epoch seconds before the issue could have been created
+
+        Returns:
+            Optional[dict]: The issue, or None
+        """
+        marker = issue_marker(key)
+        since_iso = datetime.fromtimestamp(since, tz=timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+        for page in range(1, 11):
+            issues = self.request(
+                'GET', f'/repos/{repo}/issues?state=all&since={since_iso}&per_page=100&page={page}', token
+            ) or []
+            for issue in issues:
+                if marker in (issue.get('body') or ''):
+                    return issue
+            if len(issues) < 100:
+                return None
+        return None
+
+    def create_issue(self, token: str, repo: str, key: str, title: str,
+                     body: str = '', labels: Optional[List[str]] = None) -> dict:
+        """
+        Create an issue once per key
+        An issue already recorded for the key is returned as is; one whose
+        creation was interrupted is looked up on GitHub before creating it again
+
+        Args:
+            token: GitHub token
+            repo: owner/name
+            key: Idempotency key (stable across retries)
+            title: Issue title
+            body: Issue body (a hidden marker with the key is appended)
+            labels: Issue labels
+
+        Returns:
+            dict: number, url and repository of the issue
+
+        Raises:
+            GitHubError: If the issue could not be created
+        """
+        with self._lock:
+            if (repo, key) in self._in_flight:
+                raise GitHubError(f"Issue for {key} is already being created")
+            self._in_flight.add((repo, key))
+        try:
+            since = time.time() - 60
+            claim = self.mapping.claim_github_issue(repo, key) if self.mapping else None
+            if claim and claim['state'] == 'created':
+                return self._issue_info(repo, claim['number'], claim['url'])
+
+            issue = None
+            if claim:
+                # An earlier attempt may have created it before failing
+                since = claim['claimed_at'] - 60
+                issue = self.find_issue(token, repo, key, since)
+
+            request = {'title': title, 'body': f'{body}\n\n{issue_marker(key)}'.lstrip()}
+            if labels:
+                request['labels'] = labels
+            attempt = 0
+            while issue is None:
+                try:
+                    issue = self.request('POST', f'/repos/{repo}/issues', token, request)
+                except GitHubError as e:
+                    if not e.created:
+                        if self.mapping:
+                            self.mapping.release_github_issue(repo, key)
+                        raise
+                    if attempt == self.max_retries:
+                        raise  # Claim kept: the next call looks the issue up first
+                    # The POST may have gone through; only send it again if no issue has the marker
+                    print(f"[GitHub] Creating issue for {key} failed ({e}), checking before retrying")
+                    time.sleep(self._backoff(attempt))
+                    attempt += 1
+                    issue = self.find_issue(token, repo, key, since)
+
+            if self.mapping:
+                self.mapping.record_github_issue(repo, key, issue['number'], issue['html_url'])
+            return self._issue_info(repo, issue['number'], issue['html_url'])
+        finally:
+            with self._lock:
+                self._in_flight.discard((repo, key))
+
+    def create_issues(self, token: str, repo: str, issues: List[dict],
+                      concurrency: Optional[int] = None) -> List[dict]:
+        """
+        Create several issues concurrently
+
+        Args:
+            token: GitHub token
+            repo: owner/name
+            issues: Dicts with key, title and optionally body and labels
+            concurrency: Parallel requests (default: max_connections)
+
+        Returns:
+            List[dict]: Per issue, in order: {'issue': ...} or {'error': message}
+        """
+        def create(issue):
+            try:
+                return {'issue': self.create_issue(
+                    token, repo, issue['key'], issue['title'], issue.get('body', ''), issue.get('labels')
+                )}
+            except GitHubError as e:
+                return {'error': str(e)}
+
+        if not issues:
+            return []
+        workers = min(concurrency or self.max_connections, len(issues))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='github') as executor:
+            return list(executor.map(create, issues))
+
+    @staticmethod
+    def _issue_info(repo: str, number: int, url: str) -> dict:
+        return {'number': number, 'url': url, 'repository': repo}
+
+    def get_status(self) -> dict:
+        """
+        Get client status
+
+        Returns:
+            dict: Last seen rate limit and the remaining pause
+        """
+        with self._lock:
+            return {
+                'rate_limit': dict(self._rate_limit),
+                'paused_seconds': max(self._blocked_until - time.time(), 0),
+                'in_flight': len(self._in_flight),
+            }
+
+
+# ============ Local Stand-in Server ============
+
+class StandInGitHubServer:
+    """
+    In-memory imitation of the GitHub issues API for local runs and load tests
+    Supports creating and listing issues, a primary rate limit per window and
+    injected secondary rate limits, server errors, lost responses and latency
+    """
+
+    def __init__(self, port: int = 0, rate_limit: int = 5000, rate_window: float = 3600,
+                 secondary_every: int = 0, error_rate: float = 0.0, latency_ms: float = 0,
+                 lost_response_rate: float = 0.0):
+        """
+        Initialize stand-in server
+
+        Args:
+            port: Port to listen on (0 = any free port)
+            rate_limit: Requests allowed per window
+            rate_window: Rate-limit window in seconds
+            secondary_every: Answer every n-th issue creation with a secondary limit (0 = never)
+            error_rate: Probability (0-1) of a 502 response
+            latency_ms: Delay added to every response
+            lost_response_rate: Probability (0-1) that an issue is created but
+                answered with a 502 (e.g. a proxy timing out)
+        """
+        self.rate_limit = rate_limit
+        self.rate_window = rate_window
+        self.secondary_every = secondary_every
+        self.error_rate = error_rate
+        self.latency_ms = latency_ms
+        self.lost_response_rate = lost_response_rate
+
+        self.issues = {}
+        self.requests = 0
+        self._creates = 0
+        self._window_start = time.time()
+        self._window_used = 0
+        self._lock = threading.Lock()
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                server._handle(self)
+
+            def do_POST(self):
+                server._handle(self)
+
+            def log_message(self, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(('127.0.0.1', port), Handler)
+        self._httpd.daemon_threads = True
+        self.url = f'http://127.0.0.1:{self._httpd.server_address[1]}'
+
+    def start(self) -> str:
+        """Serve in a background thread; returns the base URL"""
+        threading.Thread(target=self._httpd.serve_forever, name='github-stand-in', daemon=True).start()
+        return self.url
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def _handle(self, handler: BaseHTTPRequestHandler):
+        length = int(handler.headers.get('Content-Length') or 0)
+        body = json.loads(handler.rfile.read(length)) if length else None
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+
+        with self._lock:
+            self.requests += 1
+            now = time.time()
+            if now - self._window_start >= self.rate_window:
+                self._window_start, self._window_used = now, 0
+            self._window_used += 1
+            headers = {
+                'X-RateLimit-Limit': str(self.rate_limit),
+                'X-RateLimit-Remaining': str(max(self.rate_limit - self._window_used, 0)),
+                'X-RateLimit-Reset': str(int(self._window_start + self.rate_window)),
+            }
+            if self._window_used > self.rate_limit:
+                return self._respond(handler, 403, {'message': 'API rate limit exceeded'}, headers)
+
+            if random.random() < self.error_rate:
+                return self._respond(handler, 502, {'message': 'Bad gateway'}, headers)
+
+            path = urlsplit(handler.path)
+            parts = path.path.strip('/').split('/')
+            if len(parts) != 4 or parts[0] != 'repos' or parts[3] != 'issues':
+                return self._respond(handler, 404, {'message': 'Not Found'}, headers)
+            repo = f'{parts[1]}/{parts[2]}'
+
+            if handler.command == 'POST':
+                self._creates += 1
+                if self.secondary_every and self._creates % self.secondary_every == 0:
+                    headers['Retry-After'] = '1'
+                    return self._respond(handler, 403, {
+                        'message': 'You have exceeded a secondary rate limit'
+                    }, headers)
+                issues = self.issues.setdefault(repo, [])
+                issue = {
+                    'number': len(issues) + 1,
+                    'title': body.get('title'),
+                    'body': body.get('body'),
+                    'labels': body.get('labels', []),
+                    'html_url': f'https://github.com/{repo}/issues/{len(issues) + 1}',
+                    'updated_at': datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
+                }
+                issues.append(issue)
+                if random.random() < self.lost_response_rate:
+                    return self._respond(handler, 502, {'message': 'Bad gateway'}, headers)
+                return self._respond(handler, 201, issue, headers)
+
+            query = parse_qs(path.query)
+            per_page = int(query.get('per_page', ['30'])[0])
+            page = int(query.get('page', ['1'])[0])
+            since = query.get('since', [''])[0]
+            issues = [i for i in reversed(self.issues.get(repo, [])) if i['updated_at'] >= since]
+            return self._respond(handler, 200, issues[(page - 1) * per_page:page * per_page], headers)
+
+    @staticmethod
+    def _respond(handler: BaseHTTPRequestHandler, status: int, data, headers: dict):
+        payload = json.dumps(data).encode('utf-8')
+        handler.send_response(status)
+        handler.send_header('Content-Type', 'application/json')
+        handler.send_header('Content-Length', str(len(payload)))
+        for name, value in headers.items():
+            handler.send_header(name, value)
+        handler.end_headers()
+        handler.wfile.write(payload)
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Run a local stand-in for the GitHub issues API')
+    parser.add_argument('--port', type=int, default=8787)
+    parser.add_argument('--rate-limit', type=int, default=5000, help='Requests per window')
+    parser.add_argument('--rate-window', type=float, default=3600, help='Window in seconds')
+    parser.add_argument('--secondary-every', type=int, default=0,
+                        help='Answer every n-th issue creation with a secondary rate limit')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Probability of a 502')
+    parser.add_argument('--latency-ms', type=float, default=0)
+    parser.add_argument('--lost-response-rate', type=float, default=0.0,
+                        help='Probability of creating an issue but answering with a 502')
+    args = parser.parse_args()
+
+    stand_in = StandInGitHubServer(args.port, args.rate_limit, args.rate_window,
+                                   args.secondary_every, args.error_rate, args.latency_ms,
+                                   args.lost_response_rate)
+    print(f"GitHub stand-in listening on {stand_in.url} (set GITHUB_API_URL to use it)")
+    stand_in._httpd.serve_forever()
@@ -0,0 +1,155 @@
+"""
+Pipeline Load Test
+Simulates concurrent meetings through chunk -> transcribe -> persist -> analyze
+using the fake providers, and reports throughput and latency percentiles
+
+Usage:
+    python loadtest.py --meetings 8 --chunks 10 --transcribe-latency-ms 800 --error-rate 0.05
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+import numpy as np
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--meetings', type=int, default=4, help='Concurrent meetings')
+    parser.add_argument('--chunks', type=int, default=10, help='Chunks per meeting')
+    parser.add_argument('--chunk-seconds', type=float, default=15, help='Audio per chunk')
+    parser.add_argument('--interval', type=float, default=0.2,
+                        help='Seconds between chunks of one meeting (compressed real time)')
+    parser.add_argument('--workers', type=int, default=2, help='Transcription workers')
+    parser.add_argument('--queue-size', type=int, default=8, help='Transcription queue size')
+    parser.add_argument('--transcribe-latency-ms', type=float, default=300)
+    parser.add_argument('--llm-latency-ms', type=float, default=500)
+    parser.add_argument('--jitter-ms', type=float, default=100)
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Injected failure rate (0-1)')
+    parser.add_argument('--timeout-rate', type=float, default=0.0, help='Injected timeout rate (0-1)')
+    parser.add_argument('--timeout-ms', type=float, default=1000, help='How long an injected timeout hangs')
+    parser.add_argument('--backoff', type=float, default=0.2, help='Retry backoff base in seconds')
+    parser.add_argument('--window-chars', type=int, default=2000, help='Rolling analysis window')
+    parser.add_argument('--seed', type=int, default=1)
+    return parser.parse_args()
+
+
+def percentiles(values) -> str:
+    if not values:
+        return 'n/a'
+    p50, p99 = np.percentile(values, [50, 99])
+    return f"p50 {p50 * 1000:8.1f} ms   p99 {p99 * 1000:8.1f} ms   max {max(values) * 1000:8.1f} ms"
+
+
+def main():
+    args = parse_args()
+
+    # Configure the backend before importing it; all state goes to a scratch directory
+    os.environ.update({
+        'TRANSCRIPTION_PROVIDER': 'fake',
+        'LLM_PROVIDER': 'fake',
+        'PROVIDER_JITTER_MS': str(args.jitter_ms),
+        'PROVIDER_ERROR_RATE': str(args.error_rate),
+        'PROVIDER_TIMEOUT_RATE': str(args.timeout_rate),
+        'PROVIDER_TIMEOUT_MS': str(args.timeout_ms),
+        'PROVIDER_SEED': str(args.seed),
+        'TRANSCRIPTION_WORKERS': str(args.workers),
+        'TRANSCRIPTION_QUEUE_SIZE': str(args.queue_size),
+        'ANALYSIS_WINDOW_CHARS': str(args.window_chars),
+    })
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    workdir = tempfile.mkdtemp(prefix='fomo_loadtest_')
+    os.chdir(workdir)
+
+    import app as backend
+    from audio_encoders import WavEncoder
+
+    backend.transcription_provider.latency_ms = args.transcribe_latency_ms
+    backend.llm_provider.latency_ms = args.llm_latency_ms
+    scheduler = backend.transcription_scheduler
+    scheduler.backoff_base = args.backoff
+    backend.meeting_analyzer.backoff_base = args.backoff
+
+    lock = threading.Lock()
+    submitted, committed = {}, {}
+    analysis_latency, failures = [], []
+
+    commit = scheduler.commit
+
+    def timed_commit(meeting_id, chunk_index, chunk_path, segments, recording_id):
+        commit(meeting_id, chunk_index, chunk_path, segments, recording_id)
+        with lock:
+            committed[(meeting_id, chunk_index)] = time.perf_counter()
+
+    scheduler.commit = timed_commit
+
+    sample_rate = 16000
+    rng = np.random.default_rng(args.seed)
+    client = backend.app.test_client()
+
+    def run_meeting(n: int):
+        meeting_id = f'loadtest_{n}'
+        client.post('/api/meetings', json={'id': meeting_id, 'title': f'Load test {n}'})
+        scheduler.begin_meeting(meeting_id)
+        backend.meeting_analyzer.begin_meeting(meeting_id)
+
+        for chunk_index in range(args.chunks):
+            # Unique audio per chunk, so the result cache never short-circuits
+            with lock:
+                audio = rng.integers(-3000, 3000, size=(int(args.chunk_seconds * sample_rate), 1),
+                                     dtype=np.int16)
+            encoder = WavEncoder()
+            encoder.open(os.path.join('data', f'{meeting_id}_chunk_{chunk_index}'), sample_rate, 1)
+            encoder.write(audio)
+            path = encoder.close()
+
+            with lock:
+                submitted[(meeting_id, chunk_index)] = time.perf_counter()
+            scheduler.submit(path, chunk_index, meeting_id)
+            time.sleep(args.interval)
+
+        stopped = time.perf_counter()
+        backend.analyze_meeting_background(meeting_id)
+        meeting = backend.load_meeting(meeting_id)
+        with lock:
+            analysis_latency.append(time.perf_counter() - stopped)
+            if meeting['status'] != 'completed':
+                failures.append(f"{meeting_id}: analysis did not complete")
+            if meeting['chunksProcessed'] != args.chunks:
+                failures.append(f"{meeting_id}: {meeting['chunksProcessed']}/{args.chunks} chunks committed")
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=run_meeting, args=(n,)) for n in range(args.meetings)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    chunk_latency = [committed[key] - submitted[key] for key in committed if key in submitted]
+    total_chunks = args.meetings * args.chunks
+    status = scheduler.get_status()
+
+    print()
+    print("=" * 72)
+    print(f"Meetings: {args.meetings}   chunks: {total_chunks}   "
+          f"audio: {total_chunks * args.chunk_seconds / 60:.1f} min   workers: {args.workers}")
+    print(f"Wall time: {elapsed:.2f} s")
+    print(f"Throughput: {len(committed) / elapsed:.2f} chunks/s   "
+          f"{len(committed) * args.chunk_seconds / elapsed:.1f}x real time")
+    print(f"Chunk latency (submit -> commit):  {percentiles(chunk_latency)}")
+    print(f"Final analysis (stop -> analyzed): {percentiles(analysis_latency)}")
+    print(f"Transcription: {status['completed']} completed, {status['retries']} retries, "
+          f"{status['failed']} failed")
+    for failure in failures:
+        print(f"FAILED {failure}")
+    print(f"Scratch data: {workdir}")
+    print("=" * 72)
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
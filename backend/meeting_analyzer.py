@@ -0,0 +1,370 @@
+"""
+Meeting Analyzer
+Map-reduce analysis of meeting transcripts: windows of the transcript are
+summarized in the background while recording, and the partial results are
+merged into the final summary and action items when the meeting stops
+"""
+
+import json
+import random
+import threading
+import time
+import queue
+from typing import Optional, Callable, List, Dict, Tuple
+
+
+MAP_PROMPT = """This is one part of a longer meeting transcript. Extract:
+
+1. **Notes**: What was discussed in this part
+2. **Action Items**: Tasks that need to be done
+3. **Decisions**, **Blockers**, **Next Steps** and **Topics**
+
+Format as JSON with this structure:
+{{
+  "notes": "Brief summary of this part",
+  "actionItems": [
+    {{
+      "text": "Task description",
+      "assignee": "Person name or null",
+      "priority": "high" | "medium" | "low",
+      "context": "Relevant conversation context"
+    }}
+  ],
+  "keyDecisions": ["Decision 1"],
+  "nextSteps": ["Step 1"],
+  "blockers": ["Blocker 1"],
+  "topics": ["Topic 1"]
+}}
+
+TRANSCRIPT (part {part}):
+{transcript}
+"""
+
+REDUCE_PROMPT = """These are notes taken on consecutive parts of one meeting, in order.
+Merge them into an analysis of the whole meeting. Combine duplicate action
+items (keep the most specific wording, assignee and priority) and drop items
+that a later part says are done or cancelled.
+
+Format as JSON with this structure:
+{{
+  "actionItems": [
+    {{
+      "text": "Task description",
+      "assignee": "Person name or null",
+      "priority": "high" | "medium" | "low",
+      "context": "Relevant conversation context"
+    }}
+  ],
+  "summary": {{
+    "overview": "Brief summary",
+    "keyDecisions": ["Decision 1", "Decision 2"],
+    "nextSteps": ["Step 1", "Step 2"],
+    "blockers": ["Blocker 1"],
+    "topics": ["Topic 1", "Topic 2"]
+  }}
+}}
+
+NOTES:
+{notes}
+"""
+
+
+def format_transcript(segments: List[dict]) -> str:
+    """Render transcript segments as prompt text"""
+    return "\n\n".join([
+        f"{seg['speaker']} ({seg['startTime']}s): {seg['text']}"
+        for seg in segments
+    ])
+
+
+def parse_json_response(response_text: str) -> dict:
+    """Extract the JSON object from a model response (may be wrapped in markdown)"""
+    json_start = response_text.find('{')
+    json_end = response_text.rfind('}') + 1
+    return json.loads(response_text[json_start:json_end])
+
+
+class MeetingAnalyzer:
+    """
+    Rolling map-reduce analyzer
+    - add_segments() buffers committed segments; every window_chars of
+      transcript text is summarized (map) on a background thread
+    - finish() maps the remainder and merges all partial results (reduce),
+      so final latency depends on the number of windows, not meeting length
+    - analyze() runs the same map-reduce over a finished transcript
+
+    Rolling analyses are kept per (meeting_id, recording_id). A new recording
+    of a meeting supersedes the earlier ones: its analysis starts from the
+    stored transcript and receives their late segments, so theirs is dropped
+    """
+
+    def __init__(self,
+                 complete: Callable[[str, int], str],
+                 on_notes: Optional[Callable[[str, List[dict]], None]] = None,
+                 window_chars: int = 6000,
+                 map_max_tokens: int = 2048,
+                 reduce_max_tokens: int = 4096,
+                 max_retries: int = 3,
+                 backoff_base: float = 1.0,
+                 backoff_max: float = 30.0):
+        """
+        Initialize analyzer
+
+        Args:
+            complete: Function (prompt, max_tokens) -> response text. Raises if
+                the model is unavailable; failed windows are retried in finish()
+            on_notes: Called with (meeting_id, partial results) after each window
+            window_chars: Transcript characters per map window
+            map_max_tokens: Response token limit for window summaries
+            reduce_max_tokens: Response token limit for the merged analysis
+            max_retries: Retries per model call (failed call or unparsable response)
+            backoff_base: Initial retry delay in seconds (doubled per attempt)
+            backoff_max: Maximum retry delay in seconds
+        """
+        self.complete = complete
+        self.on_notes = on_notes
+        self.window_chars = window_chars
+        self.map_max_tokens = map_max_tokens
+        self.reduce_max_tokens = reduce_max_tokens
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+        self._condition = threading.Condition()
+        self._recordings: Dict[Tuple[str, Optional[str]], dict] = {}
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._worker_loop, name='meeting-analyzer', daemon=True)
+        self._thread.start()
+
+    def begin_meeting(self, meeting_id: str, recording_id: Optional[str] = None,
+                      segments: Optional[List[dict]] = None):
+        """
+        Start rolling analysis for a recording
+        Earlier recordings of the meeting still being analyzed are superseded
+
+        Args:
+            meeting_id: Meeting identifier
+            recording_id: Recording (capture session) identifier
+            segments: Transcript already stored for the meeting (e.g. from an
+                earlier recording), so the final analysis covers all of it
+        """
+        with self._condition:
+            for (other_meeting, _), other in self._recordings.items():
+                if other_meeting == meeting_id:
+                    other['superseded'] = True
+            state = {
+                'recording_id': recording_id,
+                'superseded': False,
+                'buffer': [],
+                'buffer_chars': 0,
+                'windows': 0,
+                'pending': 0,
+                'partials': {},
+                'failed': {}
+            }
+            self._recordings[(meeting_id, recording_id)] = state
+            self._buffer_segments(meeting_id, state, segments or [])
+
+    def is_tracking(self, meeting_id: str, recording_id: Optional[str] = None) -> bool:
+        """Check whether rolling analysis is running for a recording"""
+        with self._condition:
+            return (meeting_id, recording_id) in self._recordings
+
+    def add_segments(self, meeting_id: str, recording_id: Optional[str], segments: List[dict]):
+        """
+        Buffer newly committed segments; queues a window for summarizing
+        once enough text has accumulated
+        Segments of a superseded or untracked recording go to the meeting's
+        newest recording, whose analysis started before they were stored.
+        Ignored if the meeting has no rolling analysis
+        """
+        with self._condition:
+            state = self._recordings.get((meeting_id, recording_id))
+            if state is None or state['superseded']:
+                state = self._current(meeting_id)
+            if state is None:
+                return
+            self._buffer_segments(meeting_id, state, segments)
+
+    def get_notes(self, meeting_id: str, recording_id: Optional[str] = None) -> List[dict]:
+        """Get the partial results of a recording summarized so far, in transcript order"""
+        with self._condition:
+            state = self._recordings.get((meeting_id, recording_id))
+            if state is None:
+                return []
+            return self._notes(state)
+
+    def _current(self, meeting_id: str) -> Optional[dict]:
+        """State of the meeting's newest recording (caller holds the lock)"""
+        for (other_meeting, _), state in self._recordings.items():
+            if other_meeting == meeting_id and not state['superseded']:
+                return state
+        return None
+
+    @staticmethod
+    def _notes(state: dict) -> List[dict]:
+        """Partial results of a recording in transcript order (caller holds the lock)"""
+        return [state['partials'][i] for i in sorted(state['partials'])]
+
+    def finish(self, meeting_id: str, recording_id: Optional[str] = None,
+               timeout: Optional[float] = None) -> Optional[dict]:
+        """
+        Summarize the remaining transcript and merge all partial results
+
+        Args:
+            meeting_id: Meeting identifier
+            recording_id: Recording identifier
+            timeout: Maximum seconds to wait for queued windows
+
+        Returns:
+            Optional[dict]: Analysis with actionItems and summary, or None if
+                the recording is not tracked, has no transcript, or was
+                superseded by a newer recording of the meeting (before or
+                while finishing)
+
+        Raises:
+            Exception: If a window or the merge cannot be analyzed
+        """
+        key = (meeting_id, recording_id)
+        with self._condition:
+            state = self._recordings.get(key)
+            if state is None:
+                return None
+            if not state['superseded']:
+                if state['buffer']:
+                    self._queue_window(meeting_id, state)
+                self._condition.wait_for(lambda: state['pending'] == 0, timeout=timeout)
+            failed = dict(state['failed'])
+
+        # Stays tracked until merged, so a recording starting meanwhile supersedes it
+        analysis = None
+        try:
+            if not state['superseded']:
+                # Windows that failed in the background get one more try
+                for index, text in failed.items():
+                    self._store_partial(meeting_id, state, index, self.summarize_window(text, index + 1))
+                with self._condition:
+                    partials = self._notes(state)
+                if partials:
+                    analysis = self.merge(partials)
+        finally:
+            with self._condition:
+                if self._recordings.get(key) is state:
+                    del self._recordings[key]
+                superseded = state['superseded']
+
+        return None if superseded else analysis
+
+    def discard(self, meeting_id: str, recording_id: Optional[str] = None):
+        """Stop tracking a recording without analyzing it"""
+        with self._condition:
+            self._recordings.pop((meeting_id, recording_id), None)
+
+    def analyze(self, segments: List[dict]) -> Optional[dict]:
+        """
+        Map-reduce analysis of a complete transcript
+
+        Args:
+            segments: Transcript segments in order
+
+        Returns:
+            Optional[dict]: Analysis with actionItems and summary, or None if empty
+        """
+        windows, current, size = [], [], 0
+        for seg in segments:
+            current.append(seg)
+            size += len(seg.get('text', ''))
+            if size >= self.window_chars:
+                windows.append(current)
+                current, size = [], 0
+        if current:
+            windows.append(current)
+        if not windows:
+            return None
+
+        partials = [
+            self.summarize_window(format_transcript(window), i + 1)
+            for i, window in enumerate(windows)
+        ]
+        return self.merge(partials)
+
+    def summarize_window(self, transcript_text: str, part: int) -> dict:
+        """Map step: summarize one window of transcript"""
+        prompt = MAP_PROMPT.format(part=part, transcript=transcript_text)
+        partial = self._complete_json(prompt, self.map_max_tokens)
+        partial['part'] = part
+        return partial
+
+    def merge(self, partials: List[dict]) -> dict:
+        """Reduce step: merge window summaries into the final analysis"""
+        prompt = REDUCE_PROMPT.format(notes=json.dumps(partials, indent=2))
+        analysis = self._complete_json(prompt, self.reduce_max_tokens)
+        analysis.setdefault('actionItems', [])
+        analysis.setdefault('summary', {})
+        return analysis
+
+    def _complete_json(self, prompt: str, max_tokens: int) -> dict:
+        """Run a prompt and parse the JSON response, retrying with exponential backoff"""
+        for attempt in range(self.max_retries + 1):
+            try:
+                return parse_json_response(self.complete(prompt, max_tokens))
+            except Exception as e:
+                if attempt == self.max_retries:
+                    raise
+                delay = min(self.backoff_base * (2 ** attempt), self.backoff_max)
+                delay *= random.uniform(0.8, 1.2)
+                print(f"[Analyzer] Model call failed ({e}), retrying in {delay:.1f}s")
+                time.sleep(delay)
+
+    def _buffer_segments(self, meeting_id: str, state: dict, segments: List[dict]):
+        """Buffer segments, queueing a window each time window_chars is reached (caller holds the lock)"""
+        for seg in segments:
+            state['buffer'].append(seg)
+            state['buffer_chars'] += len(seg.get('text', ''))
+            if state['buffer_chars'] >= self.window_chars:
+                self._queue_window(meeting_id, state)
+
+    def _queue_window(self, meeting_id: str, state: dict):
+        """Move the buffered segments into a map job (caller holds the lock)"""
+        text = format_transcript(state['buffer'])
+        index = state['windows']
+        state['windows'] += 1
+        state['pending'] += 1
+        state['buffer'] = []
+        state['buffer_chars'] = 0
+        self._queue.put((meeting_id, state, index, text))
+
+    def _worker_loop(self):
+        """Summarize queued windows one at a time"""
+        while True:
+            meeting_id, state, index, text = self._queue.get()
+            try:
+                with self._condition:
+                    if state['superseded']:
+                        continue  # A newer recording's analysis covers this text
+                partial = self.summarize_window(text, index + 1)
+                self._store_partial(meeting_id, state, index, partial)
+            except Exception as e:
+                print(f"[Analyzer] Window {index + 1} of {meeting_id} failed: {e}")
+                with self._condition:
+                    state['failed'][index] = text
+            finally:
+                with self._condition:
+                    state['pending'] -= 1
+                    self._condition.notify_all()
+
+    def _store_partial(self, meeting_id: str, state: dict, index: int, partial: dict):
+        """Record a window summary of a recording and report the running notes"""
+        with self._condition:
+            state['partials'][index] = partial
+            state['failed'].pop(index, None)
+            # Superseded or finished recordings are not reported
+            if state['superseded'] or self._recordings.get((meeting_id, state['recording_id'])) is not state:
+                return
+            notes = self._notes(state)
+
+        if self.on_notes:
+            try:
+                self.on_notes(meeting_id, notes)
+            except Exception as e:
+                print(f"[Analyzer] Error reporting notes for {meeting_id}: {e}")
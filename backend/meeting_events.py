@@ -0,0 +1,183 @@
+"""
+Meeting Event Bus
+In-process publish/subscribe of incremental meeting updates
+Backs the Server-Sent Events stream at /api/meetings/<id>/events
+"""
+
+import threading
+import time
+import uuid
+from collections import deque
+from typing import Optional, Iterator, Dict
+
+
+class MeetingEventBus:
+    """
+    Per-meeting event logs with sequence numbers
+    Recent events are kept in memory so a reconnecting client can resume
+    from the last sequence number it saw. Sequence numbers are unique
+    across the bus and each meeting remembers the newest seq it may have
+    lost (trimmed history, forgotten meeting), so a resume is only allowed
+    when nothing after it is missing. Event IDs carry the bus epoch, so IDs
+    from before a restart are never resumed from. Meetings without
+    subscribers are forgotten after idle_seconds
+    """
+
+    def __init__(self, history: int = 1000, idle_seconds: float = 3600):
+        """
+        Initialize event bus
+
+        Args:
+            history: Number of recent events kept per meeting for resume
+            idle_seconds: Drop a meeting's events once it had no subscribers
+                and no events for this long
+        """
+        self.history = history
+        self.idle_seconds = idle_seconds
+        self.epoch = uuid.uuid4().hex[:8]
+        self._condition = threading.Condition()
+        self._events: Dict[str, deque] = {}
+        self._seq = 0
+        self._floor: Dict[str, int] = {}  # Events up to this seq may be missing
+        self._forgotten_seq = 0  # Seq when a meeting was last forgotten
+        self._last_active: Dict[str, float] = {}
+        self._subscribers: Dict[str, int] = {}
+        self._next_sweep = time.monotonic() + idle_seconds
+
+    def event_id(self, seq: int) -> str:
+        """Format a sequence number as an event ID ('<epoch>-<seq>')"""
+        return f'{self.epoch}-{seq}'
+
+    def parse_event_id(self, event_id: Optional[str]) -> Optional[int]:
+        """
+        Get the sequence number of an event ID issued by this bus
+
+        Returns:
+            Optional[int]: The sequence number, or None for a missing, malformed
+                or earlier-epoch ID (the client needs a snapshot)
+        """
+        epoch, _, seq = (event_id or '').partition('-')
+        if epoch != self.epoch or not seq.isdigit():
+            return None
+        return int(seq)
+
+    def publish(self, meeting_id: str, event_type: str, data: dict) -> int:
+        """
+        Publish an event to all subscribers of a meeting
+
+        Args:
+            meeting_id: Meeting identifier
+            event_type: Event name (e.g. 'segments', 'status', 'actionItems')
+            data: JSON-serializable payload
+
+        Returns:
+            int: Sequence number of the event
+        """
+        with self._condition:
+            self._seq += 1
+            seq = self._seq
+            events = self._events.get(meeting_id)
+            if events is None:
+                events = self._events[meeting_id] = deque(maxlen=self.history)
+                self._floor[meeting_id] = self._forgotten_seq
+            elif len(events) == self.history:
+                self._floor[meeting_id] = events[0]['seq']  # About to be trimmed
+            events.append({'seq': seq, 'type': event_type, 'data': data})
+            self._last_active[meeting_id] = time.monotonic()
+            self._evict_idle()
+            self._condition.notify_all()
+        return seq
+
+    def _evict_idle(self):
+        """Forget meetings without subscribers or recent events (lock held)"""
+        now = time.monotonic()
+        if now < self._next_sweep:
+            return
+        self._next_sweep = now + min(self.idle_seconds, 60)
+        for meeting_id, active in list(self._last_active.items()):
+            if now - active >= self.idle_seconds and not self._subscribers.get(meeting_id):
+                self.forget(meeting_id)
+
+    def forget(self, meeting_id: str):
+        """Drop a meeting's events; clients resuming it get a new snapshot"""
+        with self._condition:
+            self._forgotten_seq = self._seq
+            for state in (self._events, self._floor, self._last_active):
+                state.pop(meeting_id, None)
+
+    def last_seq(self, meeting_id: str) -> int:
+        """
+        Get the sequence number a snapshot of the meeting taken now is current to
+        (the latest seq of the bus; later events of the meeting are newer)
+        """
+        with self._condition:
+            return self._seq
+
+    def can_resume(self, meeting_id: str, after_seq: int) -> bool:
+        """
+        Check whether every event after after_seq is still in memory
+
+        Args:
+            meeting_id: Meeting identifier
+            after_seq: Last sequence number the client received
+        """
+        with self._condition:
+            if after_seq > self._seq:
+                return False  # Not issued by this bus
+            return after_seq >= self._floor.get(meeting_id, self._forgotten_seq)
+
+    def subscribe(self, meeting_id: str, after_seq: int,
+                  keepalive: float = 15.0) -> Iterator[Optional[dict]]:
+        """
+        Iterate over events published after after_seq
+        Blocks waiting for new events; yields None every keepalive seconds
+        when idle so the caller can send a heartbeat
+
+        Args:
+            meeting_id: Meeting identifier
+            after_seq: Only events with a higher sequence number are yielded
+            keepalive: Seconds between heartbeats
+
+        Yields:
+            Optional[dict]: Event dict with seq, type and data, or None (heartbeat)
+        """
+        cursor = after_seq
+        with self._condition:
+            self._subscribers[meeting_id] = self._subscribers.get(meeting_id, 0) + 1
+        try:
+            while True:
+                with self._condition:
+                    pending = [
+                        event for event in self._events.get(meeting_id, ())
+                        if event['seq'] > cursor
+                    ]
+                    if not pending:
+                        self._condition.wait(timeout=keepalive)
+                        pending = [
+                            event for event in self._events.get(meeting_id, ())
+                            if event['seq'] > cursor
+                        ]
+
+                if not pending:
+                    yield None
+                    continue
+
+                for event in pending:
+                    cursor = event['seq']
+                    yield event
+        finally:
+            with self._condition:
+                self._subscribers[meeting_id] -= 1
+                if not self._subscribers[meeting_id]:
+                    del self._subscribers[meeting_id]
+                    if meeting_id in self._events:
+                        self._last_active[meeting_id] = time.monotonic()
+
+
+# Global instance
+meeting_events = MeetingEventBus()
+
+
+def get_meeting_events() -> MeetingEventBus:
+    """Get the global meeting event bus"""
+    return meeting_events
@@ -0,0 +1,1010 @@
+"""
+Meeting Storage Service
+SQLite-backed store for meetings, transcript segments and action items
+Replaces the per-meeting JSON files previously kept in data/
+"""
+
+import sqlite3
+import threading
+import base64
+import json
+import os
+import re
+import time
+from contextlib import contextmanager
+from typing import Optional, List, Tuple, Callable
+
+from metrics import get_metrics
+
+
+STORE_WRITE_SECONDS = get_metrics().histogram(
+    'fomo_store_write_seconds', 'Time to write to the meeting store, including lock waits, by operation')
+
+
+# Schema migrations, applied in order and tracked with PRAGMA user_version
+MIGRATIONS = [
+    """
+    CREATE TABLE IF NOT EXISTS meetings (
+        id TEXT PRIMARY KEY,
+        title TEXT,
+        start_time TEXT,
+        end_time TEXT,
+        status TEXT,
+        data TEXT NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_meetings_start_time ON meetings(start_time);
+    CREATE INDEX IF NOT EXISTS idx_meetings_status ON meetings(status);
+
+    CREATE TABLE IF NOT EXISTS transcript_segments (
+        meeting_id TEXT NOT NULL REFERENCES meetings(id) ON DELETE CASCADE,
+        seq INTEGER NOT NULL,
+        segment_id TEXT,
+        start_time REAL,
+        data TEXT NOT NULL,
+        PRIMARY KEY (meeting_id, seq)
+    );
+
+    CREATE TABLE IF NOT EXISTS action_items (
+        meeting_id TEXT NOT NULL REFERENCES meetings(id) ON DELETE CASCADE,
+        position INTEGER NOT NULL,
+        item_id TEXT,
+        status TEXT,
+        data TEXT NOT NULL,
+        PRIMARY KEY (meeting_id, position)
+    );
+    CREATE INDEX IF NOT EXISTS idx_action_items_status ON action_items(status);
+    """,
+    """
+    ALTER TABLE meetings ADD COLUMN duration REAL DEFAULT 0;
+    ALTER TABLE meetings ADD COLUMN segment_count INTEGER DEFAULT 0;
+    ALTER TABLE meetings ADD COLUMN action_item_counts TEXT DEFAULT '{}';
+    UPDATE meetings SET
+        duration = COALESCE(json_extract(data, '$.duration'), 0),
+        segment_count = (
+            SELECT COUNT(*) FROM transcript_segments WHERE meeting_id = meetings.id
+        ),
+        action_item_counts = COALESCE((
+            SELECT json_group_object(status, n) FROM (
+                SELECT COALESCE(status, 'unknown') AS status, COUNT(*) AS n
+                FROM action_items WHERE meeting_id = meetings.id GROUP BY 1
+            )
+        ), '{}');
+    DROP INDEX IF EXISTS idx_meetings_start_time;
+    CREATE INDEX IF NOT EXISTS idx_meetings_start_time ON meetings(start_time, id);
+    """,
+    """
+    ALTER TABLE meetings ADD COLUMN version INTEGER DEFAULT 1;
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS chunk_journal (
+        path TEXT PRIMARY KEY,
+        meeting_id TEXT NOT NULL,
+        recording_id TEXT NOT NULL,
+        chunk_index INTEGER NOT NULL,
+        state TEXT NOT NULL,
+        info TEXT,
+        recoveries INTEGER NOT NULL DEFAULT 0,
+        updated_at REAL NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_chunk_journal_state ON chunk_journal(state, updated_at);
+    CREATE INDEX IF NOT EXISTS idx_chunk_journal_meeting ON chunk_journal(meeting_id);
+    """,
+    """
+    ALTER TABLE transcript_segments ADD COLUMN end_time REAL;
+    UPDATE transcript_segments SET end_time = json_extract(data, '$.endTime');
+    CREATE INDEX IF NOT EXISTS idx_segments_timeline ON transcript_segments(meeting_id, start_time);
+    ALTER TABLE meetings ADD COLUMN max_segment_seconds REAL DEFAULT 0;
+    UPDATE meetings SET max_segment_seconds = COALESCE((
+        SELECT MAX(end_time - start_time) FROM transcript_segments WHERE meeting_id = meetings.id
+    ), 0);
+    """,
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS transcript_fts USING fts5(
+        text, speaker, tokenize = 'porter unicode61'
+    );
+    INSERT INTO transcript_fts (rowid, text, speaker)
+        SELECT rowid, json_extract(data, '$.text'), json_extract(data, '$.speaker')
+        FROM transcript_segments;
+
+    CREATE TRIGGER IF NOT EXISTS transcript_fts_insert AFTER INSERT ON transcript_segments BEGIN
+        INSERT INTO transcript_fts (rowid, text, speaker)
+        VALUES (new.rowid, json_extract(new.data, '$.text'), json_extract(new.data, '$.speaker'));
+    END;
+    CREATE TRIGGER IF NOT EXISTS transcript_fts_delete AFTER DELETE ON transcript_segments BEGIN
+        DELETE FROM transcript_fts WHERE rowid = old.rowid;
+    END;
+    CREATE TRIGGER IF NOT EXISTS transcript_fts_update AFTER UPDATE ON transcript_segments BEGIN
+        DELETE FROM transcript_fts WHERE rowid = old.rowid;
+        INSERT INTO transcript_fts (rowid, text, speaker)
+        VALUES (new.rowid, json_extract(new.data, '$.text'), json_extract(new.data, '$.speaker'));
+    END;
+    """,
+    """
+    ALTER TABLE action_items ADD COLUMN assignee TEXT;
+    ALTER TABLE action_items ADD COLUMN priority TEXT;
+    ALTER TABLE action_items ADD COLUMN created_at TEXT;
+    UPDATE action_items SET
+        assignee = json_extract(data, '$.assignee'),
+        priority = json_extract(data, '$.priority'),
+        created_at = json_extract(data, '$.timestamp');
+    DROP INDEX IF EXISTS idx_action_items_status;
+    CREATE INDEX IF NOT EXISTS idx_action_items_status ON action_items(status, created_at);
+    CREATE INDEX IF NOT EXISTS idx_action_items_assignee ON action_items(assignee, created_at);
+    CREATE INDEX IF NOT EXISTS idx_action_items_priority ON action_items(priority, created_at);
+    CREATE INDEX IF NOT EXISTS idx_action_items_created ON action_items(created_at);
+    CREATE INDEX IF NOT EXISTS idx_action_items_item_id ON action_items(item_id);
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS github_issues (
+        repo TEXT NOT NULL,
+        issue_key TEXT NOT NULL,
+        state TEXT NOT NULL,
+        number INTEGER,
+        url TEXT,
+        claimed_at REAL NOT NULL,
+        updated_at REAL NOT NULL,
+        PRIMARY KEY (repo, issue_key)
+    );
+    """,
+]
+
+# Action item fields that can be changed through update_action_items()
+ACTION_ITEM_UPDATE_FIELDS = ('text', 'assignee', 'priority', 'context', 'status',
+                             'approvedAt', 'githubIssue')
+
+# Chunk journal states, in pipeline order. recording: partial chunk being
+# written; captured: chunk file complete; uploaded: sent to the transcription
+# provider; transcribed: result received; committed: segments stored
+CHUNK_STATES = ('recording', 'captured', 'uploaded', 'transcribed', 'committed',
+                'failed', 'skipped', 'discarded', 'lost')
+UNFINISHED_CHUNK_STATES = ('recording', 'captured', 'uploaded', 'transcribed', 'failed')
+
+# Fields available on meeting summary records (GET /api/meetings)
+SUMMARY_FIELDS = (
+    'id', 'title', 'startTime', 'endTime', 'status',
+    'duration', 'segmentCount', 'actionItemCount', 'actionItemCounts'
+)
+
+
+def max_segment_seconds(segments: List[dict]) -> float:
+    """Longest segment duration, bounding how far before a time range overlapping segments start"""
+    return max(
+        [seg['endTime'] - seg['startTime'] for seg in segments
+         if seg.get('startTime') is not None and seg.get('endTime') is not None],
+        default=0
+    )
+
+
+def fts_match_query(text: str) -> str:
+    """
+    Turn free text into an FTS5 query: every word must match, the last one
+    as a prefix (search as you type). Words are quoted, so operators and
+    punctuation in the input cannot cause syntax errors
+    """
+    words = re.findall(r'\w+', text)
+    if not words:
+        return ''
+    return ' '.join(f'"{word}"' for word in words) + '*'
+
+
+def encode_cursor(*parts) -> str:
+    """Opaque, URL-safe page cursor from the key of the last row"""
+    return base64.urlsafe_b64encode(json.dumps(parts, separators=(',', ':')).encode()).decode()
+
+
+def decode_cursor(cursor: str, size: int) -> list:
+    """
+    Key parts of a cursor from encode_cursor()
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        parts = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (ValueError, TypeError):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    if not isinstance(parts, list) or len(parts) != size:
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return parts
+
+
+class MeetingConflictError(Exception):
+    """Raised when a meeting was modified since the caller loaded it"""
+
+
+class MeetingStore:
+    """
+    Embedded meeting database
+    Meetings, transcript segments and action items live in separate tables
+    so listing and updating do not require parsing every meeting document
+    """
+
+    def __init__(self, db_path: str = os.path.join('data', 'fomo.db')):
+        """
+        Initialize meeting store
+
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self.db_path = db_path
+        self._local = threading.local()
+        self._meeting_locks = {}
+        self._locks_guard = threading.Lock()
+        db_dir = os.path.dirname(db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+        self._apply_migrations()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Get the SQLite connection for the calling thread"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, isolation_level=None, timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('PRAGMA foreign_keys=ON')
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _transaction(self):
+        """Run a block inside a write transaction"""
+        conn = self._connect()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            yield conn
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        conn.execute('COMMIT')
+
+    def _apply_migrations(self):
+        """Bring the database schema up to date"""
+        conn = self._connect()
+        version = conn.execute('PRAGMA user_version').fetchone()[0]
+        for index in range(version, len(MIGRATIONS)):
+            conn.executescript('BEGIN;' + MIGRATIONS[index] + f'PRAGMA user_version = {index + 1}; COMMIT;')
+
+    # ============ Locking ============
+
+    @contextmanager
+    def meeting_lock(self, meeting_id: str):
+        """
+        Hold the per-meeting lock
+        Serializes read-modify-write cycles on one meeting within this process
+        """
+        with self._locks_guard:
+            lock = self._meeting_locks.setdefault(meeting_id, threading.RLock())
+        with lock:
+            yield
+
+    # ============ Meetings ============
+
+    def save_meeting(self, meeting_data: dict, expected_version: Optional[int] = None) -> dict:
+        """
+        Insert or replace a full meeting document
+
+        Args:
+            meeting_data: Meeting dict including transcript and actionItems
+            expected_version: If given, fail unless the stored version still matches
+
+        Returns:
+            dict: The saved meeting (with its new version)
+
+        Raises:
+            MeetingConflictError: If expected_version is stale
+        """
+        with STORE_WRITE_SECONDS.time(operation='save_meeting'), self.meeting_lock(meeting_data['id']):
+            with self._transaction() as conn:
+                if expected_version is not None:
+                    self._check_version(conn, meeting_data['id'], expected_version)
+                meeting_data['version'] = self._write_meeting(conn, meeting_data)
+        return meeting_data
+
+    def update_meeting(self, meeting_id: str, mutate: Callable[[dict], None],
+                       include_transcript: bool = False) -> Optional[dict]:
+        """
+        Atomically load, modify and save a meeting
+        The meeting lock and write transaction are held for the whole cycle,
+        so concurrent updates (chunk commits, approvals, analysis) cannot
+        overwrite each other
+
+        Args:
+            meeting_id: Meeting identifier
+            mutate: Function that modifies the meeting dict in place
+            include_transcript: Load and rewrite the transcript too. When False,
+                the meeting is passed without 'transcript' and segments are untouched
+
+        Returns:
+            Optional[dict]: The updated meeting, or None if it does not exist
+        """
+        with STORE_WRITE_SECONDS.time(operation='update_meeting'), self.meeting_lock(meeting_id):
+            with self._transaction() as conn:
+                meeting = self.load_meeting(meeting_id, include_transcript=include_transcript)
+                if meeting is None:
+                    return None
+                mutate(meeting)
+                meeting['version'] = self._write_meeting(
+                    conn, meeting, write_transcript=include_transcript
+                )
+        return meeting
+
+    def _check_version(self, conn: sqlite3.Connection, meeting_id: str, expected_version: int):
+        """Raise MeetingConflictError if the stored version differs"""
+        row = conn.execute('SELECT version FROM meetings WHERE id = ?', (meeting_id,)).fetchone()
+        current = row['version'] if row else 0
+        if current != expected_version:
+            raise MeetingConflictError(
+                f"Meeting {meeting_id} is at version {current}, expected {expected_version}"
+            )
+
+    def _write_meeting(self, conn: sqlite3.Connection, meeting_data: dict,
+                       write_transcript: bool = True) -> int:
+        """
+        Write a meeting document using an open transaction
+
+        Returns:
+            int: The meeting's new version
+        """
+        meeting_id = meeting_data['id']
+        document = {
+            key: value for key, value in meeting_data.items()
+            if key not in ('transcript', 'actionItems', 'version', 'segmentCount')
+        }
+        transcript = meeting_data.get('transcript') or []
+        action_items = meeting_data.get('actionItems') or []
+
+        action_item_counts = {}
+        for item in action_items:
+            status = item.get('status') or 'unknown'
+            action_item_counts[status] = action_item_counts.get(status, 0) + 1
+
+        conn.execute(
+            f"""
+            INSERT INTO meetings (
+                id, title, start_time, end_time, status, data,
+                duration, segment_count, max_segment_seconds, action_item_counts, version
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 1)
+            ON CONFLICT(id) DO UPDATE SET
+                title = excluded.title,
+                start_time = excluded.start_time,
+                end_time = excluded.end_time,
+                status = excluded.status,
+                data = excluded.data,
+                duration = excluded.duration,
+                {'segment_count = excluded.segment_count,' if write_transcript else ''}
+                {'max_segment_seconds = excluded.max_segment_seconds,' if write_transcript else ''}
+                action_item_counts = excluded.action_item_counts,
+                version = version + 1
+            """,
+            (
+                meeting_id,
+                meeting_data.get('title'),
+                meeting_data.get('startTime'),
+                meeting_data.get('endTime'),
+                meeting_data.get('status'),
+                json.dumps(document),
+                meeting_data.get('duration') or 0,
+                len(transcript),
+                max_segment_seconds(transcript),
+                json.dumps(action_item_counts),
+            )
+        )
+
+        if write_transcript:
+            conn.execute('DELETE FROM transcript_segments WHERE meeting_id = ?', (meeting_id,))
+            conn.executemany(
+                'INSERT INTO transcript_segments (meeting_id, seq, segment_id, start_time, end_time, data) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                [
+                    (meeting_id, seq, seg.get('id'), seg.get('startTime'), seg.get('endTime'), json.dumps(seg))
+                    for seq, seg in enumerate(transcript)
+                ]
+            )
+
+        conn.execute('DELETE FROM action_items WHERE meeting_id = ?', (meeting_id,))
+        conn.executemany(
+            'INSERT INTO action_items (meeting_id, position, item_id, status, assignee, priority, created_at, data) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            [
+                (meeting_id, position, item.get('id'), item.get('status'), item.get('assignee'),
+                 item.get('priority'), item.get('timestamp'), json.dumps(item))
+                for position, item in enumerate(action_items)
+            ]
+        )
+
+        return conn.execute('SELECT version FROM meetings WHERE id = ?', (meeting_id,)).fetchone()[0]
+
+    def append_segments(self, meeting_id: str, segments: List[dict], count_chunk: bool = True,
+                        chunk_path: Optional[str] = None) -> Optional[int]:
+        """
+        Append transcript segments for one processed chunk
+        Only the new rows are written; the rest of the meeting is left untouched
+
+        Args:
+            meeting_id: Meeting identifier
+            segments: Segments in transcript order
+            count_chunk: Increment chunksProcessed (False for live segments)
+            chunk_path: Journaled chunk the segments came from; it is marked
+                committed in the same transaction, so a chunk is never stored twice
+
+        Returns:
+            Optional[int]: New segment count, or None if the meeting does not exist
+        """
+        with STORE_WRITE_SECONDS.time(operation='append_segments'), \
+                self.meeting_lock(meeting_id), self._transaction() as conn:
+            row = conn.execute(
+                'SELECT segment_count FROM meetings WHERE id = ?', (meeting_id,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            next_seq = conn.execute(
+                'SELECT COALESCE(MAX(seq) + 1, 0) FROM transcript_segments WHERE meeting_id = ?',
+                (meeting_id,)
+            ).fetchone()[0]
+            conn.executemany(
+                'INSERT INTO transcript_segments (meeting_id, seq, segment_id, start_time, end_time, data) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                [
+                    (meeting_id, next_seq + i, seg.get('id'), seg.get('startTime'), seg.get('endTime'),
+                     json.dumps(seg))
+                    for i, seg in enumerate(segments)
+                ]
+            )
+            conn.execute(
+                """
+                UPDATE meetings SET
+                    segment_count = segment_count + ?,
+                    max_segment_seconds = MAX(COALESCE(max_segment_seconds, 0), ?),
+                    version = version + 1,
+                    data = json_set(data, '$.chunksProcessed',
+                                    COALESCE(json_extract(data, '$.chunksProcessed'), 0) + ?)
+                WHERE id = ?
+                """,
+                (len(segments), max_segment_seconds(segments), 1 if count_chunk else 0, meeting_id)
+            )
+            if chunk_path is not None:
+                self._set_chunk_state(conn, chunk_path, 'committed')
+        return row['segment_count'] + len(segments)
+
+    @contextmanager
+    def _read_snapshot(self):
+        """Run a block of reads against one consistent database snapshot"""
+        conn = self._connect()
+        if conn.in_transaction:
+            yield conn  # Already inside a transaction
+            return
+        conn.execute('BEGIN')
+        try:
+            yield conn
+        finally:
+            conn.execute('COMMIT')
+
+    def load_meeting(self, meeting_id: str, include_transcript: bool = True,
+                     since_segment: int = 0) -> Optional[dict]:
+        """
+        Load a full meeting document
+
+        Args:
+            meeting_id: Meeting identifier
+            include_transcript: Whether to load transcript segments
+            since_segment: Only load segments with index >= since_segment
+
+        Returns:
+            Optional[dict]: Meeting with transcript and actionItems, or None
+        """
+        with self._read_snapshot() as conn:
+            row = conn.execute(
+                'SELECT data, version, segment_count FROM meetings WHERE id = ?', (meeting_id,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            meeting = json.loads(row['data'])
+            meeting['version'] = row['version']
+            meeting['segmentCount'] = row['segment_count']
+            if include_transcript:
+                meeting['transcript'] = [
+                    json.loads(r['data']) for r in conn.execute(
+                        'SELECT data FROM transcript_segments WHERE meeting_id = ? AND seq >= ? ORDER BY seq',
+                        (meeting_id, since_segment)
+                    )
+                ]
+            meeting['actionItems'] = [
+                json.loads(r['data']) for r in conn.execute(
+                    'SELECT data FROM action_items WHERE meeting_id = ? ORDER BY position',
+                    (meeting_id,)
+                )
+            ]
+        return meeting
+
+    def load_segments_in_range(self, meeting_id: str, start: Optional[float] = None,
+                               end: Optional[float] = None) -> Optional[List[dict]]:
+        """
+        Load the transcript segments overlapping a span of the meeting timeline
+        Segments are found through the (meeting_id, start_time) index: a
+        segment overlapping [start, end) begins at most max_segment_seconds
+        before start, so only that key range is searched
+
+        Args:
+            meeting_id: Meeting identifier
+            start: Seconds from the meeting start (None = from the beginning)
+            end: Seconds from the meeting start (None = to the end)
+
+        Returns:
+            Optional[List[dict]]: Segments ordered by start time, or None if the
+                meeting does not exist
+        """
+        with self._read_snapshot() as conn:
+            row = conn.execute(
+                'SELECT max_segment_seconds FROM meetings WHERE id = ?', (meeting_id,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            query = 'SELECT data FROM transcript_segments WHERE meeting_id = ? AND start_time IS NOT NULL'
+            params = [meeting_id]
+            if start is not None:
+                query += ' AND start_time >= ? AND COALESCE(end_time, start_time) > ?'
+                params.extend([start - (row['max_segment_seconds'] or 0), start])
+            if end is not None:
+                query += ' AND start_time < ?'
+                params.append(end)
+            query += ' ORDER BY start_time, seq'
+            return [json.loads(r['data']) for r in conn.execute(query, params)]
+
+    def get_meeting_version(self, meeting_id: str) -> Optional[int]:
+        """
+        Get a meeting's version without loading it
+        The version increases on every change, so it doubles as an ETag
+
+        Args:
+            meeting_id: Meeting identifier
+
+        Returns:
+            Optional[int]: Current version, or None if the meeting does not exist
+        """
+        row = self._connect().execute(
+            'SELECT version FROM meetings WHERE id = ?', (meeting_id,)
+        ).fetchone()
+        return row['version'] if row else None
+
+    def list_meeting_summaries(self, limit: int = 50, after: Optional[str] = None,
+                               fields: Optional[List[str]] = None) -> Tuple[List[dict], Optional[str]]:
+        """
+        List precomputed meeting summaries, newest first, without loading transcripts
+
+        Args:
+            limit: Maximum number of summaries to return
+            after: Cursor for the next page; encodes the start time and ID of
+                the last meeting, so it stays valid if that meeting is deleted
+            fields: Optional subset of SUMMARY_FIELDS to include
+
+        Returns:
+            Tuple[List[dict], Optional[str]]: Summaries and the cursor for the next page
+
+        Raises:
+            ValueError: If the cursor is malformed or a field is unknown
+        """
+        if fields:
+            unknown = [field for field in fields if field not in SUMMARY_FIELDS]
+            if unknown:
+                raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+
+        conn = self._connect()
+        query = """
+            SELECT id, title, start_time, end_time, status,
+                   duration, segment_count, action_item_counts
+            FROM meetings
+        """
+        params = []
+        if after is not None:
+            query += ' WHERE (start_time, id) < (?, ?)'
+            params.extend(decode_cursor(after, 2))
+        query += ' ORDER BY start_time DESC, id DESC LIMIT ?'
+        params.append(limit + 1)
+
+        rows = conn.execute(query, params).fetchall()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        summaries = []
+        for row in rows:
+            action_item_counts = json.loads(row['action_item_counts'] or '{}')
+            summary = {
+                'id': row['id'],
+                'title': row['title'],
+                'startTime': row['start_time'],
+                'endTime': row['end_time'],
+                'status': row['status'],
+                'duration': row['duration'],
+                'segmentCount': row['segment_count'],
+                'actionItemCount': sum(action_item_counts.values()),
+                'actionItemCounts': action_item_counts,
+            }
+            if fields:
+                summary = {field: summary[field] for field in fields}
+            summaries.append(summary)
+
+        next_cursor = encode_cursor(rows[-1]['start_time'], rows[-1]['id']) if has_more else None
+        return summaries, next_cursor
+
+    def delete_meeting(self, meeting_id: str) -> bool:
+        """
+        Delete a meeting and its segments and action items
+
+        Args:
+            meeting_id: Meeting identifier
+
+        Returns:
+            bool: True if a meeting was deleted
+        """
+        with self._transaction() as conn:
+            cursor = conn.execute('DELETE FROM meetings WHERE id = ?', (meeting_id,))
+            conn.execute('DELETE FROM chunk_journal WHERE meeting_id = ?', (meeting_id,))
+        return cursor.rowcount > 0
+
+    # ============ Action Items ============
+
+    def list_action_items(self, status: Optional[List[str]] = None, assignee: Optional[str] = None,
+                          priority: Optional[List[str]] = None, meeting_id: Optional[str] = None,
+                          limit: int = 50, after: Optional[str] = None) -> Tuple[List[dict], Optional[str]]:
+        """
+        List action items across meetings, newest first, without loading meetings
+
+        Args:
+            status: Only items with one of these statuses
+            assignee: Only items assigned to this person
+            priority: Only items with one of these priorities
+            meeting_id: Only items of this meeting
+            limit: Maximum number of items to return
+            after: Cursor for the next page; encodes the meeting and ID of the
+                last item (item IDs are only unique within a meeting)
+
+        Returns:
+            Tuple[List[dict], Optional[str]]: Items and the cursor for the next page
+
+        Raises:
+            ValueError: If the cursor is malformed or its item no longer exists
+        """
+        conn = self._connect()
+        conditions, params = [], []
+        if status:
+            conditions.append(f"status IN ({', '.join('?' * len(status))})")
+            params.extend(status)
+        if assignee is not None:
+            conditions.append('assignee = ?')
+            params.append(assignee)
+        if priority:
+            conditions.append(f"priority IN ({', '.join('?' * len(priority))})")
+            params.extend(priority)
+        if meeting_id is not None:
+            conditions.append('meeting_id = ?')
+            params.append(meeting_id)
+        if after is not None:
+            cursor_row = conn.execute(
+                'SELECT created_at, meeting_id, position FROM action_items WHERE meeting_id = ? AND item_id = ?',
+                decode_cursor(after, 2)
+            ).fetchone()
+            if cursor_row is None:
+                raise ValueError(f"Unknown cursor: {after}")
+            conditions.append("(COALESCE(created_at, ''), meeting_id, position) < (?, ?, ?)")
+            params.extend([cursor_row['created_at'] or '', cursor_row['meeting_id'], cursor_row['position']])
+
+        query = 'SELECT meeting_id, item_id, data FROM action_items'
+        if conditions:
+            query += ' WHERE ' + ' AND '.join(conditions)
+        query += " ORDER BY COALESCE(created_at, '') DESC, meeting_id DESC, position DESC LIMIT ?"
+        params.append(limit + 1)
+
+        rows = conn.execute(query, params).fetchall()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        next_cursor = encode_cursor(rows[-1]['meeting_id'], rows[-1]['item_id']) if has_more else None
+        return [json.loads(row['data']) for row in rows], next_cursor
+
+    def update_action_items(self, updates: List[dict]) -> dict:
+        """
+        Change several action items, possibly of different meetings, in one transaction
+        Only the item rows are rewritten (plus each meeting's counts and version);
+        if any item does not exist nothing is changed
+
+        Args:
+            updates: Dicts with meetingId, id and the fields to change
+                (see ACTION_ITEM_UPDATE_FIELDS)
+
+        Returns:
+            dict: {meeting_id: all action items of the meeting after the update}
+
+        Raises:
+            KeyError: If an item does not exist
+            ValueError: If an update changes a field that cannot be changed
+        """
+        for update in updates:
+            unknown = set(update) - {'meetingId', 'id'} - set(ACTION_ITEM_UPDATE_FIELDS)
+            if unknown:
+                raise ValueError(f"Fields cannot be updated: {', '.join(sorted(unknown))}")
+
+        updated = {}
+        with STORE_WRITE_SECONDS.time(operation='update_action_items'), self._transaction() as conn:
+            for update in updates:
+                row = conn.execute(
+                    'SELECT position, data FROM action_items WHERE meeting_id = ? AND item_id = ?',
+                    (update.get('meetingId'), update.get('id'))
+                ).fetchone()
+                if row is None:
+                    raise KeyError(f"Action item {update.get('id')} of meeting {update.get('meetingId')} not found")
+
+                item = json.loads(row['data'])
+                item.update({key: value for key, value in update.items() if key not in ('meetingId', 'id')})
+                conn.execute(
+                    'UPDATE action_items SET status = ?, assignee = ?, priority = ?, data = ? '
+                    'WHERE meeting_id = ? AND position = ?',
+                    (item.get('status'), item.get('assignee'), item.get('priority'), json.dumps(item),
+                     update['meetingId'], row['position'])
+                )
+                updated[update['meetingId']] = None
+
+            for meeting_id in updated:
+                conn.execute(
+                    """
+                    UPDATE meetings SET
+                        action_item_counts = COALESCE((
+                            SELECT json_group_object(status, n) FROM (
+                                SELECT COALESCE(status, 'unknown') AS status, COUNT(*) AS n
+                                FROM action_items WHERE meeting_id = meetings.id GROUP BY 1
+                            )
+                        ), '{}'),
+                        version = version + 1
+                    WHERE id = ?
+                    """,
+                    (meeting_id,)
+                )
+                updated[meeting_id] = [
+                    json.loads(row['data']) for row in conn.execute(
+                        'SELECT data FROM action_items WHERE meeting_id = ? ORDER BY position', (meeting_id,)
+                    )
+                ]
+        return updated
+
+    # ============ Search ============
+
+    def search_segments(self, query: str, limit: int = 20, offset: int = 0,
+                        meeting_id: Optional[str] = None) -> List[dict]:
+        """
+        Full-text search over all transcript segments
+        The transcript_fts index is maintained by triggers on transcript_segments,
+        so segments are searchable as soon as their chunk is committed
+
+        Args:
+            query: Words to find (all must match; the last one also as a prefix)
+            limit: Maximum number of results
+            offset: Number of results to skip
+            meeting_id: Only search this meeting
+
+        Returns:
+            List[dict]: Matches, best first, with a highlighted snippet
+        """
+        fts_query = fts_match_query(query)
+        if not fts_query:
+            return []
+
+        sql = """
+            SELECT s.meeting_id, m.title, s.segment_id, s.start_time, s.end_time,
+                   f.speaker, snippet(transcript_fts, 0, '<mark>', '</mark>', '...', 16) AS snippet,
+                   f.rank
+            FROM transcript_fts f
+            JOIN transcript_segments s ON s.rowid = f.rowid
+            JOIN meetings m ON m.id = s.meeting_id
+            WHERE transcript_fts MATCH ?
+        """
+        params = [fts_query]
+        if meeting_id is not None:
+            sql += ' AND s.meeting_id = ?'
+            params.append(meeting_id)
+        sql += ' ORDER BY f.rank LIMIT ? OFFSET ?'
+        params.extend([limit, offset])
+
+        return [
+            {
+                'meetingId': row['meeting_id'],
+                'meetingTitle': row['title'],
+                'segmentId': row['segment_id'],
+                'speaker': row['speaker'],
+                'snippet': row['snippet'],
+                'startMs': round(row['start_time'] * 1000) if row['start_time'] is not None else None,
+                'endMs': round(row['end_time'] * 1000) if row['end_time'] is not None else None,
+                'score': -row['rank']  # bm25: lower is better
+            }
+            for row in self._connect().execute(sql, params)
+        ]
+
+    # ============ GitHub Issues ============
+
+    def claim_github_issue(self, repo: str, key: str) -> Optional[dict]:
+        """
+        Reserve an issue key before creating its issue
+
+        Args:
+            repo: owner/name
+            key: Issue key
+
+        Returns:
+            Optional[dict]: None if the key was free and is now claimed ('creating'),
+                otherwise the existing mapping (state, number, url, claimed_at)
+        """
+        with self._transaction() as conn:
+            row = conn.execute(
+                'SELECT state, number, url, claimed_at FROM github_issues WHERE repo = ? AND issue_key = ?',
+                (repo, key)
+            ).fetchone()
+            if row is not None:
+                return dict(row)
+            now = time.time()
+            conn.execute(
+                'INSERT INTO github_issues (repo, issue_key, state, claimed_at, updated_at) '
+                "VALUES (?, ?, 'creating', ?, ?)",
+                (repo, key, now, now)
+            )
+            return None
+
+    def record_github_issue(self, repo: str, key: str, number: int, url: str):
+        """Record the issue created for a key"""
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE github_issues SET state = 'created', number = ?, url = ?, updated_at = ? "
+                'WHERE repo = ? AND issue_key = ?',
+                (number, url, time.time(), repo, key)
+            )
+
+    def release_github_issue(self, repo: str, key: str):
+        """Drop the claim on a key whose issue was certainly not created"""
+        with self._transaction() as conn:
+            conn.execute(
+                "DELETE FROM github_issues WHERE repo = ? AND issue_key = ? AND state = 'creating'",
+                (repo, key)
+            )
+
+    # ============ Chunk Journal ============
+
+    def journal_chunk(self, path: str, meeting_id: str, recording_id: str, chunk_index: int,
+                      state: str, info: Optional[dict] = None):
+        """
+        Record the state of an audio chunk, creating its journal entry if needed
+
+        Args:
+            path: Final chunk file path (the journal key)
+            meeting_id: Meeting the chunk belongs to
+            recording_id: Recording (capture session) the chunk belongs to
+            chunk_index: Index of the chunk within the recording
+            state: One of CHUNK_STATES
+            info: Capture metadata (time map, channel labels, ...); kept if None
+        """
+        with self._transaction() as conn:
+            conn.execute(
+                """
+                INSERT INTO chunk_journal (path, meeting_id, recording_id, chunk_index, state, info, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(path) DO UPDATE SET
+                    state = excluded.state,
+                    info = COALESCE(excluded.info, info),
+                    updated_at = excluded.updated_at
+                """,
+                (path, meeting_id, recording_id, chunk_index, state,
+                 json.dumps(info) if info is not None else None, time.time())
+            )
+
+    def set_chunk_state(self, path: str, state: str) -> bool:
+        """
+        Move a journaled chunk to a new state
+
+        Returns:
+            bool: True if the chunk is journaled (chunks submitted by other
+                means than capture are not)
+        """
+        with self._transaction() as conn:
+            return self._set_chunk_state(conn, path, state)
+
+    def _set_chunk_state(self, conn: sqlite3.Connection, path: str, state: str) -> bool:
+        cursor = conn.execute(
+            'UPDATE chunk_journal SET state = ?, updated_at = ? WHERE path = ?',
+            (state, time.time(), path)
+        )
+        return cursor.rowcount > 0
+
+    def unfinished_chunks(self, before: float, max_recoveries: int) -> List[dict]:
+        """
+        Chunks that never reached a final state (see UNFINISHED_CHUNK_STATES)
+
+        Args:
+            before: Only chunks last updated before this time (time.time()),
+                i.e. left behind by an earlier run of the backend
+            max_recoveries: Leave out chunks already re-enqueued this many times
+
+        Returns:
+            List[dict]: Journal entries ordered by meeting, recording and chunk index
+        """
+        placeholders = ', '.join('?' * len(UNFINISHED_CHUNK_STATES))
+        rows = self._connect().execute(
+            f"""
+            SELECT * FROM chunk_journal
+            WHERE state IN ({placeholders}) AND updated_at < ? AND recoveries < ?
+            ORDER BY meeting_id, recording_id, chunk_index
+            """,
+            (*UNFINISHED_CHUNK_STATES, before, max_recoveries)
+        ).fetchall()
+        return [
+            {**dict(row), 'info': json.loads(row['info']) if row['info'] else None}
+            for row in rows
+        ]
+
+    def count_chunk_recovery(self, path: str):
+        """Note that a chunk was re-enqueued by a recovery pass"""
+        with self._transaction() as conn:
+            conn.execute('UPDATE chunk_journal SET recoveries = recoveries + 1 WHERE path = ?', (path,))
+
+    def get_chunk_journal_status(self) -> dict:
+        """
+        Count journaled chunks by state
+
+        Returns:
+            dict: {state: count}
+        """
+        rows = self._connect().execute(
+            'SELECT state, COUNT(*) FROM chunk_journal GROUP BY state'
+        ).fetchall()
+        return {state: count for state, count in rows}
+
+    # ============ Migration ============
+
+    def migrate_json_files(self, data_dir: str) -> int:
+        """
+        Import legacy data/meeting_*.json files into the database
+        Each imported file is renamed to *.json.migrated so the import runs once
+
+        Args:
+            data_dir: Directory containing the legacy JSON files
+
+        Returns:
+            int: Number of meetings imported
+        """
+        if not os.path.isdir(data_dir):
+            return 0
+
+        migrated = 0
+        for filename in sorted(os.listdir(data_dir)):
+            if not (filename.startswith('meeting_') and filename.endswith('.json')):
+                continue
+
+            filepath = os.path.join(data_dir, filename)
+            try:
+                with open(filepath, 'r') as f:
+                    meeting_data = json.load(f)
+                self.save_meeting(meeting_data)
+                os.replace(filepath, filepath + '.migrated')
+                migrated += 1
+            except Exception as e:
+                print(f"[MeetingStore] Failed to migrate {filename}: {e}")
+
+        if migrated:
+            print(f"[MeetingStore] Migrated {migrated} meeting file(s) from {data_dir}")
+        return migrated
+
+
+# Global instance
+meeting_store = MeetingStore()
+
+
+def get_meeting_store() -> MeetingStore:
+    """Get the global meeting store instance"""
+    return meeting_store
+
+
+if __name__ == '__main__':
+    # One-shot migration: python meeting_store.py
+    count = meeting_store.migrate_json_files('data')
+    print(f"[MeetingStore] {count} meeting(s) migrated into {meeting_store.db_path}")
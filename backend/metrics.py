@@ -0,0 +1,252 @@
+"""
+Pipeline Metrics
+Timing histograms, counters and gauges for each pipeline stage, rendered in
+the Prometheus text format at /metrics, plus optional per-chunk JSON traces
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Optional, Callable, Dict, Tuple
+
+
+# Upper bounds in seconds; covers sub-millisecond writes up to slow uploads
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+                   1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+
+def _label_key(labels: dict) -> Tuple:
+    return tuple(sorted(labels.items()))
+
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(key: Tuple, extra: Optional[Tuple] = None) -> str:
+    items = list(key) + ([extra] if extra else [])
+    if not items:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in items) + '}'
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """Monotonically increasing count per label set"""
+
+    type = 'counter'
+
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help = help_text
+        self._values: Dict[Tuple, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def samples(self):
+        with self._lock:
+            return [(self.name, key, value) for key, value in self._values.items()]
+
+
+class Gauge:
+    """
+    Current value per label set
+    With a callback, the value is read at render time instead
+    (callback returns a number, or a dict of {label tuple: value})
+    """
+
+    type = 'gauge'
+
+    def __init__(self, name: str, help_text: str, callback: Optional[Callable] = None):
+        self.name = name
+        self.help = help_text
+        self.callback = callback
+        self._values: Dict[Tuple, float] = {}
+        self._lock = threading.Lock()
+
+    def set(self, value: float, **labels):
+        with self._lock:
+            self._values[_label_key(labels)] = value
+
+    def samples(self):
+        if self.callback is not None:
+            value = self.callback()
+            if isinstance(value, dict):
+                return [(self.name, key, v) for key, v in value.items()]
+            return [(self.name, (), value)]
+        with self._lock:
+            return [(self.name, key, value) for key, value in self._values.items()]
+
+
+class Histogram:
+    """Cumulative bucket counts, sum and count per label set"""
+
+    type = 'histogram'
+
+    def __init__(self, name: str, help_text: str, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help_text
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[Tuple, list] = {}  # key -> [bucket counts..., sum, count]
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0] * len(self.buckets) + [0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+                    break
+            series[-2] += value
+            series[-1] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        """Observe the duration of a block (also when it raises)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def samples(self):
+        samples = []
+        with self._lock:
+            for key, series in self._series.items():
+                cumulative = 0
+                for bound, count in zip(self.buckets, series):
+                    cumulative += count
+                    samples.append((f'{self.name}_bucket', key, cumulative, ('le', _format_value(bound))))
+                samples.append((f'{self.name}_bucket', key, series[-1], ('le', '+Inf')))
+                samples.append((f'{self.name}_sum', key, series[-2]))
+                samples.append((f'{self.name}_count', key, series[-1]))
+        return samples
+
+
+class MetricsRegistry:
+    """Named metrics, created on first use"""
+
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls, name: str, *args, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, *args, **kwargs)
+            elif not isinstance(metric, cls):
+                raise ValueError(f"Metric {name} is already registered as a {metric.type}")
+            return metric
+
+    def counter(self, name: str, help_text: str = '') -> Counter:
+        return self._get_or_create(Counter, name, help_text)
+
+    def gauge(self, name: str, help_text: str = '', callback: Optional[Callable] = None) -> Gauge:
+        gauge = self._get_or_create(Gauge, name, help_text)
+        if callback is not None:
+            gauge.callback = callback
+        return gauge
+
+    def histogram(self, name: str, help_text: str = '',
+                  buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> Histogram:
+        return self._get_or_create(Histogram, name, help_text, buckets)
+
+    def render(self) -> str:
+        """
+        Render all metrics in the Prometheus text exposition format
+
+        Returns:
+            str: Exposition text (content type text/plain; version=0.0.4)
+        """
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+
+        lines = []
+        for metric in metrics:
+            try:
+                samples = metric.samples()
+            except Exception as e:
+                print(f"[Metrics] Error collecting {metric.name}: {e}")
+                continue
+            if metric.help:
+                lines.append(f'# HELP {metric.name} {metric.help}')
+            lines.append(f'# TYPE {metric.name} {metric.type}')
+            for sample in samples:
+                name, key, value = sample[:3]
+                extra = sample[3] if len(sample) > 3 else None
+                lines.append(f'{name}{_format_labels(key, extra)} {_format_value(value)}')
+        return '\n'.join(lines) + '\n'
+
+
+class ChunkTracer:
+    """
+    Optional per-chunk JSON trace
+    Collects timestamped pipeline events for each chunk and writes them to
+    <trace_dir>/<meeting_id>_chunk_<n>.json when the chunk is done
+    """
+
+    def __init__(self, trace_dir: str = os.path.join('data', 'traces'), enabled: bool = False):
+        self.trace_dir = trace_dir
+        self.enabled = enabled
+        self._traces: Dict[Tuple[str, int], dict] = {}
+        self._lock = threading.Lock()
+
+    def event(self, meeting_id: str, chunk_index: int, stage: str, **fields):
+        """Record a pipeline event for a chunk (no-op when disabled)"""
+        if not self.enabled:
+            return
+        with self._lock:
+            trace = self._traces.setdefault((meeting_id, chunk_index), {
+                'meeting_id': meeting_id, 'chunk_index': chunk_index, 'events': []
+            })
+            trace['events'].append({'stage': stage, 'time': time.time(), **fields})
+
+    def finish(self, meeting_id: str, chunk_index: int, stage: str = 'done', **fields):
+        """Record the final event and write the trace file"""
+        if not self.enabled:
+            return
+        self.event(meeting_id, chunk_index, stage, **fields)
+        with self._lock:
+            trace = self._traces.pop((meeting_id, chunk_index), None)
+        if trace is None:
+            return
+
+        events = trace['events']
+        trace['total_seconds'] = events[-1]['time'] - events[0]['time']
+        os.makedirs(self.trace_dir, exist_ok=True)
+        path = os.path.join(self.trace_dir, f'{meeting_id}_chunk_{chunk_index}.json')
+        try:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(trace, f, indent=2)
+        except OSError as e:
+            print(f"[Metrics] Error writing trace {path}: {e}")
+
+
+# Global instances
+metrics = MetricsRegistry()
+chunk_tracer = ChunkTracer()
+
+
+def get_metrics() -> MetricsRegistry:
+    """Get the global metrics registry"""
+    return metrics
+
+
+def get_chunk_tracer() -> ChunkTracer:
+    """Get the global chunk tracer"""
+    return chunk_tracer
@@ -0,0 +1,338 @@
+"""
+Service Providers
+Transcription and LLM backends behind one interface, so the pipeline can run
+against the real services or against deterministic local fakes. Every
+provider supports latency and error injection for load testing
+"""
+
+import json
+import os
+import random
+import re
+import threading
+import time
+import wave
+import hashlib
+from typing import Optional, List
+
+try:
+    import soundfile as sf
+except (ImportError, OSError):  # Only needed to read FLAC/Opus chunks in the fake
+    sf = None
+
+
+class ProviderError(Exception):
+    """Raised by a provider call that failed (including injected failures)"""
+
+
+class Provider:
+    """
+    Base class for service providers
+    Subclasses implement the actual call; the public method first applies
+    the configured latency and error injection
+    """
+
+    name = 'base'
+
+    def __init__(self, latency_ms: float = 0, jitter_ms: float = 0,
+                 error_rate: float = 0.0, timeout_rate: float = 0.0,
+                 timeout_ms: float = 30000, seed: Optional[int] = None):
+        """
+        Initialize provider
+
+        Args:
+            latency_ms: Delay added to every call
+            jitter_ms: Random +/- variation of the delay
+            error_rate: Probability (0-1) that a call fails with ProviderError
+            timeout_rate: Probability (0-1) that a call hangs for timeout_ms
+                and then fails with ProviderError
+            timeout_ms: How long an injected timeout hangs
+            seed: Seed for the injection RNG (None = nondeterministic)
+        """
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.timeout_rate = timeout_rate
+        self.timeout_ms = timeout_ms
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+
+    @property
+    def configured(self) -> bool:
+        """Whether the provider has what it needs (e.g. an API key)"""
+        return True
+
+    def configure(self, api_key: str):
+        """Set the API key (ignored by providers that do not need one)"""
+
+    def _inject(self):
+        """Apply injected latency, failures and timeouts"""
+        with self._rng_lock:
+            delay = self.latency_ms + self._rng.uniform(-self.jitter_ms, self.jitter_ms)
+            roll = self._rng.random()
+        if delay > 0:
+            time.sleep(delay / 1000)
+        if roll < self.error_rate:
+            raise ProviderError(f"Injected {self.name} failure")
+        if roll < self.error_rate + self.timeout_rate:
+            time.sleep(self.timeout_ms / 1000)
+            raise ProviderError(f"Injected {self.name} timeout after {self.timeout_ms:.0f} ms")
+
+
+class TranscriptionProvider(Provider):
+    """
+    Speech-to-text provider
+    Results are utterance dicts with speaker, text, start and end
+    (milliseconds into the audio), confidence and, for multichannel
+    audio, the 1-based channel
+    """
+
+    def transcribe(self, audio_path: str, options: dict) -> List[dict]:
+        """
+        Transcribe an audio file
+
+        Args:
+            audio_path: Path to the audio chunk
+            options: Transcription options (TranscriptionConfig keyword arguments)
+
+        Returns:
+            List[dict]: Utterances in order
+
+        Raises:
+            ProviderError: If the transcription failed
+        """
+        self._inject()
+        return self._transcribe(audio_path, options)
+
+    def _transcribe(self, audio_path: str, options: dict) -> List[dict]:
+        raise NotImplementedError
+
+
+class AssemblyAITranscriptionProvider(TranscriptionProvider):
+    """AssemblyAI batch transcription"""
+
+    name = 'assemblyai'
+
+    def __init__(self, **fault_injection):
+        super().__init__(**fault_injection)
+        self._api_key: Optional[str] = None
+
+    @property
+    def configured(self) -> bool:
+        return self._api_key is not None
+
+    def configure(self, api_key: str):
+        import assemblyai as aai
+
+        aai.settings.api_key = api_key
+        self._api_key = api_key
+
+    def _transcribe(self, audio_path: str, options: dict) -> List[dict]:
+        import assemblyai as aai
+
+        config = aai.TranscriptionConfig(**options)
+        transcript = aai.Transcriber().transcribe(audio_path, config=config)
+        if transcript.status == aai.TranscriptStatus.error:
+            raise ProviderError(f"Transcription failed: {transcript.error}")
+
+        return [
+            {
+                'speaker': utterance.speaker,
+                'text': utterance.text,
+                'start': utterance.start,
+                'end': utterance.end,
+                'confidence': utterance.confidence,
+                'channel': utterance.channel  # Set for multichannel audio
+            }
+            for utterance in transcript.utterances or []
+        ]
+
+
+class FakeTranscriptionProvider(TranscriptionProvider):
+    """
+    Deterministic offline transcriber
+    Emits one placeholder utterance per utterance_ms of audio, alternating
+    between two speakers; the text depends only on the audio bytes
+    """
+
+    name = 'fake'
+
+    def __init__(self, utterance_ms: int = 5000, **fault_injection):
+        super().__init__(**fault_injection)
+        self.utterance_ms = utterance_ms
+
+    def _transcribe(self, audio_path: str, options: dict) -> List[dict]:
+        with open(audio_path, 'rb') as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+        duration_ms = int(audio_duration(audio_path) * 1000)
+
+        utterances = []
+        for i, start in enumerate(range(0, duration_ms, self.utterance_ms)):
+            utterances.append({
+                'speaker': 'AB'[i % 2],
+                'text': f"Fake utterance {i + 1} of chunk {digest[:8]}; "
+                        f"{'we will follow up on item ' + str(i + 1) if i % 3 == 0 else 'discussion continues'}.",
+                'start': start,
+                'end': min(start + self.utterance_ms, duration_ms),
+                'confidence': 0.9
+            })
+        return utterances
+
+
+class LLMProvider(Provider):
+    """Text completion provider used for meeting analysis"""
+
+    model = ''
+
+    def complete(self, prompt: str, max_tokens: int) -> str:
+        """
+        Run a single prompt
+
+        Args:
+            prompt: User message
+            max_tokens: Response token limit
+
+        Returns:
+            str: Response text
+
+        Raises:
+            ProviderError: If the call failed
+        """
+        self._inject()
+        return self._complete(prompt, max_tokens)
+
+    def _complete(self, prompt: str, max_tokens: int) -> str:
+        raise NotImplementedError
+
+
+class AnthropicLLMProvider(LLMProvider):
+    """Anthropic Claude Messages API"""
+
+    name = 'anthropic'
+    model = "claude-sonnet-4-5-20250929"
+
+    def __init__(self, **fault_injection):
+        super().__init__(**fault_injection)
+        self.client = None
+
+    @property
+    def configured(self) -> bool:
+        return self.client is not None
+
+    def configure(self, api_key: str):
+        import anthropic
+
+        self.client = anthropic.Anthropic(api_key=api_key)
+
+    def _complete(self, prompt: str, max_tokens: int) -> str:
+        message = self.client.messages.create(
+            model=self.model,
+            max_tokens=max_tokens,
+            messages=[{"role": "user", "content": prompt}]
+        )
+        return message.content[0].text
+
+
+class FakeLLMProvider(LLMProvider):
+    """
+    Deterministic offline analyzer
+    Answers the map and reduce prompts of meeting_analyzer with valid JSON:
+    transcript lines mentioning "will" become action items, and the merge
+    step concatenates the notes it is given
+    """
+
+    name = 'fake'
+    model = 'fake'
+
+    def _complete(self, prompt: str, max_tokens: int) -> str:
+        if 'NOTES:\n' in prompt:
+            notes = json.loads(prompt.split('NOTES:\n', 1)[1])
+            merged = {key: [] for key in ('keyDecisions', 'nextSteps', 'blockers', 'topics')}
+            for note in notes:
+                for key in merged:
+                    merged[key].extend(note.get(key, []))
+            return json.dumps({
+                'actionItems': [item for note in notes for item in note.get('actionItems', [])],
+                'summary': {
+                    'overview': ' '.join(note.get('notes', '') for note in notes),
+                    **merged
+                }
+            })
+
+        lines = [line for line in prompt.split('\n') if re.match(r'^.+ \([\d.]+s\): ', line)]
+        return json.dumps({
+            'notes': f"{len(lines)} transcript lines",
+            'actionItems': [
+                {
+                    'text': line.split('): ', 1)[1],
+                    'assignee': line.split(' (', 1)[0],
+                    'priority': 'medium',
+                    'context': line
+                }
+                for line in lines if ' will ' in line
+            ],
+            'keyDecisions': [],
+            'nextSteps': [],
+            'blockers': [],
+            'topics': []
+        })
+
+
+def audio_duration(path: str) -> float:
+    """Duration of an audio file in seconds (WAV, or anything soundfile reads)"""
+    if path.endswith('.wav'):
+        with wave.open(path, 'rb') as wf:
+            return wf.getnframes() / wf.getframerate()
+    if sf is None:
+        raise ProviderError(f"Reading {os.path.splitext(path)[1]} files requires the soundfile package")
+    return sf.info(path).duration
+
+
+TRANSCRIPTION_PROVIDERS = {
+    'assemblyai': AssemblyAITranscriptionProvider,
+    'fake': FakeTranscriptionProvider,
+}
+
+LLM_PROVIDERS = {
+    'anthropic': AnthropicLLMProvider,
+    'fake': FakeLLMProvider,
+}
+
+
+def fault_injection_from_env() -> dict:
+    """Read latency and error injection settings from PROVIDER_* variables"""
+    seed = os.getenv('PROVIDER_SEED')
+    return {
+        'latency_ms': float(os.getenv('PROVIDER_LATENCY_MS', 0)),
+        'jitter_ms': float(os.getenv('PROVIDER_JITTER_MS', 0)),
+        'error_rate': float(os.getenv('PROVIDER_ERROR_RATE', 0)),
+        'timeout_rate': float(os.getenv('PROVIDER_TIMEOUT_RATE', 0)),
+        'timeout_ms': float(os.getenv('PROVIDER_TIMEOUT_MS', 30000)),
+        'seed': int(seed) if seed else None
+    }
+
+
+def create_transcription_provider(name: str, **fault_injection) -> TranscriptionProvider:
+    """
+    Create a transcription provider by name
+
+    Args:
+        name: A key of TRANSCRIPTION_PROVIDERS
+        **fault_injection: latency_ms, jitter_ms, error_rate, timeout_rate, timeout_ms, seed
+    """
+    if name not in TRANSCRIPTION_PROVIDERS:
+        raise ValueError(f"Unknown transcription provider: {name}")
+    return TRANSCRIPTION_PROVIDERS[name](**fault_injection)
+
+
+def create_llm_provider(name: str, **fault_injection) -> LLMProvider:
+    """
+    Create an LLM provider by name
+
+    Args:
+        name: A key of LLM_PROVIDERS
+        **fault_injection: latency_ms, jitter_ms, error_rate, timeout_rate, timeout_ms, seed
+    """
+    if name not in LLM_PROVIDERS:
+        raise ValueError(f"Unknown LLM provider: {name}")
+    return LLM_PROVIDERS[name](**fault_injection)
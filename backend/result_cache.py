@@ -0,0 +1,187 @@
+"""
+Result Cache
+Persistent content-addressed cache for transcription and analysis results
+Entries are keyed by a hash of everything that determines the result, so a
+repeated request (re-analysis, retried or replayed chunk) is served locally
+"""
+
+import sqlite3
+import threading
+import hashlib
+import json
+import os
+import time
+from typing import Optional, Any
+
+
+def content_key(namespace: str, *parts: Any) -> str:
+    """
+    Build a cache key from the inputs of a computation
+
+    Args:
+        namespace: Kind of result (e.g. 'analysis', 'transcription')
+        *parts: JSON-serializable inputs (prompt, model, config, content hash, ...)
+
+    Returns:
+        str: Hex SHA-256 digest
+    """
+    payload = json.dumps([namespace, *parts], sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def file_digest(path: str, block_size: int = 1 << 20) -> str:
+    """Hex SHA-256 digest of a file's bytes, read in blocks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    SQLite-backed LRU cache
+    Least recently used entries are evicted once the total size of the
+    stored values exceeds max_bytes or the entry count exceeds max_entries
+    Recency is tracked to within touch_seconds, so hits on hot entries are
+    reads and do not each write to the database
+    """
+
+    def __init__(self, db_path: str = os.path.join('data', 'cache.db'),
+                 max_bytes: int = 256 * 1024 * 1024, max_entries: int = 10000,
+                 touch_seconds: float = 60.0):
+        """
+        Initialize result cache
+
+        Args:
+            db_path: Path to the SQLite database file
+            max_bytes: Maximum total size of cached values
+            max_entries: Maximum number of cached entries
+            touch_seconds: A hit updates last_used only if it is older than this
+        """
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.touch_seconds = touch_seconds
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+        db_dir = os.path.dirname(db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+        self._connect().executescript("""
+            CREATE TABLE IF NOT EXISTS cache_entries (
+                key TEXT PRIMARY KEY,
+                namespace TEXT NOT NULL,
+                value TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_used REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_cache_last_used ON cache_entries(last_used);
+        """)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Get the SQLite connection for the calling thread"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, isolation_level=None, timeout=30)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up a cached value and mark it as recently used
+
+        Returns:
+            Optional[Any]: The cached value, or None on a miss
+        """
+        conn = self._connect()
+        row = conn.execute('SELECT value, last_used FROM cache_entries WHERE key = ?', (key,)).fetchone()
+        with self._lock:
+            self._stats['hits' if row else 'misses'] += 1
+        if row is None:
+            return None
+        now = time.time()
+        if now - row[1] >= self.touch_seconds:
+            conn.execute('UPDATE cache_entries SET last_used = ? WHERE key = ? AND last_used < ?',
+                         (now, key, now - self.touch_seconds))
+        return json.loads(row[0])
+
+    def put(self, key: str, value: Any, namespace: str = ''):
+        """
+        Store a JSON-serializable value, evicting old entries if over the limits
+
+        Args:
+            key: Key from content_key()
+            value: Result to cache
+            namespace: Kind of result, for stats and clear()
+        """
+        data = json.dumps(value)
+        now = time.time()
+        conn = self._connect()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            conn.execute(
+                'INSERT OR REPLACE INTO cache_entries '
+                '(key, namespace, value, size, created_at, last_used) VALUES (?, ?, ?, ?, ?, ?)',
+                (key, namespace, data, len(data), now, now)
+            )
+            evicted = self._evict(conn)
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        if evicted:
+            with self._lock:
+                self._stats['evictions'] += evicted
+
+    def _evict(self, conn: sqlite3.Connection) -> int:
+        """Delete least recently used entries until within limits (inside a transaction)"""
+        count, total = conn.execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache_entries').fetchone()
+        if count <= self.max_entries and total <= self.max_bytes:
+            return 0
+
+        evicted = 0
+        rows = conn.execute('SELECT key, size FROM cache_entries ORDER BY last_used').fetchall()
+        doomed = []
+        for key, size in rows[:-1]:  # Never evict the entry just written
+            if count <= self.max_entries and total <= self.max_bytes:
+                break
+            doomed.append((key,))
+            count -= 1
+            total -= size
+            evicted += 1
+        conn.executemany('DELETE FROM cache_entries WHERE key = ?', doomed)
+        return evicted
+
+    def clear(self, namespace: Optional[str] = None):
+        """Delete all entries, or all entries of one namespace"""
+        conn = self._connect()
+        if namespace is None:
+            conn.execute('DELETE FROM cache_entries')
+        else:
+            conn.execute('DELETE FROM cache_entries WHERE namespace = ?', (namespace,))
+
+    def get_status(self) -> dict:
+        """
+        Get cache status
+
+        Returns:
+            dict: Entry count and size per namespace, limits and hit/miss counters
+        """
+        rows = self._connect().execute(
+            'SELECT namespace, COUNT(*), SUM(size) FROM cache_entries GROUP BY namespace'
+        ).fetchall()
+        with self._lock:
+            stats = dict(self._stats)
+        return {
+            'namespaces': {ns: {'entries': n, 'bytes': size} for ns, n, size in rows},
+            'entries': sum(row[1] for row in rows),
+            'bytes': sum(row[2] for row in rows),
+            'max_entries': self.max_entries,
+            'max_bytes': self.max_bytes,
+            **stats
+        }
@@ -0,0 +1,275 @@
+"""
+Streaming Transcription
+Pluggable real-time transcribers fed with captured audio as it is recorded
+Produces partial and final segments within seconds instead of per chunk
+"""
+
+import threading
+import queue
+import numpy as np
+from typing import Optional, Callable
+
+from audio_dsp import downmix
+
+
+class StreamingTranscriber:
+    """
+    Base class for streaming transcription engines
+    feed() is called from the capture thread and never blocks; audio is
+    handed to the engine on a separate thread. Subclasses implement
+    _open(), _process() and _close() and report results through
+    _emit_partial() / _emit_final()
+
+    Result dicts have: text, start, end (seconds since stream start), confidence
+
+    finalized_seconds is how much of the fed audio is settled: every final
+    for audio before it has been delivered (and its callback has returned)
+    """
+
+    name = 'base'
+
+    def __init__(self):
+        self.sample_rate = 16000
+        self.channels = 1
+        self.healthy = False
+        self.error: Optional[str] = None
+        self.finalized_seconds = 0.0
+        self._fed_seconds = 0.0
+        self._on_partial: Optional[Callable[[dict], None]] = None
+        self._on_final: Optional[Callable[[dict], None]] = None
+        self._queue = queue.Queue(maxsize=64)
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self, sample_rate: int, channels: int,
+              on_partial: Callable[[dict], None], on_final: Callable[[dict], None]):
+        """
+        Open the stream
+
+        Args:
+            sample_rate: Sample rate of the audio passed to feed()
+            channels: Channels of the audio passed to feed()
+            on_partial: Called with interim results (may be revised)
+            on_final: Called with finished utterances
+        """
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self._on_partial = on_partial
+        self._on_final = on_final
+        self._open()
+        self.healthy = True
+        self._thread = threading.Thread(target=self._feed_loop, daemon=True)
+        self._thread.start()
+
+    def feed(self, frames: np.ndarray):
+        """
+        Queue captured float audio of shape (n, channels)
+        Drops the audio and marks the stream unhealthy if the engine falls behind
+        """
+        if not self.healthy:
+            return
+        try:
+            self._queue.put_nowait(frames)
+        except queue.Full:
+            self._fail('Streaming transcriber fell behind')
+
+    def stop(self, timeout: float = 10.0):
+        """Flush pending audio, finish the last utterance and close the stream"""
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join(timeout=timeout)
+        self._thread = None
+
+    def _feed_loop(self):
+        """Deliver queued audio to the engine"""
+        while True:
+            frames = self._queue.get()
+            if frames is None:
+                break
+            if not self.healthy:
+                continue
+            try:
+                self._process(frames)
+                self._fed_seconds += len(frames) / self.sample_rate
+            except Exception as e:
+                self._fail(str(e))
+        try:
+            self._close()
+            # The engine flushed its last utterance, so everything fed is settled
+            if self.healthy:
+                self._settle(self._fed_seconds)
+        except Exception as e:
+            print(f"[Streaming] Error closing {self.name} stream: {e}")
+
+    def _fail(self, error: str):
+        """Mark the stream as failed so callers fall back to batch transcription"""
+        if self.healthy:
+            print(f"[Streaming] {self.name} stream failed: {error}")
+        self.healthy = False
+        self.error = error
+
+    def _emit_partial(self, result: dict):
+        if self._on_partial:
+            self._on_partial(result)
+
+    def _emit_final(self, result: dict):
+        if self._on_final and result.get('text'):
+            self._on_final(result)
+        self._settle(result['end'])
+
+    def _settle(self, seconds: float):
+        """Mark the audio before seconds as finalized"""
+        self.finalized_seconds = max(self.finalized_seconds, seconds)
+
+    @staticmethod
+    def to_pcm16(frames: np.ndarray) -> bytes:
+        """Convert float audio to mono 16-bit PCM bytes"""
+        mono = downmix(frames)[:, 0]
+        return (np.clip(mono, -1, 1) * 32767).astype('<i2').tobytes()
+
+    def _open(self):
+        raise NotImplementedError
+
+    def _process(self, frames: np.ndarray):
+        raise NotImplementedError
+
+    def _close(self):
+        raise NotImplementedError
+
+
+class StubStreamingTranscriber(StreamingTranscriber):
+    """
+    Deterministic local engine for tests and offline development
+    Detects utterances by frame energy and emits placeholder text:
+    partials while someone is speaking, a final when they pause
+    """
+
+    name = 'stub'
+
+    def __init__(self, partial_interval: float = 1.0, silence_seconds: float = 0.5,
+                 max_utterance_seconds: float = 15.0, energy_threshold: float = 0.005):
+        """
+        Initialize stub engine
+
+        Args:
+            partial_interval: Seconds of speech between partial results
+            silence_seconds: Silence that ends an utterance
+            max_utterance_seconds: Utterances longer than this are finalized anyway
+            energy_threshold: RMS level (0-1) treated as speech
+        """
+        super().__init__()
+        self.partial_interval = partial_interval
+        self.silence_seconds = silence_seconds
+        self.max_utterance_seconds = max_utterance_seconds
+        self.energy_threshold = energy_threshold
+
+    def _open(self):
+        self._frame_len = max(1, self.sample_rate * 30 // 1000)
+        self._position = 0  # Samples seen
+        self._utterance_start: Optional[int] = None
+        self._last_speech = 0
+        self._last_partial = 0
+        self._count = 0
+
+    def _process(self, frames: np.ndarray):
+        mono = downmix(frames)[:, 0]
+        usable = len(mono) - len(mono) % self._frame_len
+        blocks = mono[:usable].reshape(-1, self._frame_len)
+        speech = np.sqrt(np.mean(blocks * blocks, axis=1)) >= self.energy_threshold
+
+        rate = self.sample_rate
+        for i, is_speech in enumerate(speech):
+            frame_end = self._position + (i + 1) * self._frame_len
+            if is_speech:
+                if self._utterance_start is None:
+                    self._utterance_start = frame_end - self._frame_len
+                    self._last_partial = self._utterance_start
+                self._last_speech = frame_end
+            if self._utterance_start is None:
+                self._settle(frame_end / rate)
+                continue
+
+            if frame_end - self._last_speech >= self.silence_seconds * rate or \
+                    frame_end - self._utterance_start >= self.max_utterance_seconds * rate:
+                self._finish()
+            elif frame_end - self._last_partial >= self.partial_interval * rate:
+                self._last_partial = frame_end
+                self._emit_partial(self._result(frame_end))
+        self._position += len(mono)
+
+    def _close(self):
+        if self._utterance_start is not None:
+            self._finish()
+
+    def _finish(self):
+        self._emit_final(self._result(self._last_speech))
+        self._count += 1
+        self._utterance_start = None
+
+    def _result(self, end: int) -> dict:
+        start = self._utterance_start / self.sample_rate
+        end = end / self.sample_rate
+        return {
+            'text': f'[utterance {self._count + 1}: {end - start:.1f}s of speech]',
+            'start': start,
+            'end': end,
+            'confidence': 1.0
+        }
+
+
+class AssemblyAIStreamingTranscriber(StreamingTranscriber):
+    """AssemblyAI real-time transcription over WebSocket"""
+
+    name = 'assemblyai'
+
+    def _open(self):
+        import assemblyai as aai
+
+        self._aai = aai
+        self._transcriber = aai.RealtimeTranscriber(
+            sample_rate=self.sample_rate,
+            on_data=self._on_data,
+            on_error=lambda error: self._fail(str(error)),
+        )
+        self._transcriber.connect()
+
+    def _process(self, frames: np.ndarray):
+        self._transcriber.stream(self.to_pcm16(frames))
+
+    def _close(self):
+        self._transcriber.close()
+
+    def _on_data(self, transcript):
+        if not transcript.text:
+            return
+        result = {
+            'text': transcript.text,
+            'start': transcript.audio_start / 1000,
+            'end': transcript.audio_end / 1000,
+            'confidence': transcript.confidence
+        }
+        if isinstance(transcript, self._aai.RealtimeFinalTranscript):
+            self._emit_final(result)
+        else:
+            self._emit_partial(result)
+
+
+STREAMING_ENGINES = {
+    'stub': StubStreamingTranscriber,
+    'assemblyai': AssemblyAIStreamingTranscriber,
+}
+
+
+def create_streaming_transcriber(engine: str) -> StreamingTranscriber:
+    """
+    Create a streaming transcriber by name
+
+    Args:
+        engine: A key of STREAMING_ENGINES
+
+    Returns:
+        StreamingTranscriber: New, not yet started transcriber
+    """
+    if engine not in STREAMING_ENGINES:
+        raise ValueError(f"Unknown streaming engine: {engine}")
+    return STREAMING_ENGINES[engine]()
@@ -0,0 +1,56 @@
+"""
+Shared fixtures
+The backend modules are imported as top-level modules, as app.py does
+"""
+
+import os
+import sys
+import tempfile
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Backend modules keep their data in ./data and create the default stores on
+# import, so the tests run from a scratch directory
+os.chdir(tempfile.mkdtemp(prefix='fomo_tests_'))
+
+from meeting_store import MeetingStore  # noqa: E402
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Empty meeting store in a temporary directory"""
+    return MeetingStore(str(tmp_path / 'fomo.db'))
+
+
+@pytest.fixture(scope='session')
+def backend():
+    """The app module with the fake providers (imported once, like the server)"""
+    os.environ.update({'TRANSCRIPTION_PROVIDER': 'fake', 'LLM_PROVIDER': 'fake'})
+    import app
+    return app
+
+
+@pytest.fixture
+def client(backend):
+    """Flask test client"""
+    return backend.app.test_client()
+
+
+def make_meeting(meeting_id: str, start_time: str = '2026-01-01T10:00:00', segments: int = 0,
+                 action_items: list = None, **fields) -> dict:
+    """Meeting document as the API stores it"""
+    return {
+        'id': meeting_id,
+        'title': f'Meeting {meeting_id}',
+        'startTime': start_time,
+        'status': 'completed',
+        'transcript': [
+            {'id': f'{meeting_id}_s{i}', 'speaker': 'A', 'text': f'Segment {i}',
+             'startTime': float(i * 10), 'endTime': float(i * 10 + 5)}
+            for i in range(segments)
+        ],
+        'actionItems': action_items or [],
+        **fields,
+    }
@@ -0,0 +1,66 @@
+import pytest
+
+from conftest import make_meeting
+
+
+def item(item_id: str, timestamp: str, **fields) -> dict:
+    return {'id': item_id, 'text': f'Task {item_id}', 'status': 'pending', 'priority': 'medium',
+            'assignee': None, 'timestamp': timestamp, **fields}
+
+
+@pytest.fixture
+def meetings(store):
+    # Item IDs repeat across meetings (e.g. action_0 after every analysis)
+    ts = '2026-01-01T10:00:00'
+    for meeting_id in ('m1', 'm2', 'm3'):
+        store.save_meeting(make_meeting(meeting_id, action_items=[
+            item('a0', ts, assignee='Ann'), item('a1', ts, priority='high'), item('a2', ts),
+        ]))
+    return store
+
+
+def test_pages_cover_every_item_once_with_repeated_ids(meetings):
+    seen, after = [], None
+    while True:
+        items, after = meetings.list_action_items(limit=2, after=after)
+        seen.extend(items)
+        if after is None:
+            break
+    assert [i['id'] for i in seen] == ['a2', 'a1', 'a0'] * 3
+
+    all_items, cursor = meetings.list_action_items(limit=100)
+    assert cursor is None and all_items == seen
+
+
+def test_filters(meetings):
+    items, _ = meetings.list_action_items(assignee='Ann')
+    assert [i['id'] for i in items] == ['a0'] * 3
+    items, _ = meetings.list_action_items(priority=['high'], meeting_id='m2')
+    assert [i['id'] for i in items] == ['a1']
+
+
+def test_invalid_cursors(meetings):
+    with pytest.raises(ValueError):
+        meetings.list_action_items(after='a1')
+    _, cursor = meetings.list_action_items(limit=1)
+    meetings.delete_meeting('m3')
+    with pytest.raises(ValueError, match='Unknown cursor'):
+        meetings.list_action_items(after=cursor)
+
+
+def test_update_action_items_across_meetings(meetings):
+    updated = meetings.update_action_items([
+        {'meetingId': 'm1', 'id': 'a1', 'status': 'approved'},
+        {'meetingId': 'm2', 'id': 'a1', 'assignee': 'Bob'},
+    ])
+    assert {i['id']: i['status'] for i in updated['m1']}['a1'] == 'approved'
+    assert {i['id']: i['assignee'] for i in updated['m2']}['a1'] == 'Bob'
+    summaries, _ = meetings.list_meeting_summaries()
+    counts = {summary['id']: summary['actionItemCounts'] for summary in summaries}
+    assert counts['m1'] == {'pending': 2, 'approved': 1}
+    assert counts['m2'] == {'pending': 3}
+
+    with pytest.raises(KeyError):
+        meetings.update_action_items([{'meetingId': 'm1', 'id': 'missing', 'status': 'approved'}])
+    with pytest.raises(ValueError):
+        meetings.update_action_items([{'meetingId': 'm1', 'id': 'a1', 'data': 'x'}])
@@ -0,0 +1,218 @@
+import time
+import types
+
+import pytest
+
+
+@pytest.fixture
+def session(backend, monkeypatch):
+    """A registered capture session for meeting 'm1' that records nothing"""
+    sessions = {'m1': types.SimpleNamespace(
+        pause_recording=lambda: {'success': True, 'status': 'paused'},
+        resume_recording=lambda: {'success': False, 'error': 'Recording not paused'},
+    )}
+    monkeypatch.setattr(backend.capture_manager, '_sessions', sessions)
+    return sessions
+
+
+# ============ Capture Sessions ============
+
+def test_capture_endpoints_without_recording(client, backend, monkeypatch):
+    monkeypatch.setattr(backend.capture_manager, '_sessions', {})
+    for action in ('pause', 'resume', 'stop'):
+        response = client.post(f'/api/audio/{action}', json={})
+        assert response.status_code == 404
+        assert response.get_json()['success'] is False
+
+
+def test_capture_endpoints_with_unknown_meeting(client, session):
+    response = client.post('/api/audio/pause', json={'meetingId': 'unknown'})
+    assert response.status_code == 404
+    assert response.get_json()['error'] == 'No recording for this meeting'
+
+
+def test_capture_endpoints_need_meeting_id_when_ambiguous(client, session):
+    session['m2'] = session['m1']
+    response = client.post('/api/audio/pause', json={})
+    assert response.status_code == 400
+
+
+def test_capture_endpoint_state_conflict(client, session):
+    assert client.post('/api/audio/pause', json={'meetingId': 'm1'}).status_code == 200
+    response = client.post('/api/audio/resume', query_string={'meetingId': 'm1'})
+    assert response.status_code == 409
+    assert response.get_json()['error'] == 'Recording not paused'
+
+
+
+def test_failed_start_leaves_no_rolling_analysis(client, backend, monkeypatch):
+    from conftest import make_meeting
+
+    def start(meeting_id, **options):
+        raise Exception('No audio device')
+
+    monkeypatch.setattr(backend.capture_manager, '_sessions', {})
+    monkeypatch.setattr(backend.capture_manager, 'start', start)
+    backend.meeting_store.save_meeting(make_meeting('m_fail', segments=3))
+    assert client.post('/api/audio/start', json={'meetingId': 'm_fail'}).status_code == 500
+    assert not [key for key in backend.meeting_analyzer._recordings if key[0] == 'm_fail']
+
+
+def test_duplicate_start_keeps_the_running_recording(client, backend, session):
+    session['m1'].is_recording = True
+    backend.meeting_analyzer.begin_meeting('m1', 'r1')
+    try:
+        response = client.post('/api/audio/start', json={'meetingId': 'm1'})
+        assert response.status_code == 409
+        assert backend.meeting_analyzer.is_tracking('m1', 'r1')
+    finally:
+        backend.meeting_analyzer.discard('m1', 'r1')
+
+# ============ Live Transcription ============
+
+@pytest.fixture
+def live(backend, monkeypatch):
+    """A streaming recording of 'm1' with scheduler calls recorded instead of run"""
+    calls = []
+    monkeypatch.setattr(backend.transcription_scheduler, 'skip',
+                        lambda index, meeting_id, recording_id=None: calls.append(('skip', index)))
+    monkeypatch.setattr(backend.transcription_scheduler, 'submit',
+                        lambda path, index, meeting_id, info, block=True:
+                        calls.append(('batch', index, info['live_until'])))
+    stream = types.SimpleNamespace(finalized_seconds=0.0, healthy=True)
+    monkeypatch.setitem(backend.live_chunks, 'm1', {'stream': stream, 'chunks': []})
+    stream.calls = calls
+    return stream
+
+
+def chunk_info(start_seconds: float, seconds: float = 10) -> dict:
+    return {'recording_id': 'r1', 'sample_offset': int(start_seconds * 16000), 'sample_rate': 16000,
+            'duration_seconds': seconds}
+
+
+def test_live_chunks_are_kept_until_finalized(backend, live, tmp_path):
+    path = tmp_path / 'chunk_0.wav'
+    path.write_bytes(b'audio')
+    backend.on_chunk_ready(str(path), 0, 'm1', chunk_info(0))
+    assert live.calls == [] and path.exists()
+
+    live.finalized_seconds = 9.5
+    backend.release_live_chunks('m1')
+    assert live.calls == [] and path.exists()
+
+    live.finalized_seconds = 10
+    backend.release_live_chunks('m1')
+    assert live.calls == [('skip', 0)] and not path.exists()
+
+
+def test_live_chunks_fall_back_to_batch(backend, live, tmp_path):
+    live.finalized_seconds = 12
+    for index in range(3):
+        backend.on_chunk_ready(str(tmp_path / f'chunk_{index}'), index, 'm1', chunk_info(index * 10))
+    assert live.calls == [('skip', 0)]
+
+    live.healthy = False
+    backend.release_live_chunks('m1')
+    assert live.calls == [('skip', 0), ('batch', 1, 12), ('batch', 2, 12)]
+
+
+def test_held_chunks_go_to_batch_when_stopped(backend, live, tmp_path):
+    backend.on_chunk_ready(str(tmp_path / 'chunk_0'), 0, 'm1', chunk_info(0))
+    backend.release_live_chunks('m1', stopped=True)
+    assert live.calls == [('batch', 0, 0.0)]
+    assert 'm1' not in backend.live_chunks
+
+
+def test_batch_fallback_drops_audio_the_stream_stored(backend, tmp_path):
+    import numpy as np
+    from audio_encoders import WavEncoder
+
+    encoder = WavEncoder()
+    encoder.open(str(tmp_path / 'chunk_1'), 16000, 1)
+    encoder.write(np.random.default_rng(0).integers(-3000, 3000, (15 * 16000, 1), dtype=np.int16))
+    path = encoder.close()
+
+    # Chunk 1 covers 10-25 s of the recording and the stream got to 21 s, so of
+    # the fake utterances at 0-5, 5-10 and 10-15 s into the chunk only the last is new
+    segments = backend.transcribe_chunk(path, 1, 'm_live', {**chunk_info(10, 15), 'live_until': 21})
+    assert [(s['startTime'], s['endTime']) for s in segments] == [(10.0, 15.0)]
+
+
+def test_stub_engine_needs_fake_provider(client, backend, monkeypatch):
+    monkeypatch.setattr(backend.transcription_provider, 'name', 'assemblyai')
+    response = client.post('/api/audio/start', json={
+        'meetingId': 'm1', 'mode': 'streaming', 'streamingEngine': 'stub'})
+    assert response.status_code == 400
+    assert 'stub' in response.get_json()['error']
+
+
+# ============ Conditional Meeting Reads ============
+
+def test_get_meeting_honours_etag_and_since_segment(client, backend):
+    from conftest import make_meeting
+
+    backend.meeting_store.save_meeting(make_meeting('m_etag', segments=4))
+    response = client.get('/api/meetings/m_etag?sinceSegment=3')
+    assert response.status_code == 200
+    meeting = response.get_json()['data']
+    assert [s['id'] for s in meeting['transcript']] == ['m_etag_s3']
+    assert meeting['segmentCount'] == 4
+    etag = response.headers['ETag']
+
+    assert client.get('/api/meetings/m_etag', headers={'If-None-Match': etag}).status_code == 304
+
+    backend.meeting_store.append_segments('m_etag', [
+        {'id': 'm_etag_s4', 'speaker': 'A', 'text': 'Segment 4', 'startTime': 40.0, 'endTime': 45.0}])
+    response = client.get('/api/meetings/m_etag', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+
+    assert client.get('/api/meetings/unknown').status_code == 404
+
+
+def test_transcript_range_endpoint(client, backend):
+    from conftest import make_meeting
+
+    backend.meeting_store.save_meeting(make_meeting('m_range', segments=4))
+    response = client.get('/api/meetings/m_range/transcript?from=12&to=22')
+    assert response.status_code == 200
+    assert [s['id'] for s in response.get_json()['data']['segments']] == ['m_range_s1', 'm_range_s2']
+
+    assert client.get('/api/meetings/m_range/transcript?from=20&to=10').status_code == 400
+    assert client.get('/api/meetings/unknown/transcript').status_code == 404
+
+
+def test_search_endpoint_pages_results(client, backend):
+    from conftest import make_meeting
+
+    backend.meeting_store.save_meeting(make_meeting('m_search', transcript=[
+        {'id': f'q{i}', 'speaker': 'A', 'text': f'Zebra crossing {i}', 'startTime': float(i), 'endTime': i + 0.5}
+        for i in range(3)
+    ]))
+    page = client.get('/api/search?q=zebra&limit=2').get_json()
+    assert len(page['data']) == 2 and page['nextOffset'] == 2
+    page = client.get('/api/search?q=zebra&limit=2&offset=2').get_json()
+    assert len(page['data']) == 1 and page['nextOffset'] is None
+
+    assert client.get('/api/search?q=').status_code == 400
+
+
+# ============ Background Jobs ============
+
+def test_analyze_returns_a_job_with_the_analyzed_meeting(client, backend):
+    from conftest import make_meeting
+
+    backend.meeting_store.save_meeting(make_meeting('m_analyze', segments=3))
+    response = client.post('/api/meetings/m_analyze/analyze')
+    assert response.status_code == 202
+    job = response.get_json()['data']
+    assert response.headers['Location'] == f"/api/jobs/{job['id']}"
+
+    deadline = time.monotonic() + 10
+    while job['status'] not in ('succeeded', 'failed') and time.monotonic() < deadline:
+        time.sleep(0.05)
+        job = client.get(f"/api/jobs/{job['id']}").get_json()['data']
+    assert job['status'] == 'succeeded', job['error']
+    assert job['result']['id'] == 'm_analyze' and 'actionItems' in job['result']
+
+    assert client.get('/api/jobs/unknown').status_code == 404
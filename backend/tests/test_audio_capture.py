@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+import audio_capture
+from audio_capture import AudioCaptureService, AudioRingBuffer
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return AudioCaptureService(encoding='wav')
+
+
+def test_start_without_audio_backend(service, monkeypatch):
+    monkeypatch.setattr(audio_capture, 'sc', None)
+    with pytest.raises(Exception, match='soundcard'):
+        service.start_recording('m1')
+    assert not service.is_recording
+    assert AudioCaptureService.list_audio_devices() == []
+    assert not AudioCaptureService.test_audio_capture(1)['success']
+
+
+def test_start_rejects_unstorable_encoding_before_changing_state(service, monkeypatch):
+    pytest.importorskip('soundfile')
+    monkeypatch.setattr(audio_capture, 'sc', object())
+    with pytest.raises(ValueError):
+        service.start_recording('m1', output_format='original', encoding='opus')
+    assert not service.is_recording
+    assert service.output_format == 'speech' and service.encoding == 'wav'
+
+    with pytest.raises(ValueError):
+        service.start_recording('m1', output_format='surround')
+    assert not service.is_recording
+
+
+# ============ Ring Buffer ============
+
+def test_ring_buffer_wraps_without_copying():
+    buffer = AudioRingBuffer(8, 1)
+    buffer.write(np.arange(6, dtype=np.float32).reshape(-1, 1))
+    buffer.consume(4)
+    buffer.write(np.arange(6, 11, dtype=np.float32).reshape(-1, 1))
+
+    views = buffer.views()
+    assert len(views) == 2 and all(np.shares_memory(view, buffer._data) for view in views)
+    assert np.concatenate(views)[:, 0].tolist() == [4, 5, 6, 7, 8, 9, 10]
+    assert buffer.overruns == 0
+
+
+def test_ring_buffer_drops_oldest_when_full():
+    buffer = AudioRingBuffer(4, 1)
+    buffer.write(np.arange(6, dtype=np.float32).reshape(-1, 1))
+    assert buffer.size == 4 and buffer.overruns == 2
+    assert np.concatenate(buffer.views())[:, 0].tolist() == [2, 3, 4, 5]
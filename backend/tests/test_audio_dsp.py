@@ -0,0 +1,138 @@
+import numpy as np
+
+from audio_dsp import (AdaptiveChunker, DriftCompensator, PolyphaseResampler, VoiceActivityDetector,
+                       downmix, mask_runs, mix_sources, remap_time, timeline_time)
+
+RATE = 16000
+
+
+def noise(frames: int, level: float = 0.1) -> np.ndarray:
+    return (np.random.default_rng(0).standard_normal((frames, 1)) * level).astype(np.float32)
+
+
+def test_forced_cut_is_frame_aligned():
+    detector = VoiceActivityDetector(RATE)
+    chunker = AdaptiveChunker(RATE, detector.frame_len, min_seconds=1, max_seconds=1.5)
+    block = noise(RATE)
+
+    rms, _ = detector.frame_features(block)
+    assert chunker.find_cut(rms, len(block)) is None
+    cut = chunker.find_cut(rms, len(block))
+    assert cut is not None and cut % detector.frame_len == 0
+    assert 0 <= cut - RATE // 2 < detector.frame_len
+
+    # The RMS frames left after the cut describe exactly the remaining samples
+    rest = block[cut:]
+    assert np.allclose(rms[cut // detector.frame_len:], detector.frame_features(rest)[0])
+
+
+def test_cut_at_pause_after_min_length():
+    detector = VoiceActivityDetector(RATE)
+    chunker = AdaptiveChunker(RATE, detector.frame_len, min_seconds=0.5, max_seconds=10, pause_seconds=0.3)
+    block = np.concatenate([noise(RATE), np.zeros((RATE, 1), dtype=np.float32)])
+
+    rms, _ = detector.frame_features(block)
+    cut = chunker.find_cut(rms, len(block))
+    assert RATE <= cut <= RATE + int(0.3 * RATE) + detector.frame_len
+
+
+def test_vad_mask_covers_speech_with_hangover():
+    detector = VoiceActivityDetector(RATE)
+    block = np.concatenate([np.zeros((RATE, 1), dtype=np.float32), noise(RATE // 2),
+                            np.zeros((RATE, 1), dtype=np.float32)])
+    runs = mask_runs(detector.process(block))
+    assert len(runs) == 1
+    start, end = runs[0]
+    assert start < RATE <= end
+    assert RATE + RATE // 2 < end <= RATE + RATE // 2 + int(0.45 * RATE)
+
+
+def test_vad_ignores_background_noise():
+    detector = VoiceActivityDetector(RATE)
+    assert not detector.process(noise(RATE, level=0.001)).any()
+
+
+def test_vad_hangover_carries_into_next_block():
+    detector = VoiceActivityDetector(RATE)
+    frame = detector.frame_len
+    speech = detector.process(noise(10 * frame))
+    assert speech.all()
+    follow = detector.process(np.zeros((20 * frame, 1), dtype=np.float32))
+    active = np.flatnonzero(follow)
+    assert active[0] == 0 and len(active) == detector.hangover_frames * frame
+
+
+def test_resampler_output_length():
+    resampler = PolyphaseResampler(48000, RATE, 1)
+    out = np.concatenate([resampler.process(noise(4800)) for _ in range(10)])
+    assert abs(len(out) - RATE) <= 32
+
+
+def test_resampler_streaming_matches_one_piece():
+    block = noise(48000)
+    whole = PolyphaseResampler(48000, RATE, 1).process(block)
+    resampler = PolyphaseResampler(48000, RATE, 1)
+    pieces = np.concatenate([resampler.process(block[i:i + 1234]) for i in range(0, len(block), 1234)])
+    assert np.allclose(whole, pieces[:len(whole)], atol=1e-5)
+
+
+def test_resampler_keeps_speech_band_and_removes_aliases():
+    t = np.arange(48000) / 48000
+    resampler = PolyphaseResampler(48000, RATE, 1)
+    speech = resampler.process((np.sin(2 * np.pi * 1000 * t) * 0.5).astype(np.float32).reshape(-1, 1))
+    alias = PolyphaseResampler(48000, RATE, 1).process(
+        (np.sin(2 * np.pi * 12000 * t) * 0.5).astype(np.float32).reshape(-1, 1))
+    steady = slice(200, -200)
+    assert abs(np.sqrt(np.mean(speech[steady] ** 2)) - 0.5 / np.sqrt(2)) < 0.02
+    assert np.sqrt(np.mean(alias[steady] ** 2)) < 0.01
+
+
+def test_downmix_averages_channels():
+    stereo = np.array([[1.0, 0.0], [0.5, 0.5]], dtype=np.float32)
+    assert downmix(stereo)[:, 0].tolist() == [0.5, 0.5]
+    mono = stereo[:, :1]
+    assert downmix(mono) is mono
+
+
+def test_remap_and_timeline_time():
+    time_map = [[0.0, 2.0, 3.0], [3.0, 10.0, 5.0]]
+    assert remap_time(time_map, 1.0) == 3.0
+    assert remap_time(time_map, 4.0) == 11.0
+    assert remap_time(None, 4.0) == 4.0
+
+    # 10 s recorded, then a 5 s pause
+    timeline = [[0.0, 0.0], [10.0, 15.0]]
+    assert timeline_time(timeline, 5.0) == 5.0
+    assert timeline_time(timeline, 12.0) == 17.0
+
+
+def test_mix_sources_modes():
+    primary = np.array([[0.5, -0.5], [0.9, 0.1]], dtype=np.float32)
+    secondary = np.array([[0.2], [0.3]], dtype=np.float32)
+    assert np.allclose(mix_sources(primary, secondary), [[0.7, -0.3], [1.0, 0.4]])
+    assert np.allclose(mix_sources(primary, secondary, 'separate'), [[0.0, 0.2], [0.5, 0.3]])
+
+
+def test_drift_plan_steers_within_max_correction():
+    drift = DriftCompensator(target_frames=480, max_correction=0.005)
+    assert drift.plan(960, 960 + 480) == (0, 960)
+    dropped, take = drift.plan(960, 960 + 480 + 200)
+    assert dropped == 0 and take == round(960 * 1.005)
+    dropped, take = drift.plan(960, 960 + 480 - 200)
+    assert dropped == 0 and take == round(960 * 0.995)
+    assert drift.underruns == 0 and drift.resyncs == 0
+
+
+def test_drift_plan_underrun_and_resync():
+    drift = DriftCompensator(target_frames=480)
+    assert drift.plan(960, 500) == (0, 500)
+    assert drift.underruns == 1
+    assert drift.plan(960, 960 + 480 + 5000) == (5000, 960)
+    assert drift.resyncs == 1
+
+
+def test_drift_stretch_length():
+    block = noise(965)
+    assert DriftCompensator.stretch(block, 960).shape == (960, 1)
+    short = DriftCompensator.stretch(block[:500], 960)
+    assert np.all(short[:460] == 0) and np.array_equal(short[460:], block[:500])
@@ -0,0 +1,93 @@
+import os
+import wave
+
+import numpy as np
+import pytest
+
+from audio_encoders import WavEncoder, check_encoding, create_encoder, recover_partial
+
+
+def tone(frames: int, channels: int = 1) -> np.ndarray:
+    t = np.arange(frames) / 16000
+    pcm = (np.sin(2 * np.pi * 220 * t) * 10000).astype(np.int16)
+    return np.repeat(pcm[:, None], channels, axis=1)
+
+
+def test_check_encoding_rejects_opus_at_capture_rate():
+    check_encoding('opus', 16000, 1)
+    check_encoding('wav', 44100, 2)
+    with pytest.raises(ValueError, match='Opus'):
+        check_encoding('opus', 44100, 2)
+    with pytest.raises(ValueError):
+        check_encoding('mp3', 16000, 1)
+
+
+def test_wav_chunk_appears_only_when_closed(tmp_path):
+    encoder = WavEncoder()
+    encoder.open(str(tmp_path / 'chunk_0'), 16000, 2)
+    encoder.write(tone(1600, 2))
+    assert not os.path.exists(encoder.path)
+
+    path = encoder.close()
+    with wave.open(path, 'rb') as wf:
+        assert (wf.getnframes(), wf.getnchannels(), wf.getframerate()) == (1600, 2, 16000)
+    assert not os.path.exists(path + '.tmp')
+
+
+def test_abort_removes_temp_file(tmp_path):
+    encoder = create_encoder('wav')
+    encoder.open(str(tmp_path / 'chunk_0'), 16000, 1)
+    encoder.write(tone(100))
+    encoder.abort()
+    assert os.listdir(tmp_path) == []
+
+
+def test_recover_partial_finishes_flushed_chunk(tmp_path):
+    encoder = WavEncoder()
+    encoder.open(str(tmp_path / 'chunk_0'), 16000, 1)
+    encoder.write(tone(8000))
+    encoder.flush()
+    # The process dies here: the encoder is never closed
+
+    assert recover_partial(encoder.path) == 8000
+    with wave.open(encoder.path, 'rb') as wf:
+        assert wf.getnframes() == 8000
+    assert not os.path.exists(encoder.path + '.tmp')
+    assert recover_partial(encoder.path) == 0
+
+
+@pytest.mark.parametrize('encoding', ['wav', 'flac', 'opus'])
+@pytest.mark.parametrize('frames', [4000, 48000])
+def test_recover_partial_keeps_every_flushed_frame(tmp_path, encoding, frames):
+    if encoding != 'wav':
+        sf = pytest.importorskip('soundfile')
+    encoder = create_encoder(encoding)
+    encoder.open(str(tmp_path / 'chunk_0'), 16000, 1)
+    for start in range(0, frames, 1600):
+        encoder.write(tone(min(1600, frames - start)))
+    encoder.flush()
+    # The process dies here: the encoder is never closed
+
+    assert recover_partial(encoder.path) == frames
+    if encoding == 'wav':
+        with wave.open(encoder.path, 'rb') as wf:
+            assert wf.getnframes() == frames
+    else:
+        assert sf.info(encoder.path).frames == frames
+    assert os.listdir(tmp_path) == [os.path.basename(encoder.path)]
+
+
+@pytest.mark.parametrize('encoding', ['flac', 'opus'])
+def test_compressed_chunk_leaves_no_pcm_journal(tmp_path, encoding):
+    pytest.importorskip('soundfile')
+    encoder = create_encoder(encoding)
+    encoder.open(str(tmp_path / 'chunk_0'), 16000, 1)
+    encoder.write(tone(1600))
+    encoder.flush()
+    path = encoder.close()
+    assert os.listdir(tmp_path) == [os.path.basename(path)]
+
+    encoder.open(str(tmp_path / 'chunk_1'), 16000, 1)
+    encoder.write(tone(1600))
+    encoder.abort()
+    assert os.listdir(tmp_path) == [os.path.basename(path)]
@@ -0,0 +1,76 @@
+import queue
+import threading
+import time
+
+import pytest
+
+from background_jobs import JobRunner
+
+
+def wait_finished(runner, job_id, timeout=5):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = runner.get(job_id)
+        if job['status'] in ('succeeded', 'failed'):
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f'job {job_id} did not finish')
+
+
+def test_results_and_errors():
+    runner = JobRunner(workers=2)
+    ok = runner.submit('analyze', lambda: {'answer': 42}, meetingId='m1')
+    assert ok['status'] == 'queued' and ok['meetingId'] == 'm1' and '_run' not in ok
+
+    def fail():
+        raise RuntimeError('model unavailable')
+    failed = runner.submit('analyze', fail)
+
+    assert wait_finished(runner, ok['id'])['result'] == {'answer': 42}
+    job = wait_finished(runner, failed['id'])
+    assert job['status'] == 'failed' and job['error'] == 'model unavailable'
+    assert runner.get('unknown') is None
+
+
+def test_same_key_shares_one_run():
+    release = threading.Event()
+    runs = []
+
+    def run():
+        runs.append(1)
+        release.wait(5)
+        return len(runs)
+
+    runner = JobRunner(workers=2)
+    first = runner.submit('analyze', run, key='analyze:m1')
+    second = runner.submit('analyze', run, key='analyze:m1')
+    assert first['id'] == second['id']
+
+    release.set()
+    assert wait_finished(runner, first['id'])['result'] == 1
+    # Once finished, the key is free again
+    third = runner.submit('analyze', run, key='analyze:m1')
+    assert third['id'] != first['id']
+    wait_finished(runner, third['id'])
+
+
+def test_full_queue_raises():
+    release = threading.Event()
+    runner = JobRunner(workers=1, max_queue=1)
+    busy = runner.submit('slow', lambda: release.wait(5))
+    deadline = time.monotonic() + 5
+    while runner.get(busy['id'])['status'] != 'running' and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    runner.submit('slow', lambda: None)
+    with pytest.raises(queue.Full):
+        runner.submit('slow', lambda: None)
+    release.set()
+
+
+def test_finished_jobs_are_pruned():
+    runner = JobRunner(workers=1, max_finished=2)
+    jobs = [runner.submit('quick', lambda i=i: i) for i in range(4)]
+    wait_finished(runner, jobs[-1]['id'])
+    assert runner.get(jobs[0]['id']) is None
+    assert runner.get_status()['succeeded'] == 2
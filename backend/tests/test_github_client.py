@@ -0,0 +1,88 @@
+import pytest
+
+from github_client import GitHubClient, GitHubError, StandInGitHubServer, issue_marker
+
+REPO = 'acme/widgets'
+
+
+@pytest.fixture
+def server():
+    stand_in = StandInGitHubServer()
+    stand_in.start()
+    yield stand_in
+    stand_in.stop()
+
+
+def make_client(server, store=None, **options):
+    options.setdefault('backoff_base', 0.01)
+    return GitHubClient(server.url, mapping=store, **options)
+
+
+def test_create_issue_once_per_key(server, store):
+    client = make_client(server, store)
+    first = client.create_issue('token', REPO, 'm1/a1@1', 'Task', 'Details', ['fomo'])
+    again = client.create_issue('token', REPO, 'm1/a1@1', 'Task', 'Details', ['fomo'])
+
+    assert first == again == {'number': 1, 'url': f'https://github.com/{REPO}/issues/1', 'repository': REPO}
+    issue = server.issues[REPO][0]
+    assert issue['labels'] == ['fomo'] and issue_marker('m1/a1@1') in issue['body']
+    assert len(server.issues[REPO]) == 1
+
+
+def test_post_is_not_retried_on_server_error(server):
+    server.error_rate = 1.0
+    client = make_client(server)
+    with pytest.raises(GitHubError) as error:
+        client.request('POST', f'/repos/{REPO}/issues', 'token', {'title': 'x'})
+    assert error.value.created and error.value.status == 502
+    assert server.requests == 1
+
+
+def test_get_is_retried_on_server_error(server):
+    server.error_rate = 1.0
+    client = make_client(server, max_retries=2)
+    with pytest.raises(GitHubError) as error:
+        client.request('GET', f'/repos/{REPO}/issues', 'token')
+    assert not error.value.created
+    assert server.requests == 3
+
+
+def test_lost_response_is_found_instead_of_created_again(server, store):
+    server.lost_response_rate = 1.0
+    client = make_client(server, store)
+    issue = client.create_issue('token', REPO, 'm1/a1@1', 'Task')
+
+    assert issue['number'] == 1
+    assert len(server.issues[REPO]) == 1
+    assert store.claim_github_issue(REPO, 'm1/a1@1')['state'] == 'created'
+
+
+def test_failed_creation_is_retried_after_lookup(server, store):
+    server.error_rate = 1.0
+    client = make_client(server, store, max_retries=1)
+    with pytest.raises(GitHubError):
+        client.create_issue('token', REPO, 'm1/a1@1', 'Task')
+    assert REPO not in server.issues
+    # The outcome was unknown, so the claim is kept until the next call checks GitHub
+    assert store.claim_github_issue(REPO, 'm1/a1@1')['state'] == 'creating'
+
+    server.error_rate = 0.0
+    assert client.create_issue('token', REPO, 'm1/a1@1', 'Task')['number'] == 1
+    assert len(server.issues[REPO]) == 1
+
+
+def test_rejected_creation_releases_the_claim(server, store):
+    client = make_client(server, store)
+    with pytest.raises(GitHubError) as error:
+        client.create_issue('token', 'not-a-repo', 'k', 'Task')
+    assert error.value.status == 404 and not error.value.created
+    assert store.claim_github_issue('not-a-repo', 'k') is None
+
+
+def test_secondary_rate_limit_is_waited_out(server):
+    server.secondary_every = 2
+    client = make_client(server, secondary_backoff=0.01)
+    results = client.create_issues('token', REPO, [{'key': f'k{i}', 'title': f'T{i}'} for i in range(3)],
+                                   concurrency=1)
+    assert all('issue' in result for result in results)
+    assert len(server.issues[REPO]) == 3
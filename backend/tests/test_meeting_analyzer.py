@@ -0,0 +1,107 @@
+import json
+import re
+import threading
+
+import pytest
+
+from meeting_analyzer import MeetingAnalyzer
+
+
+class FakeModel:
+    """Echoes the transcript text of map prompts; merges by concatenating notes"""
+
+    def __init__(self, failures: int = 0):
+        self.failures = failures
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, prompt: str, max_tokens: int) -> str:
+        with self.lock:
+            self.calls += 1
+            if self.failures:
+                self.failures -= 1
+                raise RuntimeError('overloaded')
+        if prompt.startswith('These are notes'):
+            notes = json.loads(prompt.split('NOTES:\n', 1)[1])
+            return json.dumps({'summary': {'overview': ' | '.join(n['notes'] for n in notes)}})
+        texts = re.findall(r'\): (.*)', prompt.split('TRANSCRIPT', 1)[1])
+        return json.dumps({'notes': ' '.join(texts), 'actionItems': []})
+
+
+def segments(*texts):
+    return [{'speaker': 'A', 'startTime': i, 'text': text} for i, text in enumerate(texts)]
+
+
+def test_finish_includes_earlier_recordings():
+    analyzer = MeetingAnalyzer(FakeModel(), window_chars=10, backoff_base=0.01)
+    analyzer.begin_meeting('m1', 'r2', segments('first recording one', 'first recording two'))
+    analyzer.add_segments('m1', 'r2', segments('second recording'))
+
+    overview = analyzer.finish('m1', 'r2', timeout=5)['summary']['overview']
+    assert overview.split(' | ') == ['first recording one', 'first recording two', 'second recording']
+    assert not analyzer.is_tracking('m1', 'r2')
+
+
+def test_model_calls_are_retried():
+    model = FakeModel(failures=2)
+    analyzer = MeetingAnalyzer(model, window_chars=1000, max_retries=3, backoff_base=0.01)
+    analyzer.begin_meeting('m1')
+    analyzer.add_segments('m1', None, segments('hello'))
+
+    assert analyzer.finish('m1', timeout=5)['summary']['overview'] == 'hello'
+    assert model.calls == 4
+
+
+def test_gives_up_after_max_retries():
+    analyzer = MeetingAnalyzer(FakeModel(failures=100), max_retries=1, backoff_base=0.01)
+    with pytest.raises(RuntimeError):
+        analyzer.analyze(segments('hello'))
+
+
+def test_overlapping_recordings_are_analyzed_once():
+    model = FakeModel()
+    analyzer = MeetingAnalyzer(model, window_chars=1000)
+    analyzer.begin_meeting('m1', 'r1')
+    analyzer.add_segments('m1', 'r1', segments('first'))
+
+    # Recording 2 starts from the stored transcript while recording 1's last
+    # chunk is still being transcribed
+    analyzer.begin_meeting('m1', 'r2', segments('first'))
+    analyzer.add_segments('m1', 'r2', segments('second'))
+    analyzer.add_segments('m1', 'r1', segments('late first'))
+
+    # Recording 1 stopping must not finish recording 2 or report its analysis
+    assert analyzer.finish('m1', 'r1', timeout=5) is None
+    assert not analyzer.is_tracking('m1', 'r1') and analyzer.is_tracking('m1', 'r2')
+
+    overview = analyzer.finish('m1', 'r2', timeout=5)['summary']['overview']
+    assert overview == 'first second late first'
+    assert model.calls == 2  # One window and the merge; recording 1 made no calls
+
+
+def test_recording_superseded_while_finishing():
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def complete(prompt, max_tokens):
+        calls.append(prompt)
+        if len(calls) == 1:
+            raise RuntimeError('overloaded')  # Background map fails
+        if len(calls) == 2:
+            started.set()  # finish() retries it; a new recording starts meanwhile
+            release.wait(5)
+        return FakeModel()(prompt, max_tokens)
+
+    analyzer = MeetingAnalyzer(complete, window_chars=1, max_retries=0)
+    analyzer.begin_meeting('m1', 'r1', segments('old'))
+    result = {}
+    thread = threading.Thread(target=lambda: result.update(analysis=analyzer.finish('m1', 'r1', timeout=5)))
+    thread.start()
+    assert started.wait(5)
+    analyzer.begin_meeting('m1', 'r2')
+    release.set()
+    thread.join(5)
+
+    assert result == {'analysis': None}
+    assert analyzer.is_tracking('m1', 'r2')
+    assert analyzer.get_notes('m1', 'r2') == []
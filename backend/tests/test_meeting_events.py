@@ -0,0 +1,81 @@
+import threading
+import time
+
+from meeting_events import MeetingEventBus
+
+
+def collect(bus, meeting_id, after, count):
+    events = []
+    for event in bus.subscribe(meeting_id, after, keepalive=0.05):
+        if event is not None:
+            events.append(event)
+        if len(events) == count:
+            return events
+
+
+def test_event_ids_carry_the_epoch():
+    bus = MeetingEventBus()
+    seq = bus.publish('m1', 'update', {})
+    assert bus.parse_event_id(bus.event_id(seq)) == seq
+
+    restarted = MeetingEventBus()
+    assert restarted.parse_event_id(bus.event_id(seq)) is None
+    assert bus.parse_event_id('12') is None
+    assert bus.parse_event_id(None) is None
+
+
+def test_resume_replays_missed_events():
+    bus = MeetingEventBus()
+    first = bus.publish('m1', 'segments', {'n': 1})
+    bus.publish('m2', 'segments', {'other': True})
+    bus.publish('m1', 'segments', {'n': 2})
+
+    assert bus.can_resume('m1', first)
+    events = collect(bus, 'm1', first, 1)
+    assert [e['data'] for e in events] == [{'n': 2}]
+
+
+def test_snapshot_position_excludes_older_events():
+    bus = MeetingEventBus()
+    bus.publish('m1', 'segments', {'n': 1})
+    after = bus.last_seq('m1')
+    bus.publish('m1', 'segments', {'n': 2})
+    assert [e['data'] for e in collect(bus, 'm1', after, 1)] == [{'n': 2}]
+
+
+def test_no_resume_past_trimmed_history():
+    bus = MeetingEventBus(history=3)
+    seqs = [bus.publish('m1', 'segments', {'n': i}) for i in range(5)]
+    assert not bus.can_resume('m1', seqs[0])
+    assert bus.can_resume('m1', seqs[1])
+    assert not bus.can_resume('m1', seqs[-1] + 1)
+
+
+def test_forgotten_meeting_cannot_be_resumed():
+    bus = MeetingEventBus()
+    seen = bus.publish('m1', 'segments', {'n': 1})
+    bus.publish('m1', 'segments', {'n': 2})
+    bus.forget('m1')
+    for i in range(3):
+        bus.publish('m1', 'segments', {'n': i})
+    assert not bus.can_resume('m1', seen)
+    assert bus.can_resume('m1', bus.last_seq('m1'))
+
+
+def test_idle_meetings_are_evicted_unless_subscribed():
+    bus = MeetingEventBus(idle_seconds=0.05)
+    bus.publish('idle', 'update', {})
+    bus.publish('watched', 'update', {})
+
+    received = []
+    subscriber = bus.subscribe('watched', bus.last_seq('watched'), keepalive=0.05)
+    thread = threading.Thread(target=lambda: received.append(next(subscriber)))
+    thread.start()
+    thread.join()
+
+    time.sleep(0.1)
+    bus.publish('other', 'update', {})
+    assert 'idle' not in bus._events
+    assert 'watched' in bus._events
+    subscriber.close()
+    assert 'watched' not in bus._subscribers
@@ -0,0 +1,224 @@
+import sqlite3
+
+import pytest
+
+from conftest import make_meeting
+from meeting_store import MeetingStore, MeetingConflictError, MIGRATIONS
+
+
+def test_migrations_reach_latest_version(store):
+    version = store._connect().execute('PRAGMA user_version').fetchone()[0]
+    assert version == len(MIGRATIONS)
+
+
+def test_migrations_upgrade_existing_database(tmp_path):
+    path = str(tmp_path / 'old.db')
+    conn = sqlite3.connect(path, isolation_level=None)
+    conn.executescript('BEGIN;' + MIGRATIONS[0] + 'PRAGMA user_version = 1; COMMIT;')
+    conn.close()
+
+    store = MeetingStore(path)
+    store.save_meeting(make_meeting('m1', segments=2))
+    assert store._connect().execute('PRAGMA user_version').fetchone()[0] == len(MIGRATIONS)
+    assert len(store.load_meeting('m1')['transcript']) == 2
+
+
+def test_legacy_json_files_are_imported_once(store, tmp_path):
+    import json
+
+    legacy = tmp_path / 'legacy'
+    legacy.mkdir()
+    (legacy / 'meeting_m1.json').write_text(json.dumps(make_meeting('m1', segments=2)))
+    (legacy / 'meeting_bad.json').write_text('{not json')
+    (legacy / 'notes.json').write_text('{}')
+
+    assert store.migrate_json_files(str(legacy)) == 1
+    assert len(store.load_meeting('m1')['transcript']) == 2
+    assert (legacy / 'meeting_m1.json.migrated').exists()
+    assert (legacy / 'meeting_bad.json').exists()
+
+    assert store.migrate_json_files(str(legacy)) == 0
+    assert store.migrate_json_files(str(tmp_path / 'missing')) == 0
+
+def test_save_and_load_roundtrip(store):
+    items = [{'id': 'a0', 'text': 'Fix it', 'status': 'pending'}]
+    store.save_meeting(make_meeting('m1', segments=3, action_items=items))
+
+    meeting = store.load_meeting('m1')
+    assert [s['text'] for s in meeting['transcript']] == ['Segment 0', 'Segment 1', 'Segment 2']
+    assert meeting['actionItems'] == items
+    assert store.load_meeting('missing') is None
+
+
+def test_save_with_stale_version_conflicts(store):
+    stale = store.save_meeting(make_meeting('m1'))['version']
+    store.save_meeting(make_meeting('m1'), expected_version=stale)
+    with pytest.raises(MeetingConflictError):
+        store.save_meeting(make_meeting('m1'), expected_version=stale)
+
+
+def test_summaries_page_newest_first(store):
+    for i in range(5):
+        store.save_meeting(make_meeting(f'm{i}', start_time=f'2026-01-0{i + 1}T10:00:00', segments=i))
+
+    page, cursor = store.list_meeting_summaries(limit=2)
+    assert [m['id'] for m in page] == ['m4', 'm3']
+    assert page[0]['segmentCount'] == 4
+
+    seen = [m['id'] for m in page]
+    while cursor:
+        page, cursor = store.list_meeting_summaries(limit=2, after=cursor)
+        seen.extend(m['id'] for m in page)
+    assert seen == ['m4', 'm3', 'm2', 'm1', 'm0']
+
+
+def test_summaries_cursor_survives_deleted_meeting(store):
+    for i in range(3):
+        store.save_meeting(make_meeting(f'm{i}', start_time=f'2026-01-0{i + 1}T10:00:00'))
+
+    page, cursor = store.list_meeting_summaries(limit=1)
+    assert cursor != page[0]['id']
+    store.delete_meeting(page[0]['id'])
+    page, _ = store.list_meeting_summaries(limit=5, after=cursor)
+    assert [m['id'] for m in page] == ['m1', 'm0']
+
+
+def test_summaries_reject_malformed_cursor_and_fields(store):
+    with pytest.raises(ValueError):
+        store.list_meeting_summaries(after='missing')
+    with pytest.raises(ValueError):
+        store.list_meeting_summaries(fields=['transcript'])
+
+
+def test_summary_counts_action_items_by_status(store):
+    items = [{'id': f'a{i}', 'status': status} for i, status in enumerate(['pending', 'pending', 'approved'])]
+    store.save_meeting(make_meeting('m1', action_items=items))
+
+    (summary,), _ = store.list_meeting_summaries(fields=['id', 'actionItemCount', 'actionItemCounts'])
+    assert summary == {'id': 'm1', 'actionItemCount': 3, 'actionItemCounts': {'pending': 2, 'approved': 1}}
+
+
+def test_delete_meeting_removes_rows(store):
+    store.save_meeting(make_meeting('m1', segments=2, action_items=[{'id': 'a0', 'status': 'pending'}]))
+    assert store.delete_meeting('m1')
+    assert store.load_meeting('m1') is None
+    assert not store.delete_meeting('m1')
+    assert store.list_meeting_summaries() == ([], None)
+
+
+# ============ Transcript Segments ============
+
+def test_append_segments_keeps_existing_rows(store):
+    store.save_meeting(make_meeting('m1', segments=2))
+    version = store.get_meeting_version('m1')
+
+    count = store.append_segments('m1', [{'id': 'new', 'speaker': 'B', 'text': 'Later',
+                                          'startTime': 30.0, 'endTime': 31.0}])
+    assert count == 3
+    meeting = store.load_meeting('m1')
+    assert [seg['id'] for seg in meeting['transcript']] == ['m1_s0', 'm1_s1', 'new']
+    assert meeting['chunksProcessed'] == 1 and meeting['version'] == version + 1
+    assert [seg['id'] for seg in store.load_meeting('m1', since_segment=2)['transcript']] == ['new']
+
+    assert store.append_segments('missing', [{'id': 'x'}]) is None
+
+
+def test_segments_in_range_overlap_the_span(store):
+    # Segments at 0-5, 10-15, 20-25 and 30-35 s, plus a long one appended later
+    store.save_meeting(make_meeting('m1', segments=4))
+    store.append_segments('m1', [{'id': 'long', 'speaker': 'B', 'text': 'Monologue',
+                                  'startTime': 2.0, 'endTime': 28.0}])
+
+    def ids(start, end):
+        return [seg['id'] for seg in store.load_segments_in_range('m1', start, end)]
+
+    assert ids(12.0, 22.0) == ['long', 'm1_s1', 'm1_s2']
+    assert ids(26.0, None) == ['long', 'm1_s3']
+    assert ids(None, 10.0) == ['m1_s0', 'long']
+    assert ids(15.0, 20.0) == ['long']
+    assert store.load_segments_in_range('missing', 0.0, 10.0) is None
+
+
+# ============ Search ============
+
+def test_search_segments_matches_words_and_prefix(store):
+    store.save_meeting(make_meeting('m1', transcript=[
+        {'id': 'a', 'speaker': 'Ann', 'text': 'The budget review is on Friday', 'startTime': 1.5, 'endTime': 4.0},
+        {'id': 'b', 'speaker': 'Bob', 'text': 'Budget approved', 'startTime': 5.0, 'endTime': 6.0},
+    ]))
+    store.save_meeting(make_meeting('m2', transcript=[
+        {'id': 'c', 'speaker': 'Ann', 'text': 'Nothing about money', 'startTime': 0.0, 'endTime': 1.0},
+    ]))
+
+    results = store.search_segments('budget rev')
+    assert [r['segmentId'] for r in results] == ['a']
+    assert results[0]['meetingTitle'] == 'Meeting m1' and results[0]['startMs'] == 1500
+    assert '<mark>budget</mark>' in results[0]['snippet'].lower()
+
+    assert {r['segmentId'] for r in store.search_segments('budget')} == {'a', 'b'}
+    assert store.search_segments('money', meeting_id='m1') == []
+    # Operators are quoted as plain words instead of raising a syntax error
+    assert store.search_segments('budget AND (') == []
+    assert store.search_segments('  ?! ') == []
+
+
+def test_search_follows_transcript_changes(store):
+    store.save_meeting(make_meeting('m1', segments=1))
+    store.append_segments('m1', [{'id': 'new', 'speaker': 'B', 'text': 'Quarterly roadmap',
+                                  'startTime': 10.0, 'endTime': 12.0}])
+    assert [r['segmentId'] for r in store.search_segments('roadmap')] == ['new']
+    store.delete_meeting('m1')
+    assert store.search_segments('roadmap') == []
+
+
+# ============ Concurrent Updates ============
+
+def test_concurrent_updates_are_not_lost(store):
+    import threading
+
+    store.save_meeting(make_meeting('m1', counter=0))
+
+    def increment():
+        for _ in range(20):
+            store.update_meeting('m1', lambda meeting: meeting.update(counter=meeting['counter'] + 1))
+
+    threads = [threading.Thread(target=increment) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert store.load_meeting('m1', include_transcript=False)['counter'] == 80
+
+
+def test_update_meeting_leaves_transcript_alone(store):
+    store.save_meeting(make_meeting('m1', segments=3))
+    updated = store.update_meeting('m1', lambda meeting: meeting.update(title='Renamed'))
+    assert 'transcript' not in updated
+    meeting = store.load_meeting('m1')
+    assert meeting['title'] == 'Renamed' and len(meeting['transcript']) == 3
+    assert store.update_meeting('missing', lambda meeting: None) is None
+
+
+# ============ Chunk Journal ============
+
+def test_unfinished_chunks_are_listed_for_recovery(store):
+    import time
+
+    store.journal_chunk('c0.flac', 'm1', 'r1', 0, 'committed')
+    store.journal_chunk('c2.flac', 'm1', 'r1', 2, 'recording', {'sampleRate': 16000})
+    store.journal_chunk('c1.flac', 'm1', 'r1', 1, 'captured', {'sampleRate': 16000})
+    store.journal_chunk('c1.flac', 'm1', 'r1', 1, 'uploaded')
+    cutoff = time.time() + 1
+
+    chunks = store.unfinished_chunks(cutoff, max_recoveries=2)
+    assert [(c['path'], c['state']) for c in chunks] == [('c1.flac', 'uploaded'), ('c2.flac', 'recording')]
+    assert chunks[0]['info'] == {'sampleRate': 16000}
+    assert store.unfinished_chunks(time.time() - 60, max_recoveries=2) == []
+
+    store.count_chunk_recovery('c1.flac')
+    store.count_chunk_recovery('c1.flac')
+    assert [c['path'] for c in store.unfinished_chunks(cutoff, max_recoveries=2)] == ['c2.flac']
+
+    assert store.set_chunk_state('c2.flac', 'lost')
+    assert not store.set_chunk_state('unknown.flac', 'lost')
+    assert store.get_chunk_journal_status() == {'committed': 1, 'uploaded': 1, 'lost': 1}
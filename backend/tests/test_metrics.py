@@ -0,0 +1,58 @@
+import json
+
+import pytest
+
+from metrics import ChunkTracer, MetricsRegistry
+
+
+def test_render_counter_gauge_and_histogram():
+    registry = MetricsRegistry()
+    registry.counter('fomo_chunks_total', 'Chunks').inc(provider='fake')
+    registry.counter('fomo_chunks_total').inc(2, provider='fake')
+    registry.gauge('fomo_queue_depth', callback=lambda: {(('stage', 'upload'),): 3})
+    seconds = registry.histogram('fomo_stage_seconds', 'Stage time', buckets=(0.1, 1.0))
+    seconds.observe(0.05, stage='encode')
+    seconds.observe(0.5, stage='encode')
+
+    lines = registry.render().splitlines()
+    assert '# HELP fomo_chunks_total Chunks' in lines
+    assert '# TYPE fomo_chunks_total counter' in lines
+    assert 'fomo_chunks_total{provider="fake"} 3' in lines
+    assert 'fomo_queue_depth{stage="upload"} 3' in lines
+    assert 'fomo_stage_seconds_bucket{stage="encode",le="0.1"} 1' in lines
+    assert 'fomo_stage_seconds_bucket{stage="encode",le="1.0"} 2' in lines
+    assert 'fomo_stage_seconds_bucket{stage="encode",le="+Inf"} 2' in lines
+    assert 'fomo_stage_seconds_count{stage="encode"} 2' in lines
+
+
+def test_registry_rejects_type_change():
+    registry = MetricsRegistry()
+    registry.counter('fomo_things')
+    with pytest.raises(ValueError):
+        registry.gauge('fomo_things')
+
+
+def test_failing_gauge_callback_is_skipped():
+    registry = MetricsRegistry()
+    registry.gauge('fomo_broken', callback=lambda: 1 / 0)
+    registry.counter('fomo_ok').inc()
+    text = registry.render()
+    assert 'fomo_broken' not in text
+    assert 'fomo_ok 1' in text
+
+
+def test_chunk_trace_is_written_when_finished(tmp_path):
+    tracer = ChunkTracer(str(tmp_path), enabled=True)
+    tracer.event('m1', 0, 'captured', seconds=120)
+    tracer.finish('m1', 0, 'stored', segments=4)
+
+    trace = json.loads((tmp_path / 'm1_chunk_0.json').read_text())
+    assert [e['stage'] for e in trace['events']] == ['captured', 'stored']
+    assert trace['total_seconds'] >= 0
+
+
+def test_metrics_endpoint(client):
+    response = client.get('/metrics')
+    assert response.status_code == 200
+    assert response.mimetype == 'text/plain'
+    assert '# TYPE' in response.get_data(as_text=True)
@@ -0,0 +1,113 @@
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
+import pytest
+
+from audio_encoders import WavEncoder
+from meeting_analyzer import MeetingAnalyzer
+from providers import FakeLLMProvider, FakeTranscriptionProvider, ProviderError
+from transcription_scheduler import TranscriptionScheduler
+
+
+def write_chunk(path_without_ext: str, seconds: float, seed: int) -> str:
+    audio = np.random.default_rng(seed).integers(-3000, 3000, size=(int(seconds * 16000), 1), dtype=np.int16)
+    encoder = WavEncoder()
+    encoder.open(path_without_ext, 16000, 1)
+    encoder.write(audio)
+    return encoder.close()
+
+
+def transcript(lines: list) -> list:
+    return [{'speaker': speaker, 'text': text, 'startTime': float(i)} for i, (speaker, text) in enumerate(lines)]
+
+
+def count_failures(provider, calls: int) -> dict:
+    counts = {'failure': 0, 'timeout': 0}
+    for _ in range(calls):
+        try:
+            provider.complete('prompt', 10)
+        except ProviderError as e:
+            counts['timeout' if 'timeout' in str(e) else 'failure'] += 1
+    return counts
+
+
+def test_fake_transcription_is_deterministic(tmp_path):
+    chunk = write_chunk(str(tmp_path / 'a'), 12, seed=1)
+    other = write_chunk(str(tmp_path / 'b'), 12, seed=2)
+
+    first = FakeTranscriptionProvider().transcribe(chunk, {})
+    assert FakeTranscriptionProvider().transcribe(chunk, {}) == first
+    assert [(u['start'], u['end']) for u in first] == [(0, 5000), (5000, 10000), (10000, 12000)]
+    assert [u['text'] for u in FakeTranscriptionProvider().transcribe(other, {})] != [u['text'] for u in first]
+
+
+def test_fake_llm_analysis_is_deterministic():
+    segments = transcript([('A', 'We will ship on Friday'), ('B', 'Sounds good'), ('A', 'Bob will write the notes')])
+    analyzer = MeetingAnalyzer(FakeLLMProvider().complete, window_chars=30)
+
+    analysis = analyzer.analyze(segments)
+    assert analyzer.analyze(segments) == analysis
+    assert [item['text'] for item in analysis['actionItems']] == ['We will ship on Friday', 'Bob will write the notes']
+
+
+def test_injected_error_and_timeout_rates_are_honoured():
+    provider = FakeLLMProvider(error_rate=0.2, timeout_rate=0.1, timeout_ms=0, seed=7)
+    counts = count_failures(provider, 2000)
+    assert 340 < counts['failure'] < 460
+    assert 150 < counts['timeout'] < 250
+
+    # The same seed injects the same faults
+    assert count_failures(FakeLLMProvider(error_rate=0.2, timeout_rate=0.1, timeout_ms=0, seed=7), 2000) == counts
+    assert count_failures(FakeLLMProvider(), 200) == {'failure': 0, 'timeout': 0}
+
+
+def test_injected_latency_and_timeout_delay_calls():
+    provider = FakeLLMProvider(latency_ms=20, jitter_ms=5, seed=1)
+    for _ in range(5):
+        started = time.perf_counter()
+        provider.complete('prompt', 10)
+        assert time.perf_counter() - started >= 0.015
+
+    provider = FakeLLMProvider(timeout_rate=1.0, timeout_ms=50)
+    started = time.perf_counter()
+    with pytest.raises(ProviderError, match='timeout'):
+        provider.complete('prompt', 10)
+    assert time.perf_counter() - started >= 0.05
+
+
+def test_retries_recover_from_injected_faults(tmp_path):
+    provider = FakeTranscriptionProvider(error_rate=0.3, timeout_rate=0.2, timeout_ms=1, seed=3)
+    commits = []
+    scheduler = TranscriptionScheduler(
+        lambda path, index, meeting_id, info: provider.transcribe(path, {}),
+        lambda meeting_id, index, path, segments, recording_id: commits.append(segments),
+        workers=2, max_retries=20, backoff_base=0.001
+    )
+    for index in range(10):
+        scheduler.submit(write_chunk(str(tmp_path / f'chunk_{index}'), 1, seed=index), index, 'm1')
+    assert scheduler.wait_idle(timeout=10)
+
+    status = scheduler.get_status()
+    assert (status['completed'], status['failed']) == (10, 0)
+    assert status['retries'] > 0
+    assert all(commits)
+
+    llm = FakeLLMProvider(error_rate=0.5, seed=3)
+    analyzer = MeetingAnalyzer(llm.complete, window_chars=10, max_retries=20, backoff_base=0)
+    assert analyzer.analyze(transcript([('A', 'We will meet again')] * 5))['actionItems']
+
+
+def test_loadtest_completes_without_failures():
+    loadtest = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'loadtest.py')
+    result = subprocess.run(
+        [sys.executable, loadtest, '--meetings', '3', '--chunks', '4', '--chunk-seconds', '2',
+         '--interval', '0.01', '--transcribe-latency-ms', '10', '--llm-latency-ms', '5', '--jitter-ms', '2',
+         '--window-chars', '50', '--error-rate', '0.1', '--backoff', '0.01'],
+        capture_output=True, text=True, timeout=120
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert 'FAILED' not in result.stdout
+    assert '12 completed' in result.stdout and ' 0 failed' in result.stdout
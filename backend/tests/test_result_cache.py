@@ -0,0 +1,59 @@
+import pytest
+
+import result_cache
+from result_cache import ResultCache, content_key
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(result_cache.time, 'time', lambda: now[0])
+    return now
+
+
+def last_used(cache, key):
+    return cache._connect().execute(
+        'SELECT last_used FROM cache_entries WHERE key = ?', (key,)).fetchone()[0]
+
+
+def test_roundtrip_and_stats(tmp_path):
+    cache = ResultCache(str(tmp_path / 'cache.db'))
+    key = content_key('analysis', 'model', 'prompt')
+    assert cache.get(key) is None
+    cache.put(key, {'a': [1, 2]}, namespace='analysis')
+    assert cache.get(key) == {'a': [1, 2]}
+    status = cache.get_status()
+    assert status['hits'] == 1 and status['misses'] == 1
+    assert status['namespaces']['analysis']['entries'] == 1
+
+
+def test_hits_touch_only_after_interval(tmp_path, clock):
+    cache = ResultCache(str(tmp_path / 'cache.db'), touch_seconds=60)
+    cache.put('k', 1)
+
+    clock[0] += 30
+    changes = cache._connect().total_changes
+    assert cache.get('k') == 1
+    assert cache._connect().total_changes == changes
+    assert last_used(cache, 'k') == 1000.0
+
+    clock[0] += 31
+    assert cache.get('k') == 1
+    assert last_used(cache, 'k') == 1061.0
+
+
+def test_evicts_least_recently_used(tmp_path, clock):
+    cache = ResultCache(str(tmp_path / 'cache.db'), max_entries=2, touch_seconds=60)
+    cache.put('old', 1)
+    clock[0] += 10
+    cache.put('newer', 2)
+
+    # A touch moves 'old' ahead of 'newer'
+    clock[0] += 100
+    cache.get('old')
+    clock[0] += 1
+    cache.put('newest', 3)
+
+    assert cache.get('newer') is None
+    assert cache.get('old') == 1 and cache.get('newest') == 3
+    assert cache.get_status()['evictions'] == 1
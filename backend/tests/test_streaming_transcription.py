@@ -0,0 +1,62 @@
+import time
+
+import numpy as np
+
+from streaming_transcription import StubStreamingTranscriber
+
+RATE = 16000
+
+
+def tone(seconds: float, level: float = 0.1) -> np.ndarray:
+    t = np.arange(int(seconds * RATE)) / RATE
+    return (np.sin(2 * np.pi * 220 * t) * level).astype(np.float32).reshape(-1, 1)
+
+
+def silence(seconds: float) -> np.ndarray:
+    return np.zeros((int(seconds * RATE), 1), dtype=np.float32)
+
+
+def run_stub(*blocks, on_final=None) -> StubStreamingTranscriber:
+    finals = []
+    stream = StubStreamingTranscriber(silence_seconds=0.5)
+    stream.start(RATE, 1, lambda result: None, on_final or finals.append)
+    for block in blocks:
+        stream.feed(block)
+    stream.finals = finals
+    return stream
+
+
+def test_finalized_stops_at_open_utterance():
+    stream = run_stub(silence(1.0), tone(1.0))
+    # Wait for the feed thread without closing the stream
+    deadline = time.monotonic() + 5
+    while stream._fed_seconds < 2.0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert stream.finals == []
+    assert 0.9 <= stream.finalized_seconds <= 1.0
+
+    stream.stop()
+    assert len(stream.finals) == 1
+    assert stream.finalized_seconds >= 2.0 - 1e-6
+
+
+def test_final_settles_after_callback_returns():
+    seen = []
+
+    def on_final(result):
+        seen.append(stream.finalized_seconds)
+
+    stream = run_stub(tone(1.0), silence(1.0), on_final=on_final)
+    stream.stop()
+    assert seen and seen[0] < 1.0
+    assert stream.finalized_seconds >= 2.0 - 1e-6
+
+
+def test_failed_final_is_not_settled():
+    def on_final(result):
+        raise RuntimeError('store unavailable')
+
+    stream = run_stub(tone(1.0), silence(1.0), on_final=on_final)
+    stream.stop()
+    assert not stream.healthy
+    assert stream.finalized_seconds < 1.0
@@ -0,0 +1,196 @@
+import threading
+import time
+
+from transcription_scheduler import TranscriptionScheduler
+
+
+def make_scheduler(transcribe, commits, **options):
+    def commit(meeting_id, chunk_index, chunk_path, segments, recording_id):
+        commits.append((meeting_id, chunk_index, segments))
+
+    options.setdefault('backoff_base', 0.01)
+    return TranscriptionScheduler(transcribe, commit, **options)
+
+
+def test_commits_in_chunk_order():
+    delays = {0: 0.15, 1: 0.0, 2: 0.05, 3: 0.0}
+
+    def transcribe(path, index, meeting_id, info):
+        time.sleep(delays[index])
+        return [{'text': str(index)}]
+
+    commits = []
+    scheduler = make_scheduler(transcribe, commits, workers=4)
+    for index in range(4):
+        scheduler.submit(f'c{index}', index, 'm1')
+    assert scheduler.wait_idle(timeout=5)
+    assert [c[1] for c in commits] == [0, 1, 2, 3]
+
+
+def test_retries_then_gives_up():
+    attempts = {}
+
+    def transcribe(path, index, meeting_id, info):
+        attempts[index] = attempts.get(index, 0) + 1
+        if index == 0 and attempts[index] < 3:
+            raise RuntimeError('transient')
+        if index == 1:
+            raise RuntimeError('permanent')
+        return [{'text': 'ok'}]
+
+    commits = []
+    scheduler = make_scheduler(transcribe, commits, workers=1, max_retries=2)
+    scheduler.submit('c0', 0, 'm1')
+    scheduler.submit('c1', 1, 'm1')
+    assert scheduler.wait_idle(timeout=5)
+
+    assert commits == [('m1', 0, [{'text': 'ok'}]), ('m1', 1, None)]
+    assert attempts == {0: 3, 1: 3}
+    status = scheduler.get_status()
+    assert (status['completed'], status['failed'], status['retries']) == (1, 1, 4)
+
+
+def test_skip_keeps_order():
+    commits = []
+    scheduler = make_scheduler(lambda *args: [{'text': 'x'}], commits, workers=1)
+    scheduler.skip(0, 'm1')
+    scheduler.submit('c1', 1, 'm1')
+    assert scheduler.wait_idle(timeout=5)
+    assert commits == [('m1', 0, None), ('m1', 1, [{'text': 'x'}])]
+
+
+def test_non_blocking_submit_parks_chunks_in_backlog():
+    release = threading.Event()
+
+    def transcribe(path, index, meeting_id, info):
+        release.wait(5)
+        return []
+
+    commits = []
+    scheduler = make_scheduler(transcribe, commits, workers=1, max_queue=1)
+    started = time.perf_counter()
+    for index in range(6):
+        scheduler.submit(f'c{index}', index, 'm1', block=False)
+    assert time.perf_counter() - started < 0.5
+    assert scheduler.get_status()['backlog'] >= 4
+    assert not scheduler.wait_idle(timeout=0.1)
+
+    release.set()
+    assert scheduler.wait_idle(timeout=5)
+    assert [c[1] for c in commits] == list(range(6))
+    assert scheduler.get_status()['backlog'] == 0
+
+
+
+def test_full_backlog_rejects_chunk_as_failed():
+    release = threading.Event()
+
+    def transcribe(path, index, meeting_id, info):
+        release.wait(5)
+        return [{'text': str(index)}]
+
+    commits = []
+    scheduler = make_scheduler(transcribe, commits, workers=1, max_queue=1, max_backlog=2)
+    assert scheduler.submit('c0', 0, 'm1', block=False)
+    deadline = time.time() + 2
+    while scheduler.get_status()['in_flight'] == 0 and time.time() < deadline:
+        time.sleep(0.01)
+
+    # c1 takes the queue slot, c2 and c3 the backlog
+    assert all(scheduler.submit(f'c{index}', index, 'm1', block=False) for index in (1, 2, 3))
+    assert not scheduler.submit('c4', 4, 'm1', block=False)
+    assert scheduler.get_status()['rejected'] == 1
+
+    release.set()
+    assert scheduler.wait_recording('m1', timeout=5)
+    assert [(c[1], c[2] is None) for c in commits] == [(i, i == 4) for i in range(5)]
+    assert scheduler.get_status()['backlog'] == 0
+
+def test_recordings_commit_independently():
+    block_commit = threading.Event()
+    committed = []
+
+    def commit(meeting_id, chunk_index, chunk_path, segments, recording_id):
+        if meeting_id == 'slow':
+            block_commit.wait(5)
+        committed.append(meeting_id)
+
+    scheduler = TranscriptionScheduler(lambda *args: [], commit, workers=2)
+    scheduler.submit('a', 0, 'slow')
+    time.sleep(0.1)
+    scheduler.submit('b', 0, 'fast')
+
+    deadline = time.time() + 2
+    while 'fast' not in committed and time.time() < deadline:
+        time.sleep(0.01)
+    assert committed == ['fast']
+    block_commit.set()
+    assert scheduler.wait_idle(timeout=5)
+    assert committed == ['fast', 'slow']
+
+
+def test_recordings_are_ordered_separately_and_pruned_when_ended():
+    commits = []
+    scheduler = make_scheduler(lambda *args: [], commits, workers=2)
+    scheduler.begin_meeting('m1', 'r1')
+    scheduler.begin_meeting('m1', 'r2')
+    for index in range(2):
+        scheduler.submit(f'r1_{index}', index, 'm1', {'recording_id': 'r1'})
+        scheduler.submit(f'r2_{index}', index, 'm1', {'recording_id': 'r2'})
+    assert scheduler.wait_idle(timeout=5)
+    assert len(commits) == 4
+
+    scheduler.end_meeting('m1', 'r1', 2)
+    assert ('m1', 'r1') not in scheduler._next_index
+    assert ('m1', 'r2') in scheduler._next_index
+
+
+def test_end_before_last_commit_prunes_afterwards():
+    release = threading.Event()
+
+    def transcribe(path, index, meeting_id, info):
+        release.wait(5)
+        return []
+
+    commits = []
+    scheduler = make_scheduler(transcribe, commits, workers=1)
+    scheduler.submit('c0', 0, 'm1', {'recording_id': 'r1'})
+    scheduler.end_meeting('m1', 'r1', 1)
+    assert ('m1', 'r1') in scheduler._next_index
+
+    release.set()
+    assert scheduler.wait_idle(timeout=5)
+    assert ('m1', 'r1') not in scheduler._next_index
+    assert scheduler.get_status()['awaiting_commit'] == 0
+
+
+def test_wait_recording_ignores_other_meetings():
+    release = threading.Event()
+
+    def transcribe(path, index, meeting_id, info):
+        if meeting_id == 'slow':
+            release.wait(5)
+        return [{'text': meeting_id}]
+
+    commits = []
+    scheduler = make_scheduler(transcribe, commits, workers=2)
+    scheduler.submit('s0', 0, 'slow', {'recording_id': 'r1'})
+    scheduler.submit('f0', 0, 'fast', {'recording_id': 'r2'})
+    scheduler.submit('f1', 1, 'fast', {'recording_id': 'r2'})
+
+    assert scheduler.wait_recording('fast', 'r2', timeout=5)
+    assert [c[1] for c in commits if c[0] == 'fast'] == [0, 1]
+    assert not scheduler.wait_recording('slow', 'r1', timeout=0.05)
+
+    release.set()
+    assert scheduler.wait_recording('slow', 'r1', timeout=5)
+
+
+def test_wait_recording_counts_skipped_chunks():
+    commits = []
+    scheduler = make_scheduler(lambda *args: [], commits)
+    scheduler.skip(1, 'm1', 'r1')
+    assert not scheduler.wait_recording('m1', 'r1', timeout=0.05)
+    scheduler.skip(0, 'm1', 'r1')
+    assert scheduler.wait_recording('m1', 'r1', timeout=1)
+    assert [c[1] for c in commits] == [0, 1]
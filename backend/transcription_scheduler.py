@@ -0,0 +1,361 @@
+"""
+Transcription Scheduler
+Bounded worker pool for chunk transcription with retry and ordered commit
+"""
+
+import threading
+import queue
+import random
+import time
+from collections import deque
+from typing import Optional, Callable, List, Dict
+
+from metrics import get_metrics, get_chunk_tracer
+
+
+metrics = get_metrics()
+chunk_tracer = get_chunk_tracer()
+
+QUEUE_WAIT_SECONDS = metrics.histogram(
+    'fomo_transcription_queue_wait_seconds', 'Time chunks wait in the queue for a worker')
+TRANSCRIBE_SECONDS = metrics.histogram(
+    'fomo_transcription_seconds', 'Time to transcribe a chunk, including retries, by outcome')
+COMMIT_LATENCY_SECONDS = metrics.histogram(
+    'fomo_transcription_commit_latency_seconds', 'Time from submit to commit of a chunk (includes reordering)')
+RETRIES_TOTAL = metrics.counter(
+    'fomo_transcription_retries_total', 'Transcription attempts that failed and were retried')
+REJECTED_TOTAL = metrics.counter(
+    'fomo_transcription_rejected_total', 'Chunks not transcribed because the backlog was full')
+
+
+class TranscriptionScheduler:
+    """
+    Runs chunk transcription on a fixed number of worker threads
+    - Bounded queue: submit() blocks when the queue is full (backpressure);
+      submit(block=False) parks the chunk in a backlog instead, which workers
+      move into the queue as slots free up. The backlog is bounded too; a
+      chunk that does not fit is rejected and committed as failed
+    - Failed transcriptions are retried with exponential backoff
+    - A per-recording reorder buffer commits results in chunk_index order
+      (the recording is chunk_info['recording_id']; None for plain submits).
+      Commits run outside the scheduler lock, so recordings commit in parallel
+    """
+
+    def __init__(self,
+                 transcribe: Callable[[str, int, str, Optional[dict]], Optional[List[dict]]],
+                 commit: Callable[[str, int, str, Optional[List[dict]], Optional[str]], None],
+                 workers: int = 2,
+                 max_queue: int = 8,
+                 max_backlog: int = 64,
+                 max_retries: int = 3,
+                 backoff_base: float = 2.0,
+                 backoff_max: float = 60.0):
+        """
+        Initialize transcription scheduler
+
+        Args:
+            transcribe: Function (chunk_path, chunk_index, meeting_id, chunk_info) -> segments.
+                Returns None if the chunk was skipped; raises to trigger a retry
+            commit: Function (meeting_id, chunk_index, chunk_path, segments, recording_id)
+                called in chunk_index order per recording. segments is None for
+                skipped or permanently failed chunks
+            workers: Number of transcription worker threads
+            max_queue: Maximum number of chunks waiting for a worker
+            max_backlog: Maximum number of chunks parked by non-blocking submits
+            max_retries: Retries per chunk before giving up
+            backoff_base: Initial retry delay in seconds (doubled per attempt)
+            backoff_max: Maximum retry delay in seconds
+        """
+        self.transcribe = transcribe
+        self.commit = commit
+        self.workers = workers
+        self.max_queue = max_queue
+        self.max_backlog = max_backlog
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._backlog = deque()
+        self._lock = threading.Lock()
+        self._settled = threading.Condition(self._lock)
+        self._in_flight = 0
+        self._outstanding: Dict[tuple, int] = {}
+        self._next_index: Dict[tuple, int] = {}
+        self._pending: Dict[tuple, Dict[int, tuple]] = {}
+        self._ready: Dict[tuple, deque] = {}
+        self._committing = set()
+        self._end_index: Dict[tuple, int] = {}
+        self._stats = {'completed': 0, 'failed': 0, 'retries': 0, 'skipped': 0, 'rejected': 0}
+
+        self._threads = []
+        for i in range(workers):
+            thread = threading.Thread(
+                target=self._worker_loop, name=f'transcription-worker-{i}', daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def begin_meeting(self, meeting_id: str, recording_id: Optional[str] = None, first_index: int = 0):
+        """
+        Reset ordering state for a recording of a meeting
+        (chunk indices restart at 0 for each recording)
+
+        Args:
+            meeting_id: Meeting identifier
+            recording_id: Recording the chunks will carry in chunk_info
+            first_index: Index of the first chunk that will be submitted
+                (when resuming a recording whose earlier chunks are committed)
+        """
+        key = (meeting_id, recording_id)
+        with self._lock:
+            self._next_index[key] = first_index
+            self._pending[key] = {}
+            self._end_index.pop(key, None)
+
+    def end_meeting(self, meeting_id: str, recording_id: Optional[str], chunk_count: int):
+        """
+        Declare how many chunks a finished recording produced
+        Its ordering state is dropped once chunk chunk_count - 1 is committed
+
+        Args:
+            meeting_id: Meeting identifier
+            recording_id: Recording that ended
+            chunk_count: Number of chunk indices the recording used
+        """
+        key = (meeting_id, recording_id)
+        with self._lock:
+            self._end_index[key] = chunk_count
+            self._prune(key)
+
+    def submit(self, chunk_path: str, chunk_index: int, meeting_id: str,
+               chunk_info: Optional[dict] = None, timeout: Optional[float] = None,
+               block: bool = True) -> bool:
+        """
+        Queue a chunk for transcription
+        Blocks while the queue is full, unless block is False
+
+        Args:
+            chunk_path: Path to the audio chunk
+            chunk_index: Index of the chunk within the recording
+            meeting_id: Meeting the chunk belongs to
+            chunk_info: Capture metadata passed through to transcribe (e.g. time map)
+            timeout: Maximum seconds to wait for queue space (None = wait forever)
+            block: False never waits: with the queue full the chunk goes to the
+                backlog (for callers that must not stall, e.g. the recorder thread).
+                With the backlog full too, the chunk is committed as failed
+
+        Returns:
+            bool: False if the chunk was rejected
+
+        Raises:
+            queue.Full: If timeout expires before space is available
+        """
+        key = (meeting_id, (chunk_info or {}).get('recording_id'))
+        entry = (chunk_path, chunk_index, meeting_id, chunk_info, time.perf_counter())
+        chunk_tracer.event(meeting_id, chunk_index, 'queued', queue_depth=self._queue.qsize())
+        with self._lock:
+            self._next_index.setdefault(key, 0)
+            self._pending.setdefault(key, {})
+            self._outstanding[key] = self._outstanding.get(key, 0) + 1
+            queued = rejected = False
+            if not block and not self._backlog:
+                try:
+                    self._queue.put_nowait(entry)
+                    queued = True
+                except queue.Full:
+                    pass
+            if not block and not queued:
+                # Behind earlier backlog entries, so chunks keep their order
+                if len(self._backlog) < self.max_backlog:
+                    self._backlog.append(entry)
+                else:
+                    rejected = True
+                    self._stats['rejected'] += 1
+        if block:
+            self._queue.put(entry, timeout=timeout)
+        elif rejected:
+            print(f"[Scheduler] Backlog full, chunk {chunk_index} of {meeting_id} not transcribed")
+            REJECTED_TOTAL.inc()
+            chunk_tracer.event(meeting_id, chunk_index, 'transcribed', outcome='rejected')
+            self._complete(meeting_id, key[1], chunk_index, chunk_path, None, entry[-1])
+            return False
+        return True
+
+    def _drain_backlog(self):
+        """Move backlog entries into free queue slots (lock held)"""
+        while self._backlog:
+            try:
+                self._queue.put_nowait(self._backlog[0])
+            except queue.Full:
+                return
+            self._backlog.popleft()
+
+    def skip(self, chunk_index: int, meeting_id: str, recording_id: Optional[str] = None):
+        """
+        Mark a chunk as handled without transcribing it
+        (e.g. already covered by live transcription), keeping commit order intact
+        """
+        with self._lock:
+            self._stats['skipped'] += 1
+            key = (meeting_id, recording_id)
+            self._outstanding[key] = self._outstanding.get(key, 0) + 1
+        self._complete(meeting_id, recording_id, chunk_index, None, None, None)
+
+    def _worker_loop(self):
+        """Take chunks from the queue and transcribe them"""
+        while True:
+            chunk_path, chunk_index, meeting_id, chunk_info, submitted_at = self._queue.get()
+            with self._lock:
+                self._in_flight += 1
+                self._drain_backlog()
+            try:
+                waited = time.perf_counter() - submitted_at
+                QUEUE_WAIT_SECONDS.observe(waited)
+                chunk_tracer.event(meeting_id, chunk_index, 'transcribing', queue_wait_seconds=waited)
+
+                segments = self._transcribe_with_retry(chunk_path, chunk_index, meeting_id, chunk_info)
+                self._complete(meeting_id, (chunk_info or {}).get('recording_id'),
+                               chunk_index, chunk_path, segments, submitted_at)
+            finally:
+                with self._lock:
+                    self._in_flight -= 1
+                self._queue.task_done()
+
+    def _transcribe_with_retry(self, chunk_path: str, chunk_index: int, meeting_id: str,
+                               chunk_info: Optional[dict]) -> Optional[List[dict]]:
+        """Transcribe a chunk, retrying with exponential backoff on failure"""
+        started = time.perf_counter()
+        for attempt in range(self.max_retries + 1):
+            try:
+                segments = self.transcribe(chunk_path, chunk_index, meeting_id, chunk_info)
+                outcome = 'completed' if segments is not None else 'skipped'
+                with self._lock:
+                    self._stats[outcome] += 1
+                TRANSCRIBE_SECONDS.observe(time.perf_counter() - started, outcome=outcome)
+                chunk_tracer.event(meeting_id, chunk_index, 'transcribed',
+                                   outcome=outcome, attempts=attempt + 1)
+                return segments
+            except Exception as e:
+                if attempt == self.max_retries:
+                    print(f"[Scheduler] Chunk {chunk_index} of {meeting_id} failed after "
+                          f"{attempt + 1} attempts: {e}")
+                    with self._lock:
+                        self._stats['failed'] += 1
+                    TRANSCRIBE_SECONDS.observe(time.perf_counter() - started, outcome='failed')
+                    chunk_tracer.event(meeting_id, chunk_index, 'transcribed',
+                                       outcome='failed', attempts=attempt + 1, error=str(e))
+                    return None
+
+                delay = min(self.backoff_base * (2 ** attempt), self.backoff_max)
+                delay *= random.uniform(0.8, 1.2)
+                print(f"[Scheduler] Chunk {chunk_index} of {meeting_id} failed ({e}), "
+                      f"retrying in {delay:.1f}s")
+                with self._lock:
+                    self._stats['retries'] += 1
+                RETRIES_TOTAL.inc()
+                time.sleep(delay)
+
+    def _complete(self, meeting_id: str, recording_id: Optional[str], chunk_index: int, chunk_path: str,
+                  segments: Optional[List[dict]], submitted_at: Optional[float]):
+        """Buffer a finished chunk and commit every chunk that is now in order"""
+        key = (meeting_id, recording_id)
+        with self._lock:
+            pending = self._pending.setdefault(key, {})
+            pending[chunk_index] = (chunk_path, segments, submitted_at)
+
+            ready = self._ready.setdefault(key, deque())
+            next_index = self._next_index.get(key, 0)
+            while next_index in pending:
+                ready.append((next_index,) + pending.pop(next_index))
+                next_index += 1
+            self._next_index[key] = next_index
+
+            # One thread at a time commits a recording's chunks, so a later
+            # chunk finishing on another worker cannot be committed ahead
+            if key in self._committing or not ready:
+                return
+            self._committing.add(key)
+
+        while True:
+            with self._lock:
+                if not ready:
+                    self._committing.discard(key)
+                    self._prune(key)
+                    return
+                index, path, result, submitted = ready.popleft()
+
+            try:
+                self.commit(meeting_id, index, path, result, recording_id)
+            except Exception as e:
+                print(f"[Scheduler] Error committing chunk {index} of {meeting_id}: {e}")
+            if submitted is not None:
+                COMMIT_LATENCY_SECONDS.observe(time.perf_counter() - submitted)
+            chunk_tracer.finish(meeting_id, index, 'committed',
+                                segments=len(result) if result is not None else None)
+
+            with self._lock:
+                outstanding = self._outstanding.get(key, 0) - 1
+                if outstanding > 0:
+                    self._outstanding[key] = outstanding
+                else:
+                    self._outstanding.pop(key, None)
+                    self._settled.notify_all()
+
+    def _prune(self, key: tuple):
+        """Drop the ordering state of an ended recording once it is fully committed (lock held)"""
+        end_index = self._end_index.get(key)
+        if end_index is None or key in self._committing or self._next_index.get(key, 0) < end_index:
+            return
+        for state in (self._next_index, self._pending, self._ready, self._end_index):
+            state.pop(key, None)
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until all queued chunks have been processed
+
+        Returns:
+            bool: True if idle, False if the timeout expired
+        """
+        deadline = None if timeout is None else time.time() + timeout
+        while True:
+            with self._lock:
+                idle = self._queue.unfinished_tasks == 0 and not self._backlog
+            if idle:
+                return True
+            if deadline is not None and time.time() >= deadline:
+                return False
+            time.sleep(0.05)
+
+    def wait_recording(self, meeting_id: str, recording_id: Optional[str] = None,
+                       timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every chunk submitted (or skipped) for one recording is committed
+        Other meetings' work is not waited for
+
+        Returns:
+            bool: True if the recording has nothing outstanding, False if the timeout expired
+        """
+        key = (meeting_id, recording_id)
+        with self._settled:
+            return self._settled.wait_for(lambda: key not in self._outstanding, timeout=timeout)
+
+    def get_status(self) -> dict:
+        """
+        Get scheduler status
+
+        Returns:
+            dict: Queue depth, in-flight count and counters
+        """
+        with self._lock:
+            return {
+                'workers': self.workers,
+                'queue_depth': self._queue.qsize(),
+                'queue_capacity': self.max_queue,
+                'backlog': len(self._backlog),
+                'backlog_capacity': self.max_backlog,
+                'in_flight': self._in_flight,
+                'awaiting_commit': sum(len(p) for p in self._pending.values())
+                + sum(len(r) for r in self._ready.values()),
+                **self._stats
+            }
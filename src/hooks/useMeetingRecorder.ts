@@ -32,11 +32,11 @@ export const useMeetingRecorder = () => {
     return () => clearInterval(interval);
   }, [recordingState.isRecording, recordingState.isPaused, updateDuration]);
 
-  // Poll for transcript updates from Python backend
+  // Receive pushed transcript updates from Python backend
   const startTranscriptPolling = useCallback((meetingId: string) => {
-    console.log('[MeetingRecorder] Starting transcript polling...');
+    console.log('[MeetingRecorder] Starting transcript stream...');
     
-    const stopPolling = PythonAudioAPI.startPolling(
+    const stopPolling = PythonAudioAPI.startTranscriptStream(
       meetingId,
       (meetingData) => {
         if (meetingData.transcript && meetingData.transcript.length > lastTranscriptLengthRef.current) {
@@ -63,8 +63,7 @@ export const useMeetingRecorder = () => {
         if (meetingData.chunksProcessed !== undefined) {
           setChunksProcessed(meetingData.chunksProcessed);
         }
-      },
-      3000 // Poll every 3 seconds
+      }
     );
     
     pollingStopRef.current = stopPolling;
@@ -127,7 +126,7 @@ export const useMeetingRecorder = () => {
       }
 
       // Stop Python audio capture
-      const result = await PythonAudioAPI.stopCapture();
+      const result = await PythonAudioAPI.stopCapture(currentMeeting.id);
 
       if (!result.success) {
         console.error('[MeetingRecorder] Error stopping capture:', result.error);
@@ -142,9 +141,12 @@ export const useMeetingRecorder = () => {
       // Wait a bit for final transcription to complete
       await new Promise(resolve => setTimeout(resolve, 2000));
 
+      // Resolves once the background analysis job has finished
       const summaryResponse = await api.generateMeetingSummary(currentMeeting.id);
 
-      if (summaryResponse.success && summaryResponse.data) {
+      if (!summaryResponse.success) {
+        console.error('[MeetingRecorder] Meeting analysis failed:', summaryResponse.error?.message);
+      } else if (summaryResponse.data) {
         console.log('[MeetingRecorder] Meeting summary generated successfully');
         
         // Add action items if available
@@ -188,7 +190,7 @@ export const useMeetingRecorder = () => {
       console.log('[MeetingRecorder] Pausing recording...');
 
       // Pause Python audio capture
-      const result = await PythonAudioAPI.pauseCapture();
+      const result = await PythonAudioAPI.pauseCapture(currentMeeting.id);
 
       if (!result.success) {
         throw new Error(result.error || 'Failed to pause recording');
@@ -212,7 +214,7 @@ export const useMeetingRecorder = () => {
       console.log('[MeetingRecorder] Resuming recording...');
 
       // Resume Python audio capture
-      const result = await PythonAudioAPI.resumeCapture();
+      const result = await PythonAudioAPI.resumeCapture(currentMeeting.id);
 
       if (!result.success) {
         throw new Error(result.error || 'Failed to resume recording');
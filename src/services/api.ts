@@ -2,6 +2,8 @@ import axios, { AxiosInstance, AxiosError } from 'axios';
 import type {
   APIResponse,
   Meeting,
+  MeetingListItem,
+  PagedAPIResponse,
   TranscriptSegment,
   ActionItem,
   MeetingSummary,
@@ -118,10 +120,27 @@ class APIService {
   }
 
   // Generate comprehensive meeting summary with action items (called at meeting end)
-  async generateMeetingSummary(meetingId: string): Promise<APIResponse<any>> {
-    return this.client.post(`/api/meetings/${meetingId}/analyze`, {
-      timeout: 60000 // 1 minute timeout for AI analysis
-    });
+  // The analysis runs as a background job; resolves with the analyzed meeting
+  async generateMeetingSummary(meetingId: string, timeoutMs = 300000): Promise<APIResponse<any>> {
+    const accepted: any = await this.client.post(`/api/meetings/${meetingId}/analyze`);
+    return this.waitForJob(accepted.data.id, timeoutMs);
+  }
+
+  // ============ Background Jobs ============
+  // Poll /api/jobs/<id> until the job succeeds (data is its result) or fails
+  async waitForJob<T = any>(jobId: string, timeoutMs = 300000, intervalMs = 1000): Promise<APIResponse<T>> {
+    const deadline = Date.now() + timeoutMs;
+    while (Date.now() < deadline) {
+      await new Promise((resolve) => setTimeout(resolve, intervalMs));
+      const job = ((await this.client.get(`/api/jobs/${jobId}`)) as any).data;
+      if (job.status === 'succeeded') {
+        return { success: true, data: job.result };
+      }
+      if (job.status === 'failed') {
+        return { success: false, error: { message: job.error, code: 'job_failed' } };
+      }
+    }
+    return { success: false, error: { message: 'Timed out waiting for the job', code: 'job_timeout' } };
   }
 
   // ============ Meeting Management ============
@@ -133,8 +152,8 @@ class APIService {
     return this.client.get(`/api/meetings/${meetingId}`);
   }
 
-  async getAllMeetings(limit = 50, offset = 0): Promise<APIResponse<Meeting[]>> {
-    return this.client.get('/api/meetings', { params: { limit, offset } });
+  async getAllMeetings(limit = 50, after?: string | null): Promise<PagedAPIResponse<MeetingListItem>> {
+    return this.client.get('/api/meetings', { params: { limit, after: after ?? undefined } });
   }
 
   async deleteMeeting(meetingId: string): Promise<APIResponse<void>> {
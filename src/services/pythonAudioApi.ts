@@ -5,6 +5,18 @@
 
 const API_BASE_URL = 'http://localhost:5000';
 
+export interface TranscriptionQueueStatus {
+  workers: number;
+  queue_depth: number;
+  queue_capacity: number;
+  in_flight: number;
+  awaiting_commit: number;
+  completed: number;
+  failed: number;
+  retries: number;
+  skipped: number;
+}
+
 export interface AudioStatus {
   is_recording: boolean;
   is_paused: boolean;
@@ -12,6 +24,9 @@ export interface AudioStatus {
   current_chunk: number;
   chunk_duration: number;
   selected_device_id: number | null;
+  transcription?: TranscriptionQueueStatus;
+  sessions?: AudioStatus[]; // All capture sessions (status without meetingId)
+  max_sessions?: number;
 }
 
 export interface AudioDevice {
@@ -30,13 +45,20 @@ export interface AudioTestResult {
   error?: string;
 }
 
+export interface MicrophoneOptions {
+  micDeviceId?: number; // Input device ID from listDevices() (default microphone if omitted)
+  sourceMix?: 'mix' | 'separate'; // Separate keeps system audio and microphone on two channels
+}
+
 export class PythonAudioAPI {
   /**
    * Start audio capture on Python backend
+   * Pass microphone options to record the microphone alongside system audio
    */
   static async startCapture(
     meetingId: string,
-    deviceId?: number
+    deviceId?: number,
+    microphone?: MicrophoneOptions
   ): Promise<{ success: boolean; message?: string; error?: string; device_id?: number }> {
     try {
       const response = await fetch(`${API_BASE_URL}/api/audio/start`, {
@@ -46,7 +68,8 @@ export class PythonAudioAPI {
         },
         body: JSON.stringify({
           meetingId,
-          deviceId: deviceId !== undefined ? deviceId : null
+          deviceId: deviceId !== undefined ? deviceId : null,
+          ...(microphone ? { microphone: true, ...microphone } : {})
         }),
       });
 
@@ -63,14 +86,16 @@ export class PythonAudioAPI {
 
   /**
    * Pause audio capture on Python backend
+   * meetingId selects the session (optional while only one meeting is recording)
    */
-  static async pauseCapture(): Promise<{ success: boolean; status?: string; error?: string }> {
+  static async pauseCapture(meetingId?: string): Promise<{ success: boolean; status?: string; error?: string }> {
     try {
       const response = await fetch(`${API_BASE_URL}/api/audio/pause`, {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
         },
+        body: JSON.stringify({ meetingId }),
       });
 
       const data = await response.json();
@@ -87,13 +112,14 @@ export class PythonAudioAPI {
   /**
    * Resume audio capture on Python backend
    */
-  static async resumeCapture(): Promise<{ success: boolean; status?: string; error?: string }> {
+  static async resumeCapture(meetingId?: string): Promise<{ success: boolean; status?: string; error?: string }> {
     try {
       const response = await fetch(`${API_BASE_URL}/api/audio/resume`, {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
         },
+        body: JSON.stringify({ meetingId }),
       });
 
       const data = await response.json();
@@ -110,13 +136,14 @@ export class PythonAudioAPI {
   /**
    * Stop audio capture on Python backend
    */
-  static async stopCapture(): Promise<{ success: boolean; meeting_id?: string; total_chunks?: number; error?: string }> {
+  static async stopCapture(meetingId?: string): Promise<{ success: boolean; meeting_id?: string; total_chunks?: number; error?: string }> {
     try {
       const response = await fetch(`${API_BASE_URL}/api/audio/stop`, {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
         },
+        body: JSON.stringify({ meetingId }),
       });
 
       const data = await response.json();
@@ -133,9 +160,10 @@ export class PythonAudioAPI {
   /**
    * Get current audio capture status
    */
-  static async getStatus(): Promise<{ success: boolean; data?: AudioStatus; error?: string }> {
+  static async getStatus(meetingId?: string): Promise<{ success: boolean; data?: AudioStatus; error?: string }> {
     try {
-      const response = await fetch(`${API_BASE_URL}/api/audio/status`, {
+      const query = meetingId ? `?meetingId=${encodeURIComponent(meetingId)}` : '';
+      const response = await fetch(`${API_BASE_URL}/api/audio/status${query}`, {
         method: 'GET',
       });
 
@@ -184,7 +212,22 @@ export class PythonAudioAPI {
       });
 
       const data = await response.json();
-      return data;
+      if (response.status !== 202) {
+        return data;
+      }
+
+      // The test runs as a background job; poll it until it finishes
+      const jobUrl = `${API_BASE_URL}${response.headers.get('Location')}`;
+      while (true) {
+        await new Promise((resolve) => setTimeout(resolve, 500));
+        const job = (await (await fetch(jobUrl)).json()).data;
+        if (job.status === 'succeeded') {
+          return job.result;
+        }
+        if (job.status === 'failed') {
+          return { success: false, error: job.error };
+        }
+      }
     } catch (error) {
       console.error('[PythonAudioAPI] Error testing capture:', error);
       return {
@@ -214,8 +257,70 @@ export class PythonAudioAPI {
     }
   }
 
+  /**
+   * Subscribe to pushed meeting updates (Server-Sent Events)
+   * The backend sends a full snapshot first, then only new segments and
+   * changed fields. onUpdate receives the merged meeting each time.
+   * Falls back to polling when EventSource is unavailable.
+   * Returns a function to stop the stream
+   */
+  static startTranscriptStream(
+    meetingId: string,
+    onUpdate: (meeting: any) => void
+  ): () => void {
+    if (typeof EventSource === 'undefined') {
+      return this.startPolling(meetingId, onUpdate);
+    }
+
+    let meeting: any = null;
+    // EventSource reconnects on its own and resumes via Last-Event-ID
+    const source = new EventSource(`${API_BASE_URL}/api/meetings/${meetingId}/events`);
+
+    source.addEventListener('snapshot', (event) => {
+      meeting = JSON.parse((event as MessageEvent).data);
+      onUpdate(meeting);
+    });
+
+    source.addEventListener('segments', (event) => {
+      if (!meeting) return;
+      const data = JSON.parse((event as MessageEvent).data);
+      meeting = {
+        ...meeting,
+        transcript: [...(meeting.transcript || []), ...data.segments],
+        partialTranscript: data.chunkIndex === undefined ? null : meeting.partialTranscript,
+      };
+      if (data.chunkIndex !== undefined) {
+        meeting.chunksProcessed = Math.max(meeting.chunksProcessed || 0, data.chunkIndex + 1);
+      }
+      onUpdate(meeting);
+    });
+
+    // Interim text from live transcription; replaced by a segment once final
+    source.addEventListener('partial', (event) => {
+      if (!meeting) return;
+      meeting = { ...meeting, partialTranscript: JSON.parse((event as MessageEvent).data) };
+      onUpdate(meeting);
+    });
+
+    source.addEventListener('update', (event) => {
+      if (!meeting) return;
+      meeting = { ...meeting, ...JSON.parse((event as MessageEvent).data) };
+      onUpdate(meeting);
+    });
+
+    source.onerror = () => {
+      console.warn('[PythonAudioAPI] Transcript stream interrupted, reconnecting...');
+    };
+
+    return () => {
+      source.close();
+    };
+  }
+
   /**
    * Start polling for transcript updates
+   * Uses ETags (304 when nothing changed) and sinceSegment so each poll
+   * only transfers new segments; onUpdate receives the merged meeting.
    * Returns a function to stop polling
    */
   static startPolling(
@@ -224,13 +329,28 @@ export class PythonAudioAPI {
     interval: number = 5000
   ): () => void {
     let isPolling = true;
+    let meeting: any = null;
+    let etag: string | null = null;
 
     const poll = async () => {
       while (isPolling) {
         try {
-          const result = await this.pollTranscript(meetingId);
-          if (result.success && result.data) {
-            onUpdate(result.data);
+          const since = meeting ? (meeting.transcript || []).length : 0;
+          const response = await fetch(
+            `${API_BASE_URL}/api/meetings/${meetingId}?sinceSegment=${since}`,
+            { method: 'GET', headers: etag ? { 'If-None-Match': etag } : {} }
+          );
+
+          if (response.status !== 304) {
+            const result = await response.json();
+            if (result.success && result.data) {
+              etag = response.headers.get('ETag');
+              meeting = {
+                ...result.data,
+                transcript: [...(meeting?.transcript || []), ...(result.data.transcript || [])],
+              };
+              onUpdate(meeting);
+            }
           }
         } catch (error) {
           console.error('[PythonAudioAPI] Polling error:', error);
@@ -250,4 +370,3 @@ export class PythonAudioAPI {
     };
   }
 }
-
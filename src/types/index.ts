@@ -22,6 +22,14 @@ export interface Meeting {
   status: 'recording' | 'processing' | 'completed' | 'failed';
 }
 
+// Meeting list entry (GET /api/meetings); transcript and action items are not loaded
+export interface MeetingListItem
+  extends Pick<Meeting, 'id' | 'title' | 'startTime' | 'endTime' | 'status' | 'duration'> {
+  segmentCount: number;
+  actionItemCount: number;
+  actionItemCounts: Partial<Record<ActionItemStatus, number>>;
+}
+
 // ============ Action Item Types ============
 export type Priority = 'high' | 'medium' | 'low';
 export type ActionItemStatus = 'pending' | 'creating' | 'created' | 'failed';
@@ -150,6 +158,11 @@ export interface APIResponse<T> {
   };
 }
 
+// Page of a cursor-paginated list; pass nextCursor as `after` to get the next page
+export interface PagedAPIResponse<T> extends APIResponse<T[]> {
+  nextCursor?: string | null;
+}
+
 export interface WebSocketMessage {
   type: 'transcript' | 'action_item' | 'status' | 'error';
   data: any;